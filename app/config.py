@@ -6,15 +6,17 @@ Loads configuration from environment variables with sensible defaults.
 
 import os
 from dataclasses import dataclass, field
-from functools import lru_cache
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 # Version - read from environment (set in Dockerfile) or default
 SUBGEN_AZURE_BATCH_VERSION = os.getenv("SUBGEN_AZURE_BATCH_VERSION", "1.0.0")
 
+_BOOL_TRUE = frozenset({'true', 'on', '1', 'yes'})
+
+
 def get_bool(value: str) -> bool:
     """Convert string to boolean."""
-    return str(value).lower() in ('true', 'on', '1', 'yes')
+    return str(value).lower() in _BOOL_TRUE
 
 
 def get_list(value: str, separator: str = ',') -> List[str]:
@@ -24,7 +26,13 @@ def get_list(value: str, separator: str = ',') -> List[str]:
     return [item.strip() for item in value.split(separator) if item.strip()]
 
 
-@dataclass
+def get_language_tuple(value: str) -> Tuple[str, ...]:
+    """Convert pipe-separated language codes to a lowercase tuple."""
+    return tuple(lang.lower() for lang in get_list(value, '|'))
+
+
+# Config objects are read-only after loading (slots: faster attribute reads, no __dict__)
+@dataclass(slots=True, frozen=True)
 class AzureConfig:
     """Azure Speech Services configuration."""
     speech_key: str = ""
@@ -32,11 +40,27 @@ class AzureConfig:
     storage_connection_string: str = ""
     storage_container: str = "transcription-audio"
     
+    # Blob upload tuning: parallel block PUTs and block size (MB)
+    # Throughput scales with concurrency x block size until the link saturates
+    upload_concurrency: int = 8
+    upload_block_size_mb: int = 8
+    
+    # Completion webhooks: Azure calls webhook_url (this server's /webhook/azure
+    # endpoint) when a transcription finishes, replacing most status polling
+    use_webhook: bool = False
+    webhook_url: str = ""
+    webhook_secret: str = ""
+    
     @property
     def is_configured(self) -> bool:
         """Check if Azure is properly configured."""
         return bool(self.speech_key and self.speech_region)
     
+    @property
+    def webhook_enabled(self) -> bool:
+        """Check if completion webhooks are enabled and have a callback URL."""
+        return bool(self.use_webhook and self.webhook_url)
+    
     @property
     def requires_storage(self) -> bool:
         """Check if storage is configured (required for batch transcription)."""
@@ -48,7 +72,7 @@ class AzureConfig:
         return f"https://{self.speech_region}.api.cognitive.microsoft.com/speechtotext/v3.2"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BazarrConfig:
     """Bazarr integration configuration."""
     url: str = ""
@@ -60,7 +84,7 @@ class BazarrConfig:
         return bool(self.url and self.api_key)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlexConfig:
     """Plex integration configuration."""
     token: str = ""
@@ -72,7 +96,7 @@ class PlexConfig:
         return bool(self.token and self.server)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JellyfinConfig:
     """Jellyfin integration configuration."""
     token: str = ""
@@ -84,7 +108,7 @@ class JellyfinConfig:
         return bool(self.token and self.server)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbyConfig:
     """Emby integration configuration."""
     token: str = ""
@@ -96,7 +120,7 @@ class EmbyConfig:
         return bool(self.token and self.server)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PathMappingConfig:
     """Path mapping configuration for Docker volume differences."""
     enabled: bool = False
@@ -104,20 +128,20 @@ class PathMappingConfig:
     to_path: str = ""
     
     def apply(self, path: str) -> str:
-        """Apply path mapping if enabled."""
-        if self.enabled and self.from_path:
-            return path.replace(self.from_path, self.to_path)
+        """Apply path mapping if enabled (only a leading from_path is replaced)."""
+        if self.enabled and self.from_path and path.startswith(self.from_path):
+            return self.to_path + path[len(self.from_path):]
         return path
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class ProcessingConfig:
     """Processing control configuration."""
     process_added_media: bool = False  # Process on library.new events
     process_on_play: bool = False  # Process on media.play events
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionConfig:
     """Transcription behavior configuration.
     
@@ -155,20 +179,27 @@ class TranscriptionConfig:
     # Used by /detect-language endpoint for Bazarr integration
     language_detection_candidates: str = "en-US,nl-NL,es-ES,fr-FR"
     
+    # Parsed once in __post_init__ (read on every file's skip/track decision)
+    _preferred_audio_languages: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_preferred_audio_languages', get_language_tuple(self.preferred_audio_languages))
+    
     @property
     def forced_language(self) -> Optional[str]:
         """Get the forced language, or None if not set."""
         return self.force_language.strip() or None
     
     @property
-    def preferred_audio_languages_list(self) -> list:
-        """Get the list of preferred audio languages."""
-        if not self.preferred_audio_languages.strip():
-            return []
-        return [lang.strip().lower() for lang in self.preferred_audio_languages.split('|') if lang.strip()]
+    def preferred_audio_languages_list(self) -> Tuple[str, ...]:
+        """Get the preferred audio languages, in priority order."""
+        return self._preferred_audio_languages
+
+
+_VALID_NAMING_TYPES = frozenset({"ISO_639_1", "ISO_639_2_T", "ISO_639_2_B", "NAME", "NATIVE"})
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubtitleNamingConfig:
     """Subtitle file naming configuration.
     
@@ -192,6 +223,12 @@ class SubtitleNamingConfig:
     # Empty string means use detected language. Based on SUBTITLE_LANGUAGE_NAME.
     subtitle_language_name: str = ""
     
+    # Uppercased once in __post_init__
+    _naming_type_upper: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_naming_type_upper', self.naming_type.upper())
+    
     @property
     def valid_types(self) -> tuple:
         """Return valid naming type values."""
@@ -200,7 +237,7 @@ class SubtitleNamingConfig:
     @property
     def is_valid(self) -> bool:
         """Check if naming type is valid."""
-        return self.naming_type.upper() in self.valid_types
+        return self._naming_type_upper in _VALID_NAMING_TYPES
     
     @property
     def language_name_override(self) -> Optional[str]:
@@ -208,7 +245,7 @@ class SubtitleNamingConfig:
         return self.subtitle_language_name.strip() or None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkipConfig:
     """Skip configuration - determines when to skip subtitle generation.
     
@@ -246,27 +283,64 @@ class SkipConfig:
     # Based on SKIP_IF_NO_LANGUAGE_BUT_SUBTITLES_EXIST
     skip_if_no_language_but_subtitles_exist: bool = False
     
+    # Parsed once in __post_init__ (read on every file's skip decision)
+    _audio_language_skip: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _subtitle_languages_skip: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, '_audio_language_skip', get_language_tuple(self.skip_if_audio_track_is))
+        object.__setattr__(self, '_subtitle_languages_skip', get_language_tuple(self.skip_subtitle_languages))
+    
     @property
     def internal_subtitle_language(self) -> Optional[str]:
         """Get the internal subtitle language to check, or None if not set."""
         return self.skip_if_internal_subtitles_language.strip() or None
     
     @property
-    def audio_language_skip_list(self) -> List[str]:
-        """Get list of audio languages to skip."""
-        if not self.skip_if_audio_track_is.strip():
-            return []
-        return [lang.strip().lower() for lang in self.skip_if_audio_track_is.split('|') if lang.strip()]
+    def audio_language_skip_list(self) -> Tuple[str, ...]:
+        """Get audio languages to skip."""
+        return self._audio_language_skip
     
     @property
-    def subtitle_languages_skip_list(self) -> List[str]:
-        """Get list of subtitle languages that trigger a skip."""
-        if not self.skip_subtitle_languages.strip():
-            return []
-        return [lang.strip().lower() for lang in self.skip_subtitle_languages.split('|') if lang.strip()]
+    def subtitle_languages_skip_list(self) -> Tuple[str, ...]:
+        """Get subtitle languages that trigger a skip."""
+        return self._subtitle_languages_skip
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class NotificationConfig:
+    """Failure notification configuration.
+    
+    Loaded from environment variables:
+    - PUSHOVER_USER_KEY: Pushover user/group key
+    - PUSHOVER_API_TOKEN: Pushover application API token
+    - NOTIFY_ON_FAILURE: Enable failure notifications (default: true)
+    
+    Note: Even if NOTIFY_ON_FAILURE is true, notifications will only be sent
+    if Pushover is properly configured (both user key and API token set).
+    """
+    # Pushover settings
+    pushover_user_key: str = ""
+    pushover_api_token: str = ""
+    
+    # Notification triggers
+    notify_on_failure: bool = True
+    
+    # Derived in __post_init__ and stored as plain slots, since they are
+    # checked before every notification:
+    # - pushover_configured: both Pushover user key and API token are set
+    # - is_configured: any notification service is configured
+    pushover_configured: bool = field(default=False, init=False, repr=False, compare=False)
+    is_configured: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        pushover_configured = bool(self.pushover_user_key and self.pushover_api_token)
+        object.__setattr__(self, 'pushover_configured', pushover_configured)
+        object.__setattr__(self, 'is_configured', pushover_configured)
+
+
+@dataclass(slots=True, frozen=True)
 class Settings:
     """Application settings."""
     
@@ -276,12 +350,17 @@ class Settings:
     # UI settings
     default_theme: str = "dark"  # 'dark' or 'light'
     
+    # Origins allowed to call the API from a browser ('*' = any). The bundled
+    # UI is same-origin, so an empty list skips the CORS middleware entirely.
+    cors_origins: List[str] = field(default_factory=lambda: ["*"])
+    
     # Media settings
     media_folders: List[str] = field(default_factory=list)
     subtitle_language: str = ""
     
     # Processing settings
     concurrent_transcriptions: int = 50
+    max_concurrent_asr: int = 4  # Bazarr requests preparing audio locally at once
     job_poll_interval: int = 10  # seconds
     audio_format: str = "wav"  # Format for extracted audio
     transcode_dir: str = "/transcode"  # Directory for temp audio files
@@ -310,108 +389,133 @@ class Settings:
     jellyfin: JellyfinConfig = field(default_factory=JellyfinConfig)
     emby: EmbyConfig = field(default_factory=EmbyConfig)
     
+    # Failure notifications
+    notification: NotificationConfig = field(default_factory=NotificationConfig)
+    
     @classmethod
     def from_env(cls) -> 'Settings':
         """Load settings from environment variables."""
+        # One snapshot of the environment instead of ~40 os.getenv() calls
+        env = dict(os.environ)
         return cls(
             # Server settings
-            debug=get_bool(os.getenv('DEBUG', 'false')),
+            debug=get_bool(env.get('DEBUG', 'false')),
             
             # UI settings
-            default_theme=os.getenv('DEFAULT_THEME', 'dark'),
+            default_theme=env.get('DEFAULT_THEME', 'dark'),
+            cors_origins=get_list(env.get('CORS_ORIGINS', '*')),
             
             # Media settings
-            media_folders=get_list(os.getenv('MEDIA_FOLDERS', '/tv,/movies')),
-            subtitle_language=os.getenv('SUBTITLE_LANGUAGE', ''),
+            media_folders=get_list(env.get('MEDIA_FOLDERS', '/tv,/movies')),
+            subtitle_language=env.get('SUBTITLE_LANGUAGE', ''),
             
             # Processing settings
-            concurrent_transcriptions=int(os.getenv('CONCURRENT_TRANSCRIPTIONS', '50')),
-            job_poll_interval=int(os.getenv('JOB_POLL_INTERVAL', '10')),
-            audio_format=os.getenv('AUDIO_FORMAT', 'wav'),
-            transcode_dir=os.getenv('TRANSCODE_DIR', '/transcode'),
+            concurrent_transcriptions=int(env.get('CONCURRENT_TRANSCRIPTIONS', '50')),
+            max_concurrent_asr=int(env.get('MAX_CONCURRENT_ASR', '4')),
+            job_poll_interval=int(env.get('JOB_POLL_INTERVAL', '10')),
+            audio_format=env.get('AUDIO_FORMAT', 'wav'),
+            transcode_dir=env.get('TRANSCODE_DIR', '/transcode'),
             
             # Azure configuration
             azure=AzureConfig(
-                speech_key=os.getenv('AZURE_SPEECH_KEY', ''),
-                speech_region=os.getenv('AZURE_SPEECH_REGION', 'swedencentral'),
-                storage_connection_string=os.getenv('AZURE_STORAGE_CONNECTION_STRING', ''),
-                storage_container=os.getenv('AZURE_STORAGE_CONTAINER', 'transcription-audio'),
+                speech_key=env.get('AZURE_SPEECH_KEY', ''),
+                speech_region=env.get('AZURE_SPEECH_REGION', 'swedencentral'),
+                storage_connection_string=env.get('AZURE_STORAGE_CONNECTION_STRING', ''),
+                storage_container=env.get('AZURE_STORAGE_CONTAINER', 'transcription-audio'),
+                upload_concurrency=int(env.get('AZURE_UPLOAD_CONCURRENCY', '8')),
+                upload_block_size_mb=int(env.get('AZURE_UPLOAD_BLOCK_SIZE_MB', '8')),
+                use_webhook=get_bool(env.get('AZURE_USE_WEBHOOK', 'false')),
+                webhook_url=env.get('AZURE_WEBHOOK_URL', ''),
+                webhook_secret=env.get('AZURE_WEBHOOK_SECRET', ''),
             ),
             
             # Path mapping configuration
             path_mapping=PathMappingConfig(
-                enabled=get_bool(os.getenv('USE_PATH_MAPPING', 'false')),
-                from_path=os.getenv('PATH_MAPPING_FROM', ''),
-                to_path=os.getenv('PATH_MAPPING_TO', ''),
+                enabled=get_bool(env.get('USE_PATH_MAPPING', 'false')),
+                from_path=env.get('PATH_MAPPING_FROM', ''),
+                to_path=env.get('PATH_MAPPING_TO', ''),
             ),
             
             # Processing control
             processing=ProcessingConfig(
-                process_added_media=get_bool(os.getenv('PROCESS_ADDED_MEDIA', 'false')),
-                process_on_play=get_bool(os.getenv('PROCESS_MEDIA_ON_PLAY', 'false')),
+                process_added_media=get_bool(env.get('PROCESS_ADDED_MEDIA', 'false')),
+                process_on_play=get_bool(env.get('PROCESS_MEDIA_ON_PLAY', 'false')),
             ),
             
             # Skip configuration
             skip=SkipConfig(
-                skip_if_target_subtitles_exist=get_bool(os.getenv('SKIP_IF_TARGET_SUBTITLES_EXIST', 'true')),
-                skip_if_external_subtitles_exist=get_bool(os.getenv('SKIP_IF_EXTERNAL_SUBTITLES_EXIST', 'false')),
-                skip_if_internal_subtitles_language=os.getenv('SKIP_IF_INTERNAL_SUBTITLES_LANGUAGE', ''),
-                skip_only_subgen_subtitles=get_bool(os.getenv('SKIP_ONLY_SUBGEN_SUBTITLES', 'false')),
-                skip_if_audio_track_is=os.getenv('SKIP_IF_AUDIO_TRACK_IS', ''),
-                skip_subtitle_languages=os.getenv('SKIP_SUBTITLE_LANGUAGES', ''),
-                skip_unknown_language=get_bool(os.getenv('SKIP_UNKNOWN_LANGUAGE', 'false')),
-                skip_if_no_language_but_subtitles_exist=get_bool(os.getenv('SKIP_IF_NO_LANGUAGE_BUT_SUBTITLES_EXIST', 'false')),
+                skip_if_target_subtitles_exist=get_bool(env.get('SKIP_IF_TARGET_SUBTITLES_EXIST', 'true')),
+                skip_if_external_subtitles_exist=get_bool(env.get('SKIP_IF_EXTERNAL_SUBTITLES_EXIST', 'false')),
+                skip_if_internal_subtitles_language=env.get('SKIP_IF_INTERNAL_SUBTITLES_LANGUAGE', ''),
+                skip_only_subgen_subtitles=get_bool(env.get('SKIP_ONLY_SUBGEN_SUBTITLES', 'false')),
+                skip_if_audio_track_is=env.get('SKIP_IF_AUDIO_TRACK_IS', ''),
+                skip_subtitle_languages=env.get('SKIP_SUBTITLE_LANGUAGES', ''),
+                skip_unknown_language=get_bool(env.get('SKIP_UNKNOWN_LANGUAGE', 'false')),
+                skip_if_no_language_but_subtitles_exist=get_bool(env.get('SKIP_IF_NO_LANGUAGE_BUT_SUBTITLES_EXIST', 'false')),
             ),
             
             # Subtitle naming configuration
             subtitle_naming=SubtitleNamingConfig(
-                naming_type=os.getenv('SUBTITLE_LANGUAGE_NAMING_TYPE', 'ISO_639_2_B').upper(),
-                show_subgen_marker=get_bool(os.getenv('SHOW_IN_SUBNAME_SUBGEN', 'false')),
-                subtitle_language_name=os.getenv('SUBTITLE_LANGUAGE_NAME', ''),
+                naming_type=env.get('SUBTITLE_LANGUAGE_NAMING_TYPE', 'ISO_639_2_B').upper(),
+                show_subgen_marker=get_bool(env.get('SHOW_IN_SUBNAME_SUBGEN', 'false')),
+                subtitle_language_name=env.get('SUBTITLE_LANGUAGE_NAME', ''),
             ),
             
             # Transcription configuration
             transcription=TranscriptionConfig(
-                force_language=os.getenv('FORCE_DETECTED_LANGUAGE_TO', ''),
-                append_credit_line=get_bool(os.getenv('APPEND', 'false')),
-                lrc_for_audio_files=get_bool(os.getenv('LRC_FOR_AUDIO_FILES', 'true')),
-                preferred_audio_languages=os.getenv('PREFERRED_AUDIO_LANGUAGES', ''),
-                limit_to_preferred_audio_languages=get_bool(os.getenv('LIMIT_TO_PREFERRED_AUDIO_LANGUAGE', 'false')),
-                detect_language_length=int(os.getenv('DETECT_LANGUAGE_LENGTH', '30')),
-                detect_language_offset=int(os.getenv('DETECT_LANGUAGE_OFFSET', '0')),
-                language_detection_candidates=os.getenv('LANGUAGE_DETECTION_CANDIDATES', 'en-US,nl-NL,es-ES,fr-FR'),
+                force_language=env.get('FORCE_DETECTED_LANGUAGE_TO', ''),
+                append_credit_line=get_bool(env.get('APPEND', 'false')),
+                lrc_for_audio_files=get_bool(env.get('LRC_FOR_AUDIO_FILES', 'true')),
+                preferred_audio_languages=env.get('PREFERRED_AUDIO_LANGUAGES', ''),
+                limit_to_preferred_audio_languages=get_bool(env.get('LIMIT_TO_PREFERRED_AUDIO_LANGUAGE', 'false')),
+                detect_language_length=int(env.get('DETECT_LANGUAGE_LENGTH', '30')),
+                detect_language_offset=int(env.get('DETECT_LANGUAGE_OFFSET', '0')),
+                language_detection_candidates=env.get('LANGUAGE_DETECTION_CANDIDATES', 'en-US,nl-NL,es-ES,fr-FR'),
             ),
             
             # Bazarr configuration
             bazarr=BazarrConfig(
-                url=os.getenv('BAZARR_URL', ''),
-                api_key=os.getenv('BAZARR_API_KEY', ''),
+                url=env.get('BAZARR_URL', ''),
+                api_key=env.get('BAZARR_API_KEY', ''),
             ),
             
             # Plex configuration
             plex=PlexConfig(
-                token=os.getenv('PLEX_TOKEN', ''),
-                server=os.getenv('PLEX_SERVER', ''),
+                token=env.get('PLEX_TOKEN', ''),
+                server=env.get('PLEX_SERVER', ''),
             ),
             
             # Jellyfin configuration
             jellyfin=JellyfinConfig(
-                token=os.getenv('JELLYFIN_TOKEN', ''),
-                server=os.getenv('JELLYFIN_SERVER', ''),
+                token=env.get('JELLYFIN_TOKEN', ''),
+                server=env.get('JELLYFIN_SERVER', ''),
             ),
             
             # Emby configuration
             emby=EmbyConfig(
-                token=os.getenv('EMBY_TOKEN', ''),
-                server=os.getenv('EMBY_SERVER', ''),
+                token=env.get('EMBY_TOKEN', ''),
+                server=env.get('EMBY_SERVER', ''),
+            ),
+            
+            # Notification configuration (NOTIFY_ON_FAILURE defaults to true, even if set empty)
+            notification=NotificationConfig(
+                pushover_user_key=env.get('PUSHOVER_USER_KEY', ''),
+                pushover_api_token=env.get('PUSHOVER_API_TOKEN', ''),
+                notify_on_failure=get_bool(env.get('NOTIFY_ON_FAILURE') or 'true'),
             ),
         )
 
 
-@lru_cache()
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings.from_env()
+    """Get cached application settings (loaded from the environment on first call)."""
+    global _settings
+    cached = _settings
+    if cached is None:
+        cached = _settings = Settings.from_env()
+    return cached
 
 
 def require_azure_configured() -> None:
@@ -432,6 +536,11 @@ def require_azure_configured() -> None:
         )
 
 
+# Indexed by (count == 1): plural, singular
+_MINUTE_UNITS = ("minutes", "minute")
+_SECOND_UNITS = ("seconds", "second")
+
+
 def format_duration(seconds: float) -> str:
     """
     Format duration in seconds to human-readable string.
@@ -444,8 +553,10 @@ def format_duration(seconds: float) -> str:
     """
     minutes, secs = divmod(int(seconds), 60)
     if minutes > 0:
-        return f"{minutes} minute{'s' if minutes != 1 else ''} and {secs} second{'s' if secs != 1 else ''}"
-    return f"{secs} second{'s' if secs != 1 else ''}"
+        return f"{minutes} {_MINUTE_UNITS[minutes == 1]} and {secs} {_SECOND_UNITS[secs == 1]}"
+    if secs == 1:
+        return "1 second"
+    return f"{secs} seconds"
 
 
 # Export for convenience
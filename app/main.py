@@ -9,14 +9,33 @@ import os
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
+import orjson
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+try:
+    import uvloop  # noqa: F401 - only checked for availability
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import httptools  # noqa: F401 - only checked for availability
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
 from app.config import SUBGEN_AZURE_BATCH_VERSION, get_settings
 from app.routers import asr_router, batch_router, ui_router, webhooks_router
+from app.utils.azure_batch_transcriber import close_transcriber
+from app.utils.http_session import close_shared_session
+from app.utils.notification_service import close_notifier
+from app.utils.request_decompression import RequestDecompressionMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -28,73 +47,101 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Settings are read-only after loading; resolve them once for this module
+SETTINGS = get_settings()
+
 # Suppress verbose Azure SDK HTTP logging
 logging.getLogger("azure.core.pipeline.policies.http_logging_policy").setLevel(logging.WARNING)
 
 # Reduce noise from uvicorn access logs for status polling
+# Suppress session status polling (GET only) and health checks
+_QUIET_GET_PREFIXES = ('/api/batch/session/', '/health')
+_QUIET_PREFIXES = ('/health',)
+
+
 class SuppressStatusPollingFilter(logging.Filter):
     """Filter out noisy status polling requests from access logs."""
     def filter(self, record: logging.LogRecord) -> bool:
-        message = record.getMessage()
-        # Suppress session status polling and health checks
-        if '/api/batch/session/' in message and 'GET' in message:
-            return False
-        if '/health' in message:
-            return False
-        return True
+        # uvicorn passes (client_addr, method, path, http_version, status_code)
+        # as args; inspect them directly instead of formatting the message
+        args = record.args
+        if not isinstance(args, tuple) or len(args) < 3:
+            return True
+        prefixes = _QUIET_GET_PREFIXES if args[1] == 'GET' else _QUIET_PREFIXES
+        return not args[2].startswith(prefixes)
 
 # Apply filter to uvicorn access logger
 logging.getLogger("uvicorn.access").addFilter(SuppressStatusPollingFilter())
 
 
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+    
+    Used as the app's default response class: the UI polls session status
+    every few seconds, and orjson's C serializer is several times faster than
+    json.dumps. (Defined here rather than using fastapi.responses.ORJSONResponse,
+    which newer FastAPI releases deprecate.)
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown events."""
     # Startup
-    settings = get_settings()
     logger.info("=" * 60)
     logger.info("SubGen-Azure-Batch Starting Up")
     logger.info("=" * 60)
-    logger.info(f"Azure Speech Region: {settings.azure.speech_region}")
-    logger.info(f"Azure Configured: {settings.azure.is_configured}")
-    logger.info(f"Bazarr Configured: {settings.bazarr.is_configured}")
-    logger.info(f"Plex Configured: {settings.plex.is_configured}")
-    logger.info(f"Jellyfin Configured: {settings.jellyfin.is_configured}")
-    logger.info(f"Emby Configured: {settings.emby.is_configured}")
-    logger.info(f"Media Folders: {settings.media_folders}")
-    logger.info(f"Concurrent Transcriptions: {settings.concurrent_transcriptions}")
+    logger.info("Azure Speech Region: %s", SETTINGS.azure.speech_region)
+    logger.info("Azure Configured: %s", SETTINGS.azure.is_configured)
+    logger.info("Bazarr Configured: %s", SETTINGS.bazarr.is_configured)
+    logger.info("Plex Configured: %s", SETTINGS.plex.is_configured)
+    logger.info("Jellyfin Configured: %s", SETTINGS.jellyfin.is_configured)
+    logger.info("Emby Configured: %s", SETTINGS.emby.is_configured)
+    logger.info("Media Folders: %s", SETTINGS.media_folders)
+    logger.info("Concurrent Transcriptions: %s", SETTINGS.concurrent_transcriptions)
     logger.info("=" * 60)
     
-    if not settings.azure.is_configured:
+    if not SETTINGS.azure.is_configured:
         logger.warning("Azure Speech Services not configured! Set AZURE_SPEECH_KEY and AZURE_SPEECH_REGION.")
     
     yield
     
     # Shutdown
     logger.info("SubGen-Azure-Batch Shutting Down")
+    await close_notifier()
+    await close_transcriber()
+    await close_shared_session()
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
-    settings = get_settings()
-    
     app = FastAPI(
         title="SubGen-Azure-Batch",
         description="Cloud-based subtitle generation using Azure Batch Transcription API",
         version=SUBGEN_AZURE_BATCH_VERSION,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
     )
     
-    # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Configure as needed for production
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Add CORS middleware (skipped when CORS_ORIGINS is empty: the bundled UI is
+    # same-origin and webhook callers are servers, so no request needs it)
+    if SETTINGS.cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=SETTINGS.cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+    
+    # Inflate gzip/deflate-encoded request bodies (e.g. compressed WAV uploads)
+    app.add_middleware(RequestDecompressionMiddleware)
     
     # Mount static files if directory exists
     static_dir = Path(__file__).parent / "static"
@@ -116,15 +163,19 @@ app = create_app()
 
 def main():
     """Run the application with uvicorn."""
-    settings = get_settings()
-    
     # Build uvicorn config
     uvicorn_kwargs = {
         "host": "0.0.0.0",
         "port": 9000,  # Fixed for Docker deployments, change in docker-compose.yml if needed
-        "reload": settings.debug,
-        "log_level": "debug" if settings.debug else "info",
+        "reload": SETTINGS.debug,
+        "log_level": "debug" if SETTINGS.debug else "info",
+        # uvloop (libuv) speeds up the HTTPS-heavy Azure polling/upload traffic;
+        # falls back to the standard asyncio loop when not installed
+        "loop": "uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        # httptools (llhttp) parses requests faster than the pure-Python h11
+        "http": "httptools" if HTTPTOOLS_AVAILABLE else "h11",
     }
+    logger.info(f"Using {uvicorn_kwargs['loop']} event loop and {uvicorn_kwargs['http']} HTTP parser")
     
     # TCP keepalive timeout - helps prevent connection resets during long transcriptions
     # Only set if explicitly configured via UVICORN_TIMEOUT_KEEP_ALIVE environment variable
@@ -132,7 +183,10 @@ def main():
     if timeout_keep_alive_env is not None:
         uvicorn_kwargs["timeout_keep_alive"] = int(timeout_keep_alive_env)
     
-    uvicorn.run("app.main:app", **uvicorn_kwargs)
+    # Pass the already-built app object so uvicorn does not import app.main a
+    # second time (under `python -m app.main` this module runs as __main__).
+    # Reload mode needs the import string to re-import in the reloader child.
+    uvicorn.run("app.main:app" if SETTINGS.debug else app, **uvicorn_kwargs)
 
 
 if __name__ == "__main__":
@@ -2,12 +2,14 @@
 Routers package for SubGen-Azure-Batch.
 
 Exports all API routers for the FastAPI application.
+
+Routers are imported lazily (PEP 562) on first attribute access, so importing
+a sibling module such as app.routers.webhooks does not also load the other
+routers and their dependencies.
 """
 
-from app.routers.asr import router as asr_router
-from app.routers.batch import router as batch_router
-from app.routers.ui import router as ui_router
-from app.routers.webhooks import router as webhooks_router
+import importlib
+from typing import Any, List
 
 __all__ = [
     "asr_router",
@@ -15,3 +17,17 @@ __all__ = [
     "ui_router",
     "webhooks_router",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a router module on first access and cache its router."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = importlib.import_module(f"{__name__}.{name.removesuffix('_router')}").router
+    globals()[name] = router
+    return router
+
+
+def __dir__() -> List[str]:
+    """Include the lazily loaded routers in dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
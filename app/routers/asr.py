@@ -5,29 +5,110 @@ Provides the /asr and /detect-language endpoints that mimic the Whisper ASR API
 allowing Bazarr to use SubGen-Azure-Batch as a transcription provider.
 """
 
+import asyncio
+import io
 import logging
 import os
-import random
+import re
 import shutil
-import string
+import struct
 import time
 import wave
 from pathlib import Path
-from typing import Optional, Union
+from typing import (AsyncIterator, BinaryIO, List, Optional, Set, Tuple,
+                    Union)
 
-from fastapi import APIRouter, File, HTTPException, Query, UploadFile
-from fastapi.responses import Response, StreamingResponse
+import aiofiles
+import orjson
+from fastapi import (APIRouter, BackgroundTasks, File, Header, HTTPException,
+                     Query, UploadFile)
+from fastapi.responses import Response
 
 from app.config import (SUBGEN_AZURE_BATCH_VERSION, get_settings,
                         require_azure_configured)
 from app.transcription_service import JobSource, TranscriptionService
-from app.utils.audio_extractor import extract_audio_segment, make_temp_dir
-from app.utils.azure_batch_transcriber import AzureBatchTranscriber
+from app.utils.audio_extractor import (extract_audio_segment, make_temp_dir,
+                                       make_temp_file)
+from app.utils.azure_batch_transcriber import (AzureBatchTranscriber,
+                                               TranscriptionResult,
+                                               get_transcriber)
 from app.utils.language_code import LanguageCode
+from app.utils.request_decompression import SUPPORTED_ENCODINGS
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["ASR"])
 
+# Uploads are copied to disk in chunks of this size, so memory use does not
+# grow with the size of the audio Bazarr sends
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Language detection requests arriving within this window share one Azure
+# transcription job (Bazarr sends them in bursts during library scans)
+DETECT_BATCH_WINDOW = 0.5
+# Segments per detection job; larger bursts are split across several jobs
+DETECT_BATCH_MAX_SIZE = 100
+# Detection jobs cover only a few seconds of audio each, so they are polled
+# sooner than full transcriptions (backing off from here as usual)
+DETECT_MIN_POLL_INTERVAL = 0.5
+
+# Uploaded segments waiting for the next detection job: (blob_name, audio_url, future)
+_pending_detections: List[Tuple[str, str, "asyncio.Future[TranscriptionResult]"]] = []
+# Running batch timers (referenced so they are not garbage collected)
+_detect_batch_tasks: Set[asyncio.Task] = set()
+
+# Limits how many requests prepare audio locally at once (copying uploads to
+# disk, encoding to Opus, cutting detection segments); created on first use
+# from MAX_CONCURRENT_ASR
+_prep_semaphore: Optional[asyncio.Semaphore] = None
+
+# Bodies of the constant GET endpoints Bazarr polls, serialized once
+_ROOT_JSON = orjson.dumps(f"Whisper ASR Webservice {SUBGEN_AZURE_BATCH_VERSION} (SubGen-Azure-Batch)")
+_STATUS_JSON = orjson.dumps({"version": f"SubGen-Azure-Batch {SUBGEN_AZURE_BATCH_VERSION}, Azure Batch Transcription API"})
+# /status tells clients they may gzip/deflate request bodies (RFC 7694)
+_STATUS_HEADERS = {"Accept-Encoding": ", ".join(SUPPORTED_ENCODINGS)}
+_GET_NOT_SUPPORTED_JSON = orjson.dumps([
+    "You accessed this request incorrectly via a GET request.  See https://github.com/TimoVerbrugghe/subgen-azure-batch for proper configuration"
+])
+
+# /asr/languages response body, built once: the LanguageCode list is fixed
+_LANGUAGES_JSON = orjson.dumps({
+    "languages": [
+        {
+            "code": lang.value,
+            "name": lang.name.replace("_", " ").title(),
+            "azure_locale": lang.to_azure_locale(),
+        }
+        for lang in LanguageCode
+    ]
+})
+
+# SRT timing line, e.g. "00:01:02,500 --> 00:01:04,000"
+_SRT_TIMING_RE = re.compile(r"(\d+:\d\d:\d\d),(\d{3} --> \d+:\d\d:\d\d),(\d{3})")
+
+
+def _get_prep_semaphore() -> asyncio.Semaphore:
+    """Get or create the audio preparation semaphore."""
+    global _prep_semaphore
+    if _prep_semaphore is None:
+        _prep_semaphore = asyncio.Semaphore(get_settings().max_concurrent_asr)
+    return _prep_semaphore
+
+
+async def _iter_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an uploaded file in UPLOAD_CHUNK_SIZE chunks."""
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+async def _save_upload(upload: UploadFile, path: str) -> int:
+    """Stream an uploaded file to disk in chunks; returns the number of bytes written."""
+    size = 0
+    async with aiofiles.open(path, 'wb') as f:
+        async for chunk in _iter_upload(upload):
+            await f.write(chunk)
+            size += len(chunk)
+    return size
+
 
 @router.get("/")
 async def get_root_version():
@@ -35,7 +116,7 @@ async def get_root_version():
     Return version info for Bazarr compatibility at root.
     Mimics whisper-asr-webservice format.
     """
-    return f"Whisper ASR Webservice {SUBGEN_AZURE_BATCH_VERSION} (SubGen-Azure-Batch)"
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 @router.get("/asr")
@@ -45,7 +126,7 @@ async def get_asr_version():
     
     The actual transcription happens via POST /asr.
     """
-    return ["You accessed this request incorrectly via a GET request.  See https://github.com/TimoVerbrugghe/subgen-azure-batch for proper configuration"]
+    return Response(content=_GET_NOT_SUPPORTED_JSON, media_type="application/json")
 
 
 @router.get("/status")
@@ -56,7 +137,7 @@ async def get_status():
     Bazarr checks this endpoint to verify the ASR provider is working and get version info.
     Matches the original subgen format: {"version": "Subgen X.Y.Z, ..."}
     """
-    return {"version": f"SubGen-Azure-Batch {SUBGEN_AZURE_BATCH_VERSION}, Azure Batch Transcription API"}
+    return Response(content=_STATUS_JSON, media_type="application/json", headers=_STATUS_HEADERS)
 
 
 @router.post("/asr")
@@ -109,19 +190,29 @@ async def transcribe_audio(
     # Determine output format
     output_format = (output or "srt").lower()
     
+    upload_path: Optional[str] = None
+    
     try:
-        # Read uploaded file content
-        content = await audio_file.read()
-        logger.debug(f"Received audio data: {len(content)} bytes, encode={encode}")
+        if encode:
+            # Container formats may need seeking (e.g. MP4 with its index at
+            # the end), so stream the upload to disk before ffmpeg reads it
+            upload_path = make_temp_file(suffix=".upload")
+            async with _get_prep_semaphore():
+                size = await _save_upload(audio_file, upload_path)
+            logger.debug(f"Received audio data: {size} bytes, encode={encode}")
         
         # Use the unified TranscriptionService
-        # The service handles: audio compression, Azure upload, transcription, cleanup
+        # The service handles: audio compression, Azure upload, transcription, cleanup.
+        # Raw PCM is piped straight into the encoder as it is read.
         result, job = await TranscriptionService.transcribe_audio_data(
-            audio_data=content,
+            audio_data=None,
+            audio_path=upload_path,
+            audio_stream=None if encode else _iter_upload(audio_file),
             language=language or "en",
             source=JobSource.BAZARR,
             file_name=video_file or audio_file.filename or "unknown",
             is_raw_pcm=not encode,  # If encode=False, it's raw PCM
+            prep_semaphore=_get_prep_semaphore(),
         )
         
         # Generate output in requested format
@@ -154,6 +245,11 @@ async def transcribe_audio(
     finally:
         # Cleanup temp files
         await audio_file.close()
+        if upload_path:
+            try:
+                os.unlink(upload_path)
+            except OSError as e:
+                logger.warning(f"Failed to cleanup temp file {upload_path}: {e}")
 
 
 @router.get("/asr/languages")
@@ -164,14 +260,8 @@ async def list_languages():
     Returns:
         List of supported language codes with their names.
     """
-    languages = []
-    for lang in LanguageCode:
-        languages.append({
-            "code": lang.value,
-            "name": lang.name.replace("_", " ").title(),
-            "azure_locale": lang.to_azure_locale()
-        })
-    return {"languages": languages}
+    # The list never changes, so it is serialized once (see _LANGUAGES_JSON)
+    return Response(content=_LANGUAGES_JSON, media_type="application/json")
 
 
 @router.get("/detect-language")
@@ -181,17 +271,20 @@ async def get_detect_language_version():
     
     The actual language detection happens via POST /detect-language.
     """
-    return ["You accessed this request incorrectly via a GET request.  See https://github.com/TimoVerbrugghe/subgen-azure-batch for proper configuration"]
+    return Response(content=_GET_NOT_SUPPORTED_JSON, media_type="application/json")
 
 
 @router.post("//detect-language")
 @router.post("/detect-language")
 async def detect_language(
+    background_tasks: BackgroundTasks,
     audio_file: UploadFile = File(...),
     encode: bool = Query(default=True, description="Encode audio first through ffmpeg"),
     video_file: Union[str, None] = Query(default=None),
     detect_lang_length: Optional[int] = Query(default=None, description="Detect language on X seconds of the file"),
     detect_lang_offset: Optional[int] = Query(default=None, description="Start detect language X seconds into the file"),
+    language: Optional[str] = Query(default=None, description="Known language; skips detection"),
+    accept_language: Optional[str] = Header(default=None),
 ):
     """
     Detect the language of an audio file using Azure Batch Transcription.
@@ -200,11 +293,14 @@ async def detect_language(
     the language of the audio track.
     
     Args:
+        background_tasks: Runs the Azure blob cleanup after the response is sent.
         audio_file: Audio file to analyze.
         encode: Whether the audio needs encoding (from Bazarr this is usually False).
         video_file: Original video file path (for logging purposes).
         detect_lang_length: How many seconds of audio to analyze.
         detect_lang_offset: Start offset in seconds.
+        language: Language the client already knows; returned without detection.
+        accept_language: Accept-Language header, used as a fallback hint.
     
     Returns:
         Dictionary with detected_language (name) and language_code (ISO 639-1).
@@ -234,95 +330,100 @@ async def detect_language(
                 "language_code": lang_code.to_iso_639_1()
             }
     
+    # Client already knows the language: answer without touching Azure
+    lang_code = _language_hint(language, accept_language)
+    if lang_code != LanguageCode.NONE:
+        logger.info(f"Skipping detect language, client hint is {lang_code.to_name()}")
+        await audio_file.close()
+        return {
+            "detected_language": lang_code.to_name(),
+            "language_code": lang_code.to_iso_639_1()
+        }
+    
     # Validate Azure configuration
     require_azure_configured()
     
-    # Save uploaded file to temp location
-    temp_dir = make_temp_dir(prefix="subgen_detect_")
+    temp_dir: Optional[str] = None
     segment_audio: Optional[str] = None
+    segment_wav: Optional[io.BytesIO] = None
     detected_language = LanguageCode.NONE
     language_code = 'und'
     
     try:
-        # Read uploaded file content
-        content = await audio_file.read()
-        logger.debug(f"Received audio data: {len(content)} bytes, encode={encode}")
-        
-        if encode:
-            # Audio is in a proper file format (WAV, MP3, etc.) - save and extract segment
-            temp_input = Path(temp_dir) / (audio_file.filename or "audio.wav")
-            temp_input.write_bytes(content)
-            logger.debug(f"Saved encoded audio to {temp_input}")
-            
-            # Extract a short segment for language detection
-            segment_audio = await extract_audio_segment(
-                str(temp_input),
-                offset=float(detect_lang_offset),
-                duration=float(detect_lang_length),
-                output_format='wav',
-                sample_rate=16000
-            )
-        else:
-            # Audio is raw PCM data (16-bit, 16kHz, mono) - need to wrap in WAV container
-            # Bazarr sends raw PCM when encode=false
+        # Bounded: at most MAX_CONCURRENT_ASR requests copy and cut audio at once
+        async with _get_prep_semaphore():
+            # The upload is already spooled by Starlette (in memory when small,
+            # on disk past its threshold), so the segment is read from it directly;
+            # only input that needs ffmpeg is copied to a temp file
             sample_rate = 16000
             bytes_per_sample = 2  # 16-bit = 2 bytes
             channels = 1
+            pcm_segment: Optional[bytes] = None
             
-            # Calculate how many samples to extract
-            start_byte = detect_lang_offset * sample_rate * bytes_per_sample
-            length_bytes = detect_lang_length * sample_rate * bytes_per_sample
-            
-            # Extract the segment from raw PCM
-            if len(content) > start_byte:
-                pcm_segment = content[start_byte:start_byte + length_bytes]
+            if encode:
+                # A WAV already in the target format (16 kHz mono 16-bit) is sliced
+                # directly; only other formats go through ffmpeg
+                pcm_segment = await asyncio.to_thread(
+                    _read_wav_segment, audio_file.file, detect_lang_offset, detect_lang_length
+                )
             else:
-                pcm_segment = content[:length_bytes]  # Use what we have
-            
-            logger.debug(f"Extracted PCM segment: {len(pcm_segment)} bytes from raw data")
-            
-            # Create WAV file from raw PCM data
-            segment_audio = os.path.join(temp_dir, "segment.wav")
-            with wave.open(segment_audio, 'wb') as wav_file:
-                wav_file.setnchannels(channels)
-                wav_file.setsampwidth(bytes_per_sample)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(pcm_segment)
+                # Audio is raw PCM data (16-bit, 16kHz, mono) - need to wrap in WAV container
+                # Bazarr sends raw PCM when encode=false
+                start_byte = detect_lang_offset * sample_rate * bytes_per_sample
+                length_bytes = detect_lang_length * sample_rate * bytes_per_sample
+                
+                # Read just the segment from the upload
+                if audio_file.size is None or audio_file.size > start_byte:
+                    await audio_file.seek(start_byte)
+                pcm_segment = await audio_file.read(length_bytes)  # Use what we have
             
-            logger.debug(f"Created WAV file from raw PCM: {segment_audio}")
+            if pcm_segment is None:
+                # Audio is in a proper file format (MP3, AAC, etc.) - extract segment
+                temp_dir = make_temp_dir(prefix="subgen_detect_")
+                temp_input = Path(temp_dir) / (audio_file.filename or "audio.wav")
+                await audio_file.seek(0)
+                size = await _save_upload(audio_file, str(temp_input))
+                logger.debug(f"Saved encoded audio to {temp_input}: {size} bytes")
+                
+                segment_audio = await extract_audio_segment(
+                    str(temp_input),
+                    offset=float(detect_lang_offset),
+                    duration=float(detect_lang_length),
+                    output_format='wav',
+                    sample_rate=16000
+                )
+            else:
+                logger.debug(f"Extracted PCM segment: {len(pcm_segment)} bytes, encode={encode}")
+                
+                # Build the WAV in memory (header, then the samples as-is); it is
+                # uploaded straight from the buffer, never written to disk
+                segment_wav = io.BytesIO()
+                segment_wav.write(_wav_header(len(pcm_segment), sample_rate, channels, bytes_per_sample))
+                segment_wav.write(pcm_segment)
+                segment_wav.seek(0)
+                
+                logger.debug(f"Created in-memory WAV from PCM: {segment_wav.getbuffer().nbytes} bytes")
         
-        logger.debug(f"Audio segment ready for language detection: {segment_audio}")
+        logger.debug(f"Audio segment ready for language detection: {segment_audio or 'in-memory WAV'}")
         
-        # Create transcriber and process
-        transcriber = AzureBatchTranscriber()
+        # Shared transcriber: its blob client is reused across requests
+        transcriber = get_transcriber()
         blob_name_to_cleanup: Optional[str] = None
-        job_id_to_cleanup: Optional[str] = None
-        
-        # Get candidate locales from config for language identification
-        settings = get_settings()
-        candidate_locales_str = settings.transcription.language_detection_candidates
-        candidate_locales = [loc.strip() for loc in candidate_locales_str.split(',') if loc.strip()]
         
         try:
             # Upload segment to blob storage
-            audio_url, blob_name = await transcriber.upload_audio(segment_audio)
+            if segment_wav is not None:
+                audio_url, blob_name = await transcriber.upload_audio_stream(
+                    segment_wav, segment_wav.getbuffer().nbytes, ".wav"
+                )
+            else:
+                audio_url, blob_name = await transcriber.upload_audio(segment_audio)
             blob_name_to_cleanup = blob_name
             logger.debug(f"Uploaded audio segment to Azure Blob Storage: {blob_name}")
             
-            # Create transcription job with Azure language identification enabled
-            # Uses "Single" mode (at-start detection) with configured candidate locales
-            random_suffix = ''.join(random.choices(string.ascii_letters + string.digits, k=6))
-            job = await transcriber.create_transcription(
-                audio_url=audio_url,
-                locale=candidate_locales[0] if candidate_locales else "en-US",  # Fallback locale
-                display_name=f"detect-lang-{random_suffix}",
-                candidate_locales=candidate_locales if candidate_locales else None
-            )
-            job_id_to_cleanup = job.id
-            logger.debug(f"Created language detection transcription job: {job.id} with candidates: {candidate_locales}")
-            
-            # Wait for completion
-            result = await transcriber.wait_for_transcription(job.id)
+            # Transcribe with language identification, in one Azure job shared
+            # with any other detection requests arriving at the same time
+            result = await _detect_in_batch(audio_url, blob_name)
             
             # Extract detected language from result
             if result.language:
@@ -338,22 +439,10 @@ async def detect_language(
             logger.info(f"Language detection complete: {detected_language.to_name()} ({language_code})")
             
         finally:
-            # Cleanup Azure resources
+            # Cleanup Azure resources after the response is sent; Bazarr does
+            # not need to wait for it
             if blob_name_to_cleanup:
-                try:
-                    await transcriber.delete_blob(blob_name_to_cleanup)
-                    logger.debug(f"Cleaned up blob: {blob_name_to_cleanup}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete blob {blob_name_to_cleanup}: {e}")
-            
-            if job_id_to_cleanup:
-                try:
-                    await transcriber.delete_transcription(job_id_to_cleanup)
-                    logger.debug(f"Cleaned up transcription job: {job_id_to_cleanup}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete transcription job {job_id_to_cleanup}: {e}")
-            
-            await transcriber.close()
+                background_tasks.add_task(_cleanup_detect_upload, transcriber, blob_name_to_cleanup)
             
     except Exception as e:
         error_msg = f"Error detecting language for Bazarr file: {video_file}" if video_file else "Error detecting language for Bazarr file"
@@ -367,10 +456,11 @@ async def detect_language(
     finally:
         # Cleanup temp files
         await audio_file.close()
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temp dir {temp_dir}: {e}")
+        if temp_dir:
+            try:
+                shutil.rmtree(temp_dir)
+            except Exception as e:
+                logger.warning(f"Failed to cleanup temp dir {temp_dir}: {e}")
         
         # Cleanup segment audio
         if segment_audio:
@@ -385,15 +475,144 @@ async def detect_language(
     }
 
 
-def _srt_to_vtt(srt_content: str) -> str:
-    """Convert SRT format to WebVTT format."""
-    lines = srt_content.strip().split('\n')
-    vtt_lines = ["WEBVTT", ""]
+async def _cleanup_detect_upload(transcriber: AzureBatchTranscriber, blob_name: str) -> None:
+    """Delete a detect-language segment blob."""
+    try:
+        await transcriber.delete_blob(blob_name)
+        logger.debug(f"Cleaned up blob: {blob_name}")
+    except Exception as e:
+        logger.warning(f"Failed to delete blob {blob_name}: {e}")
+
+
+def _language_hint(language: Optional[str], accept_language: Optional[str]) -> LanguageCode:
+    """
+    Resolve a client-supplied language hint.
+    
+    The ``language`` query parameter wins; otherwise the first tag of the
+    Accept-Language header is used (``nl-BE,nl;q=0.9`` -> Dutch).
+    """
+    if language:
+        lang_code = LanguageCode.from_string(language)
+        if lang_code != LanguageCode.NONE:
+            return lang_code
+    if accept_language:
+        first_tag = accept_language.split(',')[0].split(';')[0].strip()
+        return LanguageCode.from_string(first_tag.split('-')[0])
+    return LanguageCode.NONE
+
+
+async def _detect_in_batch(audio_url: str, blob_name: str) -> TranscriptionResult:
+    """
+    Run language identification on an uploaded segment, batched with concurrent requests.
     
-    for line in lines:
-        # Replace comma with dot in timestamps
-        if ' --> ' in line:
-            line = line.replace(',', '.')
-        vtt_lines.append(line)
+    The first request of a burst starts a DETECT_BATCH_WINDOW timer; every
+    segment queued before it fires is transcribed by the same Azure job.
+    """
+    future: "asyncio.Future[TranscriptionResult]" = asyncio.get_running_loop().create_future()
+    if not _pending_detections:
+        task = asyncio.create_task(_run_detect_batches())
+        _detect_batch_tasks.add(task)
+        task.add_done_callback(_detect_batch_tasks.discard)
+    _pending_detections.append((blob_name, audio_url, future))
+    # Shielded: one request going away must not cancel the shared job
+    return await asyncio.shield(future)
+
+
+async def _run_detect_batches() -> None:
+    """Wait for the batch window to close, then detect all queued segments."""
+    await asyncio.sleep(DETECT_BATCH_WINDOW)
+    pending = _pending_detections[:]
+    _pending_detections.clear()
+    await asyncio.gather(*(
+        _detect_batch(pending[i:i + DETECT_BATCH_MAX_SIZE])
+        for i in range(0, len(pending), DETECT_BATCH_MAX_SIZE)
+    ))
+
+
+async def _detect_batch(batch: List[Tuple[str, str, "asyncio.Future[TranscriptionResult]"]]) -> None:
+    """Transcribe one batch of segments in a single Azure job and resolve their futures."""
+    # Get candidate locales from config for language identification
+    settings = get_settings()
+    candidate_locales_str = settings.transcription.language_detection_candidates
+    candidate_locales = [loc.strip() for loc in candidate_locales_str.split(',') if loc.strip()]
+    
+    transcriber = get_transcriber()
+    job_id: Optional[str] = None
     
-    return '\n'.join(vtt_lines)
+    try:
+        # Create transcription job with Azure language identification enabled
+        # Uses "Single" mode (at-start detection) with configured candidate locales
+        random_suffix = os.urandom(3).hex()
+        job = await transcriber.create_transcription(
+            audio_url=[audio_url for _, audio_url, _ in batch],
+            locale=candidate_locales[0] if candidate_locales else "en-US",  # Fallback locale
+            display_name=f"detect-lang-{random_suffix}",
+            candidate_locales=candidate_locales if candidate_locales else None
+        )
+        job_id = job.id
+        logger.debug(
+            f"Created language detection transcription job: {job.id} for {len(batch)} segment(s) "
+            f"with candidates: {candidate_locales}"
+        )
+        
+        # Wait for completion, then match each result to its segment by blob name
+        await transcriber.wait_for_completion(job.id, min_poll_interval=DETECT_MIN_POLL_INTERVAL)
+        results = await transcriber.get_transcription_results(job.id, locale=job.locale)
+        
+        for blob_name, _, future in batch:
+            result = next((r for source, r in results.items() if source.endswith(blob_name)), None)
+            if future.done():
+                continue
+            if result is None:
+                future.set_exception(RuntimeError(f"No language detection result returned for {blob_name}"))
+            else:
+                future.set_result(result)
+    
+    except Exception as e:
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+    
+    finally:
+        if job_id:
+            try:
+                await transcriber.delete_transcription(job_id)
+                logger.debug(f"Cleaned up transcription job: {job_id}")
+            except Exception as e:
+                logger.warning(f"Failed to delete transcription job {job_id}: {e}")
+
+
+def _wav_header(data_size: int, sample_rate: int, channels: int, sample_width: int) -> bytes:
+    """Build the 44-byte RIFF/WAVE header for a PCM data chunk of data_size bytes."""
+    block_align = channels * sample_width
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sample_width * 8,
+        b'data', data_size,
+    )
+
+
+def _read_wav_segment(source: Union[str, BinaryIO], offset: int, duration: int) -> Optional[bytes]:
+    """
+    Read a segment of a WAV file that is already 16 kHz mono 16-bit PCM.
+    
+    Returns None when the file is not a WAV in that format, so the caller
+    falls back to ffmpeg.
+    """
+    try:
+        with wave.open(source, 'rb') as wav:
+            if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) != (16000, 1, 2):
+                return None
+            start_frame = offset * 16000
+            if wav.getnframes() > start_frame:
+                wav.setpos(start_frame)
+            return wav.readframes(duration * 16000)
+    except (wave.Error, EOFError):
+        return None
+
+
+def _srt_to_vtt(srt_content: str) -> str:
+    """Convert SRT format to WebVTT format."""
+    # Only timing lines change: the millisecond comma becomes a dot
+    return "WEBVTT\n\n" + _SRT_TIMING_RE.sub(r"\1.\2.\3", srt_content.strip())
@@ -12,13 +12,18 @@ so both UI batch jobs and Bazarr ASR jobs appear in the same list.
 
 import asyncio
 import logging
+import os
+import time
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 from app.config import get_settings
@@ -26,13 +31,30 @@ from app.transcription_service import JobSource
 from app.transcription_service import JobStatus as ServiceJobStatus
 from app.transcription_service import (TranscriptionJob, TranscriptionService,
                                        TranscriptionSession)
-from app.utils.bazarr_client import BazarrClient
+from app.utils.audio_extractor import (MEDIA_EXTENSIONS, find_media_files,
+                                       is_audio_file)
+from app.utils.bazarr_client import get_bazarr_client
+from app.utils.media_server_client import JellyfinClient, PlexClient
 from app.utils.skip_checker import should_skip_file
 from app.utils.subtitle_utils import get_srt_path
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/batch", tags=["Batch Processing"])
 
+# Maximum skip checks (subtitle lookups, ffprobe) run at once per submission
+SKIP_CHECK_CONCURRENCY = 32
+
+# Maximum Bazarr disk scans triggered at once when a session completes
+BAZARR_SCAN_CONCURRENCY = 10
+
+# Serialized /session/{id} responses are reused for this long (seconds) while
+# the session's version is unchanged, so several open UI tabs share one build
+STATUS_CACHE_TTL = 0.5
+_status_cache: Dict[str, Tuple[float, int, bytes]] = {}
+
+# Service statuses reported as "in progress" in session summaries
+_IN_PROGRESS_STATUSES = (ServiceJobStatus.EXTRACTING, ServiceJobStatus.UPLOADING, ServiceJobStatus.TRANSCRIBING)
+
 
 # Local JobStatus enum for API responses (maps to ServiceJobStatus)
 class JobStatus(str, Enum):
@@ -48,16 +70,19 @@ class JobStatus(str, Enum):
     @classmethod
     def from_service_status(cls, status: ServiceJobStatus) -> "JobStatus":
         """Convert from TranscriptionService status."""
-        mapping = {
-            ServiceJobStatus.PENDING: cls.PENDING,
-            ServiceJobStatus.EXTRACTING: cls.EXTRACTING,
-            ServiceJobStatus.UPLOADING: cls.UPLOADING,
-            ServiceJobStatus.TRANSCRIBING: cls.TRANSCRIBING,
-            ServiceJobStatus.COMPLETED: cls.COMPLETED,
-            ServiceJobStatus.FAILED: cls.FAILED,
-            ServiceJobStatus.CANCELLED: cls.CANCELLED,
-        }
-        return mapping.get(status, cls.PENDING)
+        return _SERVICE_TO_LOCAL_STATUS.get(status, cls.PENDING)
+
+
+# Service status -> local status, built once (from_service_status runs per job)
+_SERVICE_TO_LOCAL_STATUS: Dict[ServiceJobStatus, JobStatus] = {
+    ServiceJobStatus.PENDING: JobStatus.PENDING,
+    ServiceJobStatus.EXTRACTING: JobStatus.EXTRACTING,
+    ServiceJobStatus.UPLOADING: JobStatus.UPLOADING,
+    ServiceJobStatus.TRANSCRIBING: JobStatus.TRANSCRIBING,
+    ServiceJobStatus.COMPLETED: JobStatus.COMPLETED,
+    ServiceJobStatus.FAILED: JobStatus.FAILED,
+    ServiceJobStatus.CANCELLED: JobStatus.CANCELLED,
+}
 
 
 @dataclass
@@ -92,11 +117,6 @@ def _get_sessions() -> Dict[str, TranscriptionSession]:
     return TranscriptionService._sessions
 
 
-# Local cache for batch-specific data (skipped files, etc.)
-# Maps session_id -> {skipped: [], notify_bazarr: bool}
-_batch_metadata: Dict[str, dict] = {}
-
-
 # Request/Response models
 class BatchSubmitRequest(BaseModel):
     """Request to submit files for batch processing."""
@@ -150,23 +170,21 @@ class SessionStatusResponse(BaseModel):
     skipped: List[dict] = []  # Skipped files from submission
 
 
+# Human-readable text shown in the UI for each job status
+_STATUS_TEXT: Dict[JobStatus, str] = {
+    JobStatus.PENDING: "Waiting...",
+    JobStatus.EXTRACTING: "Extracting audio",
+    JobStatus.UPLOADING: "Uploading to Azure",
+    JobStatus.TRANSCRIBING: "Transcribing",
+    JobStatus.COMPLETED: "Completed",
+    JobStatus.FAILED: "Failed",
+    JobStatus.CANCELLED: "Cancelled",
+}
+
+
 def get_status_text(status: JobStatus, progress: int) -> str:
-    """Get human-readable status text for a job."""
-    if status == JobStatus.PENDING:
-        return "Waiting..."
-    elif status == JobStatus.EXTRACTING:
-        return "Extracting audio"
-    elif status == JobStatus.UPLOADING:
-        return "Uploading to Azure"
-    elif status == JobStatus.TRANSCRIBING:
-        return "Transcribing"
-    elif status == JobStatus.COMPLETED:
-        return "Completed"
-    elif status == JobStatus.FAILED:
-        return "Failed"
-    elif status == JobStatus.CANCELLED:
-        return "Cancelled"
-    return ""
+    """Get human-readable status text for a job (progress is currently unused)."""
+    return _STATUS_TEXT.get(status, "")
 
 
 async def _notify_bazarr_for_completed_jobs(session_id: str, session: TranscriptionSession):
@@ -180,45 +198,65 @@ async def _notify_bazarr_for_completed_jobs(session_id: str, session: Transcript
     
     Falls back to full disk scan if no specific items found.
     """
-    from app.utils.audio_extractor import is_audio_file
-    
-    settings = get_settings()
-    bazarr = BazarrClient(settings.bazarr.url, settings.bazarr.api_key)
+    bazarr = get_bazarr_client()
     
     try:
         # Collect completed file paths, excluding audio files (Bazarr is for video subtitles only)
         completed_paths = [
             job.file_path for job in session.jobs.values()
-            if job.status == JobStatus.COMPLETED and not is_audio_file(job.file_path)
+            if job.status == JobStatus.COMPLETED and job.is_video
         ]
         
         if not completed_paths:
             logger.debug(f"[{session_id}] No completed video jobs, skipping Bazarr notification")
             return
         
-        # Track unique series/movie IDs to avoid duplicate scans
+        # Track unique series/movie IDs to avoid duplicate scans. Lookups are
+        # served from the client's cached catalogs, so only the first one per
+        # kind makes an HTTP request. Series are indexed by folder, so other
+        # files in a folder that matched a series (episodes of a season) are
+        # skipped; movie records may point at the file itself, so movies are
+        # always looked up per file
         scanned_series: set = set()
         scanned_movies: set = set()
+        series_folders: set = set()
         
         for path in completed_paths:
+            folder = os.path.dirname(path)
+            if folder in series_folders:
+                continue
+            
             # Try to find matching series
             series = await bazarr.search_series_by_path(path)
             if series:
                 series_id = series.get('sonarrSeriesId')
-                if series_id and series_id not in scanned_series:
-                    await bazarr.trigger_series_scan(series_id)
+                if series_id:
                     scanned_series.add(series_id)
-                    logger.info(f"[{session_id}] Bazarr: Triggered disk scan for series {series_id}")
+                series_folders.add(folder)
                 continue
             
             # Try to find matching movie
             movie = await bazarr.search_movie_by_path(path)
             if movie:
                 movie_id = movie.get('radarrId')
-                if movie_id and movie_id not in scanned_movies:
-                    await bazarr.trigger_movie_scan(movie_id)
+                if movie_id:
                     scanned_movies.add(movie_id)
-                    logger.info(f"[{session_id}] Bazarr: Triggered disk scan for movie {movie_id}")
+        
+        # Trigger the targeted scans concurrently (bounded)
+        scan_semaphore = asyncio.Semaphore(BAZARR_SCAN_CONCURRENCY)
+        
+        async def scan(kind: str, item_id: int) -> None:
+            async with scan_semaphore:
+                if kind == 'series':
+                    await bazarr.trigger_series_scan(item_id)
+                else:
+                    await bazarr.trigger_movie_scan(item_id)
+            logger.info(f"[{session_id}] Bazarr: Triggered disk scan for {kind} {item_id}")
+        
+        await asyncio.gather(
+            *(scan('series', series_id) for series_id in scanned_series),
+            *(scan('movie', movie_id) for movie_id in scanned_movies),
+        )
         
         total_scans = len(scanned_series) + len(scanned_movies)
         if total_scans > 0:
@@ -234,8 +272,6 @@ async def _notify_bazarr_for_completed_jobs(session_id: str, session: Transcript
             
     except Exception as e:
         logger.warning(f"[{session_id}] Failed to notify Bazarr: {e}")
-    finally:
-        await bazarr.close()
 
 
 async def _refresh_media_servers_for_completed_jobs(session_id: str, session: TranscriptionSession):
@@ -246,10 +282,6 @@ async def _refresh_media_servers_for_completed_jobs(session_id: str, session: Tr
     - Plex: One partial scan per unique parent directory
     - Jellyfin/Emby: One refresh per unique parent directory
     """
-    from pathlib import Path
-
-    from app.utils.media_server_client import JellyfinClient, PlexClient
-    
     settings = get_settings()
     
     # Collect completed file paths
@@ -382,33 +414,35 @@ async def process_batch_session(session_id: str):
         logger.error(f"Session not found for processing: {session_id}")
         return
     
-    metadata = _batch_metadata.get(session_id, {})
-    
     # Process jobs using the global transcription semaphore
     # This ensures the limit is enforced across ALL sessions, not per-session
     # Bazarr jobs get priority through TranscriptionService.acquire_transcription_slot(priority=True)
-    async def process_with_global_semaphore(job_id: str):
-        try:
-            # Acquire global transcription slot (normal priority for batch jobs)
-            await TranscriptionService.acquire_transcription_slot(priority=False)
-            try:
-                await process_batch_job(session_id, job_id)
-            finally:
-                await TranscriptionService.release_transcription_slot()
-        except Exception as e:
-            logger.exception(f"[{job_id}] Failed in batch processing: {e}")
+    settings = get_settings()
+    pending_job_ids = iter(list(session.jobs))
     
-    # Start all jobs - they'll wait for global slots as needed
-    tasks = [process_with_global_semaphore(job_id) for job_id in session.jobs.keys()]
-    await asyncio.gather(*tasks, return_exceptions=True)
+    async def worker():
+        # Workers share one iterator, so each job is taken exactly once
+        for job_id in pending_job_ids:
+            try:
+                # Acquire global transcription slot (normal priority for batch jobs)
+                await TranscriptionService.acquire_transcription_slot(priority=False)
+                try:
+                    await process_batch_job(session_id, job_id)
+                finally:
+                    await TranscriptionService.release_transcription_slot()
+            except Exception as e:
+                logger.exception(f"[{job_id}] Failed in batch processing: {e}")
+    
+    # A session can never run more jobs at once than there are global slots, so
+    # that many workers suffice instead of one waiting task per job
+    worker_count = min(max(settings.concurrent_transcriptions, 1), len(session.jobs))
+    await asyncio.gather(*(worker() for _ in range(worker_count)))
     
     # Refresh media servers (Plex, Jellyfin, Emby) - batched at end of session
     await _refresh_media_servers_for_completed_jobs(session_id, session)
     
     # Notify Bazarr if configured (smart scan based on completed files)
-    notify_bazarr = metadata.get('notify_bazarr', True)
-    settings = get_settings()
-    if notify_bazarr and settings.bazarr.is_configured:
+    if session.notify_bazarr and settings.bazarr.is_configured:
         await _notify_bazarr_for_completed_jobs(session_id, session)
 
 
@@ -423,18 +457,13 @@ async def submit_batch(request: BatchSubmitRequest, background_tasks: Background
     Returns:
         Session ID and job information.
     """
-    # Import media extensions from audio_extractor for consistency
-    from app.utils.audio_extractor import (AUDIO_EXTENSIONS, MEDIA_EXTENSIONS,
-                                           VIDEO_EXTENSIONS)
-
-    # Expand folders to individual files
+    # Expand folders to individual files (video and audio), one tree walk per
+    # folder in a worker thread so the event loop keeps serving requests
     all_files = list(request.files)
-    for folder_path in request.folders:
-        folder = Path(folder_path)
-        if folder.exists() and folder.is_dir():
-            # Recursively find all media files (video and audio)
-            for ext in MEDIA_EXTENSIONS:
-                all_files.extend(str(f) for f in folder.rglob(f"*{ext}"))
+    for folder_files in await asyncio.gather(
+        *(asyncio.to_thread(find_media_files, folder_path) for folder_path in request.folders)
+    ):
+        all_files.extend(folder_files)
     
     if not all_files:
         raise HTTPException(status_code=400, detail="No files or folders provided")
@@ -445,7 +474,7 @@ async def submit_batch(request: BatchSubmitRequest, background_tasks: Background
     skipped_not_found = 0
     skipped_not_video = 0
     skipped_by_config = 0
-    valid_files = []
+    candidates = []
     
     for file_path in all_files:
         path = Path(file_path)
@@ -464,17 +493,29 @@ async def submit_batch(request: BatchSubmitRequest, background_tasks: Background
             skipped_files.append({"file_path": file_path, "reason": "Not a media file"})
             continue
         
-        # Apply skip configuration if enabled (UI checkbox controls this)
-        # This checks: existing subtitles, internal subs, audio language, etc.
-        if request.should_apply_skip_logic:
-            skip_result = await should_skip_file(file_path, request.language)
+        candidates.append(file_path)
+    
+    # Apply skip configuration if enabled (UI checkbox controls this)
+    # This checks: existing subtitles, internal subs, audio language, etc.
+    # Checks run concurrently (bounded), since each may stat files or run ffprobe
+    valid_files = []
+    if request.should_apply_skip_logic and candidates:
+        skip_semaphore = asyncio.Semaphore(SKIP_CHECK_CONCURRENCY)
+        
+        async def check(file_path: str):
+            async with skip_semaphore:
+                return await should_skip_file(file_path, request.language)
+        
+        skip_results = await asyncio.gather(*(check(file_path) for file_path in candidates))
+        for file_path, skip_result in zip(candidates, skip_results):
             if skip_result.should_skip:
-                logger.info(f"Skip config: {path.name} - {skip_result.reason}")
+                logger.info(f"Skip config: {Path(file_path).name} - {skip_result.reason}")
                 skipped_by_config += 1
                 skipped_files.append({"file_path": file_path, "reason": skip_result.reason or "Skipped by configuration"})
-                continue
-        
-        valid_files.append(file_path)
+            else:
+                valid_files.append(file_path)
+    else:
+        valid_files = candidates
     
     if not valid_files:
         # Provide descriptive error message based on why files were skipped
@@ -510,6 +551,7 @@ async def submit_batch(request: BatchSubmitRequest, background_tasks: Background
             file_path=file_path,
             language=request.language,
             source=JobSource.UI,
+            is_video=not is_audio_file(file_path),
         )
         jobs_info.append({
             "id": job.id,
@@ -517,11 +559,9 @@ async def submit_batch(request: BatchSubmitRequest, background_tasks: Background
             "status": JobStatus.from_service_status(job.status).value,
         })
     
-    # Store batch-specific metadata (skipped files, notify_bazarr)
-    _batch_metadata[session.id] = {
-        'skipped': skipped_files,
-        'notify_bazarr': request.notify_bazarr,
-    }
+    # Skipped files are kept on the session (notify_bazarr was set on creation)
+    session.skipped = skipped_files
+    session.version += 1
     
     # Start background processing
     background_tasks.add_task(process_batch_session, session.id)
@@ -541,50 +581,51 @@ async def get_session_status(session_id: str):
     """Get status of a batch session."""
     session = TranscriptionService.get_session(session_id)
     if not session:
+        _status_cache.pop(session_id, None)
         raise HTTPException(status_code=404, detail="Session not found")
     
-    metadata = _batch_metadata.get(session_id, {})
-    
-    # Count jobs by status (convert from service status to local status)
-    pending = sum(1 for j in session.jobs.values() 
-                  if j.status == ServiceJobStatus.PENDING)
-    in_progress = sum(1 for j in session.jobs.values() 
-                      if j.status in (ServiceJobStatus.EXTRACTING, ServiceJobStatus.UPLOADING, ServiceJobStatus.TRANSCRIBING))
-    completed = sum(1 for j in session.jobs.values() 
-                    if j.status == ServiceJobStatus.COMPLETED)
-    failed = sum(1 for j in session.jobs.values() 
-                 if j.status == ServiceJobStatus.FAILED)
-    cancelled = sum(1 for j in session.jobs.values() 
-                    if j.status == ServiceJobStatus.CANCELLED)
-    
-    jobs = [
-        JobStatusResponse(
-            id=job.id,
-            file_path=job.file_path,
-            status=JobStatus.from_service_status(job.status).value,
-            status_text=get_status_text(JobStatus.from_service_status(job.status), 0),
-            progress=0,
-            error=job.error,
-            srt_path=job.srt_path,
-        )
-        for job in session.jobs.values()
-    ]
+    now = time.monotonic()
+    cached = _status_cache.get(session_id)
+    if cached and cached[1] == session.version and now - cached[0] < STATUS_CACHE_TTL:
+        return Response(content=cached[2], media_type="application/json")
+    
+    # Build the job list and count jobs by status in a single pass
+    counts: Counter = Counter()
+    jobs = []
+    for job in session.jobs.values():
+        counts[job.status] += 1
+        local_status = JobStatus.from_service_status(job.status)
+        jobs.append({
+            "id": job.id,
+            "file_path": job.file_path,
+            "status": local_status.value,
+            "status_text": get_status_text(local_status, 0),
+            "progress": 0,
+            "error": job.error,
+            "srt_path": job.srt_path,
+        })
+    in_progress = sum(counts[status] for status in _IN_PROGRESS_STATUSES)
     
     # Get session source (fallback to 'ui' for backwards compatibility)
     session_source = session.source.value if hasattr(session, 'source') else "ui"
     
-    return SessionStatusResponse(
-        session_id=session_id,
-        source=session_source,
-        total_jobs=len(session.jobs),
-        pending=pending,
-        in_progress=in_progress,
-        completed=completed,
-        failed=failed,
-        cancelled=cancelled,
-        jobs=jobs,
-        skipped=metadata.get('skipped', []),
-    )
+    # Serialized directly: the UI polls this endpoint, and validating every job
+    # against the response model on each poll costs more than building it.
+    # The fields match SessionStatusResponse, which still documents the endpoint.
+    body = orjson.dumps({
+        "session_id": session_id,
+        "source": session_source,
+        "total_jobs": len(session.jobs),
+        "pending": counts[ServiceJobStatus.PENDING],
+        "in_progress": in_progress,
+        "completed": counts[ServiceJobStatus.COMPLETED],
+        "failed": counts[ServiceJobStatus.FAILED],
+        "cancelled": counts[ServiceJobStatus.CANCELLED],
+        "jobs": jobs,
+        "skipped": session.skipped,
+    })
+    _status_cache[session_id] = (now, session.version, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/job/{session_id}/{job_id}", response_model=JobStatusResponse)
@@ -618,8 +659,7 @@ async def delete_session(session_id: str):
         raise HTTPException(status_code=404, detail="Session not found")
     
     await TranscriptionService.delete_session(session_id)
-    if session_id in _batch_metadata:
-        del _batch_metadata[session_id]
+    _status_cache.pop(session_id, None)
     return {"status": "deleted", "session_id": session_id}
 
 
@@ -656,18 +696,11 @@ async def list_sessions():
     all_sessions = TranscriptionService.list_all_sessions()
     
     for session in all_sessions:
-        completed = sum(1 for j in session.jobs.values() 
-                        if j.status == ServiceJobStatus.COMPLETED)
-        failed = sum(1 for j in session.jobs.values() 
-                     if j.status == ServiceJobStatus.FAILED)
-        cancelled = sum(1 for j in session.jobs.values() 
-                        if j.status == ServiceJobStatus.CANCELLED)
-        
-        metadata = _batch_metadata.get(session.id, {})
-        
-        # Include full job details for UI restoration
+        # Include full job details for UI restoration, counting statuses in the same pass
+        counts = Counter()
         jobs = []
         for job_id, job in session.jobs.items():
+            counts[job.status] += 1
             local_status = JobStatus.from_service_status(job.status)
             jobs.append({
                 "id": job_id,
@@ -682,11 +715,12 @@ async def list_sessions():
             "session_id": session.id,
             "source": session.source.value if hasattr(session, 'source') else "ui",
             "total_jobs": len(session.jobs),
-            "completed": completed,
-            "failed": failed,
-            "cancelled": cancelled,
+            "completed": counts[ServiceJobStatus.COMPLETED],
+            "failed": counts[ServiceJobStatus.FAILED],
+            "cancelled": counts[ServiceJobStatus.CANCELLED],
             "created_at": session.created_at.isoformat(),
             "jobs": jobs,
         })
     
-    return {"sessions": sessions}
+    # Serialized directly (no jsonable_encoder pass over every job on each poll)
+    return Response(content=orjson.dumps({"sessions": sessions}), media_type="application/json")
@@ -177,6 +177,8 @@ async def check_status():
     Returns connection status for both services, including any error messages.
     """
     import aiohttp
+
+    from app.utils.http_session import get_shared_session
     settings = get_settings()
     
     # Check Speech Service
@@ -187,12 +189,12 @@ async def check_status():
             # Test the speech service by getting a token
             url = f"https://{settings.azure.speech_region}.api.cognitive.microsoft.com/sts/v1.0/issueToken"
             headers = {"Ocp-Apim-Subscription-Key": settings.azure.speech_key}
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        speech_status.connected = True
-                    else:
-                        speech_status.error = f"HTTP {resp.status}"
+            session = get_shared_session()
+            async with session.post(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status == 200:
+                    speech_status.connected = True
+                else:
+                    speech_status.error = f"HTTP {resp.status}"
         except Exception as e:
             speech_status.error = str(e)[:100]
     
@@ -238,9 +240,9 @@ async def test_notifications():
     
     Returns status for each configured notification service.
     """
-    from app.utils.notification_service import NotificationService
+    from app.utils.notification_service import get_notifier
     
-    notifier = NotificationService.get_instance()
+    notifier = get_notifier()
     
     if not notifier.config.is_configured:
         return {
@@ -262,9 +264,9 @@ async def get_notification_config():
     """
     Get notification configuration status (without sensitive data).
     """
-    from app.utils.notification_service import NotificationService
+    from app.utils.notification_service import get_notifier
     
-    notifier = NotificationService.get_instance()
+    notifier = get_notifier()
     config = notifier.config
     
     return {
@@ -8,20 +8,29 @@ Provides endpoints for receiving webhooks from:
 - Tautulli
 
 When a new media file is added, these webhooks trigger subtitle generation.
+
+Also receives Azure Speech transcription completion callbacks
+(when AZURE_USE_WEBHOOK is enabled).
 """
 
 import asyncio
+import base64
+import hashlib
+import hmac
 import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Form, HTTPException, Request
+from fastapi.responses import PlainTextResponse
 
 from app.config import get_settings
 from app.utils.audio_extractor import extract_audio
-from app.utils.azure_batch_transcriber import AzureBatchTranscriber
-from app.utils.bazarr_client import BazarrClient, notify_bazarr_of_new_subtitle
+from app.utils.azure_batch_transcriber import (
+    AzureBatchTranscriber, resolve_transcription_callback)
+from app.utils.bazarr_client import (get_bazarr_client,
+                                     notify_bazarr_of_new_subtitle)
 from app.utils.language_code import LanguageCode
 from app.utils.media_server_client import (JellyfinClient, PlexClient,
                                            refresh_all_configured_servers)
@@ -159,20 +168,12 @@ async def process_media_file(
                 try:
                     if media_type == "episode" and series_id:
                         # We have the Sonarr series ID, use it directly
-                        bazarr = BazarrClient(settings.bazarr.url, settings.bazarr.api_key)
-                        try:
-                            await bazarr.trigger_series_scan(series_id)
-                            logger.info(f"Notified Bazarr: series scan for ID {series_id}")
-                        finally:
-                            await bazarr.close()
+                        await get_bazarr_client().trigger_series_scan(series_id)
+                        logger.info(f"Notified Bazarr: series scan for ID {series_id}")
                     elif media_type == "movie" and movie_id:
                         # We have the Radarr movie ID, use it directly
-                        bazarr = BazarrClient(settings.bazarr.url, settings.bazarr.api_key)
-                        try:
-                            await bazarr.trigger_movie_scan(movie_id)
-                            logger.info(f"Notified Bazarr: movie scan for ID {movie_id}")
-                        finally:
-                            await bazarr.close()
+                        await get_bazarr_client().trigger_movie_scan(movie_id)
+                        logger.info(f"Notified Bazarr: movie scan for ID {movie_id}")
                     else:
                         # No ID available (e.g., from Plex/Jellyfin webhook)
                         # Use smart path-based lookup to find the series/movie
@@ -501,6 +502,49 @@ async def tautulli_webhook(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/azure")
+async def azure_speech_webhook(request: Request, validationToken: Optional[str] = None):
+    """
+    Handle Azure Speech batch transcription webhooks.
+    
+    Azure first validates the URL with a challenge carrying a validationToken
+    query parameter, which must be echoed back. Completion events contain the
+    transcription's 'self' link; the matching waiter is woken so it fetches the
+    result immediately instead of on its next poll.
+    """
+    if validationToken:
+        return PlainTextResponse(validationToken)
+    
+    settings = get_settings()
+    body = await request.body()
+    
+    if settings.azure.webhook_secret:
+        expected = base64.b64encode(
+            hmac.new(settings.azure.webhook_secret.encode(), body, hashlib.sha256).digest()
+        ).decode()
+        signature = request.headers.get("X-MicrosoftSpeechServices-Signature", "")
+        if not hmac.compare_digest(expected, signature):
+            raise HTTPException(status_code=401, detail="Invalid webhook signature")
+    
+    try:
+        payload = json.loads(body) if body else {}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    
+    # A signed body is still not guaranteed to be the expected event shape
+    self_link = payload.get("self", "") if isinstance(payload, dict) else None
+    if not isinstance(self_link, str):
+        raise HTTPException(status_code=400, detail="Invalid webhook payload")
+    
+    event = request.headers.get("X-MicrosoftSpeechServices-Event", "")
+    job_id = self_link.rstrip("/").rsplit("/", 1)[-1]
+    
+    resolved = resolve_transcription_callback(job_id) if job_id else False
+    logger.debug(f"Azure webhook {event or 'event'} for transcription {job_id or '?'} (waiter: {resolved})")
+    
+    return {"status": "ok"}
+
+
 @router.get("/status")
 async def webhook_status():
     """Get status of active webhook-triggered transcription jobs."""
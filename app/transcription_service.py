@@ -10,6 +10,7 @@ All transcription jobs are tracked in a unified session system for visibility.
 """
 
 import asyncio
+import contextlib
 import logging
 import os
 import time
@@ -18,12 +19,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import (AsyncIterator, Callable, Dict, List, Optional, Tuple,
+                    Union)
 
 from app.config import format_duration, get_settings
 from app.utils.audio_extractor import extract_audio, make_temp_dir
-from app.utils.azure_batch_transcriber import (AzureBatchTranscriber,
-                                               TranscriptionResult)
+from app.utils.azure_batch_transcriber import (
+    WEBHOOK_FALLBACK_POLL_INTERVAL, AzureBatchTranscriber, TranscriptionResult,
+    discard_callback, register_callback, resolve_transcription_callback,
+    wait_for_callback)
 from app.utils.language_code import LanguageCode
 
 logger = logging.getLogger(__name__)
@@ -73,6 +77,7 @@ class TranscriptionJob:
     duration_seconds: float = 0.0
     # Media server refresh tracking
     media_refresh_status: Optional[Dict[str, bool]] = None  # e.g., {"plex": True, "jellyfin": False}
+    is_video: bool = True  # Classified on submit; audio files are not reported to Bazarr
     
     def get_status_text(self) -> str:
         """Get human-readable status text."""
@@ -118,6 +123,8 @@ class TranscriptionSession:
     created_at: datetime = field(default_factory=datetime.now)
     source: JobSource = JobSource.UI
     notify_bazarr: bool = True
+    # Bumped whenever a job is added or changes state (lets pollers reuse snapshots)
+    version: int = 0
     
     def to_dict(self) -> dict:
         """Convert session to dictionary for API responses."""
@@ -276,6 +283,7 @@ class TranscriptionService:
         file_path: str,
         language: str,
         source: JobSource,
+        is_video: bool = True,
     ) -> TranscriptionJob:
         """Add a job to a session."""
         async with cls._lock:
@@ -289,8 +297,10 @@ class TranscriptionService:
                 file_path=file_path,
                 language=language,
                 source=source,
+                is_video=is_video,
             )
             session.jobs[job_id] = job
+            session.version += 1
             logger.debug(f"Added job {job_id} to session {session_id}")
             return job
     
@@ -306,6 +316,7 @@ class TranscriptionService:
         job = cls.get_job(session_id, job_id)
         if job:
             job.status = status
+            cls._sessions[session_id].version += 1
             for key, value in kwargs.items():
                 if hasattr(job, key):
                     setattr(job, key, value)
@@ -326,15 +337,14 @@ class TranscriptionService:
                 job.completed_at = datetime.now()
                 logger.error(f"[{job_id}] Failed: {job.file_path} - {job.error}")
                 
-                # Send failure notification (fire-and-forget, non-blocking)
+                # Queue failure notification (only enqueues; the Pushover call
+                # runs in the notifier's background digest task)
                 from app.utils.notification_service import notify_failure
-                asyncio.create_task(
-                    notify_failure(
-                        file_path=job.file_path,
-                        error=job.error or "Unknown error",
-                        job_id=job_id,
-                        source=job.source.value if job.source else None,
-                    )
+                await notify_failure(
+                    file_path=job.file_path,
+                    error=job.error or "Unknown error",
+                    job_id=job_id,
+                    source=job.source.value if job.source else None,
                 )
     
     @classmethod
@@ -350,30 +360,41 @@ class TranscriptionService:
     @classmethod
     async def transcribe_audio_data(
         cls,
-        audio_data: bytes,
+        audio_data: Optional[bytes],
         language: str,
         source: JobSource,
         file_name: str = "unknown",
         is_raw_pcm: bool = False,
         on_status_change: Optional[Callable] = None,
+        audio_path: Optional[str] = None,
+        audio_stream: Optional[AsyncIterator[bytes]] = None,
+        prep_semaphore: Optional[asyncio.Semaphore] = None,
     ) -> Tuple[TranscriptionResult, TranscriptionJob]:
         """
-        Transcribe audio data (bytes) - used by Bazarr ASR endpoint.
+        Transcribe audio data (bytes or a file) - used by Bazarr ASR endpoint.
         
         This method:
         1. Creates a session and job for tracking
-        2. Converts raw PCM to WAV if needed
-        3. Converts to OGG/Opus for efficient upload
-        4. Uploads to Azure and transcribes
-        5. Cleans up resources
+        2. Converts to OGG/Opus for efficient upload (reading raw PCM directly)
+        3. Uploads to Azure and transcribes
+        4. Cleans up resources
         
         Args:
-            audio_data: Raw audio bytes (WAV or raw PCM).
+            audio_data: Raw audio bytes (WAV or raw PCM), or None if audio_path is given.
             language: Language code (e.g., 'en', 'de').
             source: Source of the request.
             file_name: Original file name for logging.
-            is_raw_pcm: If True, audio_data is raw PCM (16-bit, 16kHz, mono).
+            is_raw_pcm: If True, the audio is raw PCM (16-bit, 16kHz, mono).
             on_status_change: Optional callback for status updates.
+            audio_path: Path to a file holding the audio, used instead of
+                audio_data so large uploads never have to be held in memory.
+                The file is left in place for the caller to remove.
+            audio_stream: Chunks of audio, used instead of audio_data/audio_path.
+                They are fed to ffmpeg as they are read, so encoding overlaps
+                reading the upload and no copy is written to disk. Only use
+                for input ffmpeg can read without seeking (e.g. raw PCM).
+            prep_semaphore: Optional semaphore held while the audio is converted
+                locally, bounding how many requests run ffmpeg at once.
             
         Returns:
             Tuple of (TranscriptionResult, TranscriptionJob).
@@ -397,29 +418,21 @@ class TranscriptionService:
             # Update status
             await cls.update_job_status(session.id, job.id, JobStatus.EXTRACTING)
             
-            # Save audio data to temp file
-            if is_raw_pcm:
-                # Wrap raw PCM in WAV container
-                import wave
-                wav_path = os.path.join(temp_dir, "audio.wav")
-                with wave.open(wav_path, 'wb') as wav_file:
-                    wav_file.setnchannels(1)  # mono
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(16000)  # 16kHz
-                    wav_file.writeframes(audio_data)
-                temp_audio = wav_path
-                logger.debug(f"[{job.id}] Created WAV from raw PCM: {len(audio_data)} bytes")
-            else:
-                # Save as-is (already in a container format)
-                temp_audio = os.path.join(temp_dir, "audio.wav")
-                with open(temp_audio, 'wb') as f:
-                    f.write(audio_data)
-            
             # Convert to OGG/Opus for smaller upload size
             ogg_path = os.path.join(temp_dir, "audio.ogg")
-            await cls._convert_to_ogg(temp_audio, ogg_path)
+            async with prep_semaphore or contextlib.nullcontext():
+                if audio_stream is not None:
+                    original_size = await cls._convert_stream_to_ogg(audio_stream, ogg_path, is_raw_pcm=is_raw_pcm)
+                else:
+                    # Save audio data to temp file (as-is; ffmpeg reads raw PCM directly)
+                    if audio_path is None:
+                        audio_path = os.path.join(temp_dir, "audio.pcm" if is_raw_pcm else "audio.wav")
+                        with open(audio_path, 'wb') as f:
+                            f.write(audio_data)
+                    
+                    await cls._convert_to_ogg(audio_path, ogg_path, is_raw_pcm=is_raw_pcm)
+                    original_size = os.path.getsize(audio_path)
             
-            original_size = len(audio_data)
             compressed_size = os.path.getsize(ogg_path)
             logger.info(f"[{job.id}] Audio compressed: {original_size:,} → {compressed_size:,} bytes ({100*compressed_size/original_size:.1f}%)")
             
@@ -667,52 +680,71 @@ class TranscriptionService:
         azure_job_id: str,
         job: TranscriptionJob,
     ) -> TranscriptionResult:
-        """Wait for transcription with periodic logging."""
+        """
+        Wait for transcription with periodic logging.
+        
+        With completion webhooks enabled, the wait between status checks ends as
+        soon as Azure calls back, and the fallback poll runs only every few minutes.
+        """
         settings = get_settings()
         poll_count = 0
-        max_polls = 360  # 1 hour at 10s intervals
+        if transcriber.webhook_url:
+            poll_interval = WEBHOOK_FALLBACK_POLL_INTERVAL
+            max_polls = int(3600 // WEBHOOK_FALLBACK_POLL_INTERVAL)  # 1 hour
+        else:
+            poll_interval = settings.job_poll_interval
+            max_polls = 360  # 1 hour at 10s intervals
         last_status = None
         last_log_time = time.time()
+        if transcriber.webhook_url:
+            register_callback(azure_job_id)
         
-        while poll_count < max_polls:
-            # Check if job was cancelled
-            if job.status == JobStatus.CANCELLED:
-                logger.info(f"[{job.id}] Job was cancelled, stopping poll loop")
-                raise TranscriptionCancelledError("Transcription was cancelled")
-            
-            azure_job = await transcriber.get_transcription_status(azure_job_id)
-            
-            # Log status changes
-            if azure_job.status.value != last_status:
-                logger.info(f"[{job.id}] Azure status: {azure_job.status.value}")
-                last_status = azure_job.status.value
-            
-            if azure_job.status.value == "Succeeded":
-                break
-            elif azure_job.status.value == "Failed":
-                raise Exception(azure_job.error_message or "Transcription failed")
-            
-            # Log progress periodically
-            current_time = time.time()
-            if current_time - last_log_time >= 30:
-                logger.info(f"[{job.id}] Transcribing... (poll {poll_count}/{max_polls})")
-                last_log_time = current_time
-            
-            await asyncio.sleep(settings.job_poll_interval)
-            poll_count += 1
+        try:
+            while poll_count < max_polls:
+                # Check if job was cancelled
+                if job.status == JobStatus.CANCELLED:
+                    logger.info(f"[{job.id}] Job was cancelled, stopping poll loop")
+                    raise TranscriptionCancelledError("Transcription was cancelled")
+                
+                azure_job = await transcriber.get_transcription_status(azure_job_id)
+                
+                # Log status changes
+                if azure_job.status.value != last_status:
+                    logger.info(f"[{job.id}] Azure status: {azure_job.status.value}")
+                    last_status = azure_job.status.value
+                
+                if azure_job.status.value == "Succeeded":
+                    break
+                elif azure_job.status.value == "Failed":
+                    raise Exception(azure_job.error_message or "Transcription failed")
+                
+                # Log progress periodically
+                current_time = time.time()
+                if current_time - last_log_time >= 30:
+                    logger.info(f"[{job.id}] Transcribing... (poll {poll_count}/{max_polls})")
+                    last_log_time = current_time
+                
+                if transcriber.webhook_url:
+                    await wait_for_callback(azure_job_id, poll_interval)
+                else:
+                    await asyncio.sleep(poll_interval)
+                poll_count += 1
+        finally:
+            discard_callback(azure_job_id)
         
         if poll_count >= max_polls:
             raise Exception("Transcription timed out")
         
-        return await transcriber.get_transcription_result(azure_job_id)
+        return await transcriber.get_transcription_result(azure_job_id, locale=azure_job.locale)
     
     @classmethod
-    async def _convert_to_ogg(cls, input_path: str, output_path: str):
-        """Convert audio to OGG/Opus format for efficient upload."""
-        import subprocess
-        
-        cmd = [
-            'ffmpeg', '-y',
+    def _ogg_command(cls, input_path: str, output_path: str, is_raw_pcm: bool = False) -> List[str]:
+        """Build the ffmpeg command converting input_path to OGG/Opus."""
+        cmd = ['ffmpeg', '-y']
+        if is_raw_pcm:
+            # Headerless input: 16-bit little-endian, 16kHz, mono
+            cmd += ['-f', 's16le', '-ar', '16000', '-ac', '1']
+        cmd += [
             '-i', input_path,
             '-vn',  # No video
             '-acodec', 'libopus',
@@ -721,9 +753,13 @@ class TranscriptionService:
             '-b:a', '64k',
             output_path
         ]
-        
+        return cmd
+    
+    @classmethod
+    async def _convert_to_ogg(cls, input_path: str, output_path: str, is_raw_pcm: bool = False):
+        """Convert audio to OGG/Opus format for efficient upload."""
         process = await asyncio.create_subprocess_exec(
-            *cmd,
+            *cls._ogg_command(input_path, output_path, is_raw_pcm),
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
@@ -732,6 +768,49 @@ class TranscriptionService:
         if process.returncode != 0:
             raise RuntimeError(f"FFmpeg conversion failed: {stderr.decode()}")
     
+    @classmethod
+    async def _convert_stream_to_ogg(
+        cls, chunks: AsyncIterator[bytes], output_path: str, is_raw_pcm: bool = False
+    ) -> int:
+        """
+        Convert audio to OGG/Opus, feeding ffmpeg's stdin chunk by chunk.
+        
+        Returns:
+            Number of input bytes read from chunks.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cls._ogg_command('pipe:0', output_path, is_raw_pcm),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        # Drained concurrently, so ffmpeg can never block on a full stderr pipe
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        size = 0
+        
+        try:
+            try:
+                async for chunk in chunks:
+                    process.stdin.write(chunk)
+                    await process.stdin.drain()
+                    size += len(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # ffmpeg exited early; its error is reported below
+            process.stdin.close()
+            stderr = await stderr_task
+            await process.wait()
+        except BaseException:
+            # Reading the upload failed or was cancelled: stop ffmpeg
+            stderr_task.cancel()
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"FFmpeg conversion failed: {stderr.decode()}")
+        return size
+    
     @classmethod
     def _get_azure_locale(cls, language: str) -> str:
         """Convert language code to Azure locale."""
@@ -790,9 +869,14 @@ class TranscriptionService:
                                   JobStatus.UPLOADING, JobStatus.TRANSCRIBING):
                     job.status = JobStatus.CANCELLED
                     job.completed_at = datetime.now()
+                    session.version += 1
                     cancelled_count += 1
                     logger.info(f"[Session {session_id}] [{job.id}] Cancelled job")
                     
+                    # Wake a poll loop that is waiting on a completion webhook
+                    if job.azure_job_id:
+                        resolve_transcription_callback(job.azure_job_id)
+                    
                     # Try to cleanup Azure blob if uploaded
                     if job.blob_name:
                         try:
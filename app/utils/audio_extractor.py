@@ -10,7 +10,7 @@ import os
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from app.config import get_settings
 
@@ -42,36 +42,66 @@ def make_temp_dir(prefix: str = "subgen_") -> str:
 
 
 # Supported video file extensions (from original subgen.py)
-VIDEO_EXTENSIONS = {
+VIDEO_EXTENSIONS = frozenset({
     '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mpg', '.mpeg',
     '.3gp', '.ogv', '.vob', '.rm', '.rmvb', '.ts', '.m4v', '.f4v', '.svq3',
     '.asf', '.m2ts', '.divx', '.xvid'
-}
+})
 
 # Supported audio file extensions (from original subgen.py)
-AUDIO_EXTENSIONS = {
+AUDIO_EXTENSIONS = frozenset({
     '.mp3', '.wav', '.aac', '.flac', '.ogg', '.wma', '.alac', '.m4a', '.opus',
     '.aiff', '.aif', '.pcm', '.ra', '.ram', '.mid', '.midi', '.ape', '.wv',
     '.amr', '.vox', '.tak', '.spx', '.m4b', '.mka'
-}
+})
 
-# All supported media extensions
+# All supported media extensions (frozensets: immutable, O(1) membership)
 MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
 
 
 def is_video_file(path: str) -> bool:
     """Check if file is a video file."""
-    return Path(path).suffix.lower() in VIDEO_EXTENSIONS
+    return os.path.splitext(path)[1].lower() in VIDEO_EXTENSIONS
 
 
 def is_audio_file(path: str) -> bool:
     """Check if file is an audio file."""
-    return Path(path).suffix.lower() in AUDIO_EXTENSIONS
+    return os.path.splitext(path)[1].lower() in AUDIO_EXTENSIONS
 
 
 def is_media_file(path: str) -> bool:
     """Check if file is a supported media file."""
-    return Path(path).suffix.lower() in MEDIA_EXTENSIONS
+    return os.path.splitext(path)[1].lower() in MEDIA_EXTENSIONS
+
+
+def find_media_files(folder: str) -> List[str]:
+    """
+    Recursively find all supported media files under a folder.
+    
+    Walks the tree once with os.scandir (instead of one glob per extension).
+    Blocking; call it via asyncio.to_thread from async code.
+    
+    Args:
+        folder: Directory to search. A missing or non-directory path yields [].
+        
+    Returns:
+        Sorted list of media file paths.
+    """
+    found = []
+    stack = [folder]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # Like Path.rglob, don't descend into symlinked dirs (loops)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in MEDIA_EXTENSIONS:
+                        found.append(entry.path)
+        except OSError as e:
+            logger.warning(f"Cannot scan folder: {e}")
+    found.sort()
+    return found
 
 
 async def get_media_duration(file_path: str) -> float:
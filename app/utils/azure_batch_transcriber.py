@@ -10,31 +10,224 @@ It provides async methods for:
 """
 
 import asyncio
+import io
 import logging
 import os
+import time
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 import aiohttp
+import orjson
 
 try:
     from azure.core.exceptions import AzureError
-    from azure.storage.blob import (BlobSasPermissions, BlobServiceClient,
-                                    generate_blob_sas)
+    from azure.core.pipeline.transport import AioHttpTransport
+    from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+    from azure.storage.blob.aio import BlobServiceClient, ContainerClient
     AZURE_STORAGE_AVAILABLE = True
 except ImportError:
     AZURE_STORAGE_AVAILABLE = False
     AzureError = Exception  # Fallback for type hints
     logging.warning("azure-storage-blob not installed. Blob storage features will not work.")
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 from app.config import get_settings
+from app.utils.http_session import get_shared_session as _get_shared_session
+from app.utils.subtitle_utils import seconds_to_srt_time
 
 logger = logging.getLogger(__name__)
 
 
+# Futures woken by the /webhook/azure endpoint, keyed by transcription job ID
+_callback_futures: Dict[str, asyncio.Future] = {}
+# (region, webUrl) pairs already registered with Azure by this process
+_registered_webhooks: set = set()
+
+# With webhooks enabled, job status is still checked this often in case a callback is lost
+WEBHOOK_FALLBACK_POLL_INTERVAL = 300.0
+
+
+def resolve_transcription_callback(job_id: str) -> bool:
+    """
+    Wake whoever is waiting on a transcription job's completion callback.
+    
+    Args:
+        job_id: The transcription job ID.
+        
+    Returns:
+        True if a waiter was registered for the job.
+    """
+    future = _callback_futures.get(job_id)
+    if future is None or future.done():
+        return False
+    future.set_result(None)
+    return True
+
+
+def register_callback(job_id: str) -> asyncio.Future:
+    """
+    Start tracking a job's completion callback.
+    
+    Call this before the first status check of a freshly created job, so a
+    callback arriving while that check is in flight is not dropped.
+    
+    Args:
+        job_id: The transcription job ID.
+        
+    Returns:
+        The future resolved by resolve_transcription_callback.
+    """
+    future = _callback_futures.get(job_id)
+    if future is None:
+        future = asyncio.get_running_loop().create_future()
+        _callback_futures[job_id] = future
+    return future
+
+
+async def wait_for_callback(job_id: str, timeout: float) -> bool:
+    """
+    Wait until the webhook endpoint reports a job as finished.
+    
+    The future stays registered between calls, so a callback arriving while
+    the caller checks job status is not lost (use register_callback to cover
+    the first check as well).
+    
+    Args:
+        job_id: The transcription job ID.
+        timeout: Maximum seconds to wait.
+        
+    Returns:
+        True if the callback arrived, False on timeout.
+    """
+    future = register_callback(job_id)
+    try:
+        await asyncio.wait_for(asyncio.shield(future), timeout)
+    except asyncio.TimeoutError:
+        return False
+    _callback_futures.pop(job_id, None)
+    return True
+
+
+def discard_callback(job_id: str) -> None:
+    """Stop tracking a job's completion callback."""
+    future = _callback_futures.pop(job_id, None)
+    if future is not None and not future.done():
+        future.cancel()
+
+
+# Azure reports offsets/durations in ticks (1 tick = 100 nanoseconds)
+TICKS_PER_SECOND = 10_000_000
+
+# Polling bounds for wait_for_transcription (exponential backoff between these)
+MIN_POLL_INTERVAL = 2.0
+MAX_POLL_INTERVAL = 60.0
+
+# Maximum number of blobs Azure accepts in one Blob Batch delete request
+BLOB_BATCH_SIZE = 256
+
+# Supported locales change rarely; cache the list per region for an hour
+LOCALES_CACHE_TTL = 3600.0
+_locales_cache: Dict[str, Tuple[float, List[str]]] = {}
+
+# Result files larger than this are stream-parsed (when ijson is installed) so the
+# raw JSON body is never held in memory alongside the parsed result
+STREAM_PARSE_THRESHOLD = 16 * 1024 * 1024
+
+# Top-level keys of a result file that are actually used
+_RESULT_KEYS = frozenset(('source', 'recognizedPhrases'))
+
+
+async def _stream_parse_result(stream: Any) -> Dict[str, Any]:
+    """
+    Incrementally parse a transcription result file from an async byte stream.
+    
+    Only the keys in _RESULT_KEYS are kept; other top-level values (such as
+    combinedRecognizedPhrases) are discarded as soon as they are parsed.
+    
+    Args:
+        stream: Object with an async read(n) method (e.g. aiohttp response.content).
+        
+    Returns:
+        Parsed result dict containing the used keys.
+    """
+    result: Dict[str, Any] = {}
+    async for key, value in ijson.kvitems_async(stream, '', use_float=True):
+        if key in _RESULT_KEYS:
+            result[key] = value
+    return result
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds.
+    
+    Args:
+        value: Header value, either delay-seconds or an HTTP date.
+        
+    Returns:
+        Seconds to wait, or None if missing or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def get_initial_poll_interval(
+    audio_duration: Optional[float] = None, min_interval: float = MIN_POLL_INTERVAL
+) -> float:
+    """
+    Get the first polling interval for a transcription job.
+    
+    Args:
+        audio_duration: Optional audio length in seconds.
+        min_interval: Shortest interval to use.
+        
+    Returns:
+        Seconds to wait before the second status check.
+    """
+    if not audio_duration:
+        return min_interval
+    # Azure typically transcribes well under real time; check back at ~2% of the duration
+    return min(max(audio_duration / 50, min_interval), MAX_POLL_INTERVAL)
+
+
+def get_poll_delay(
+    interval: float, retry_after: Optional[float] = None, min_interval: float = MIN_POLL_INTERVAL
+) -> float:
+    """
+    Get the delay before the next status poll.
+    
+    Args:
+        interval: Current backoff interval in seconds.
+        retry_after: Optional Retry-After hint from Azure (takes precedence).
+        min_interval: Shortest delay to use.
+        
+    Returns:
+        Seconds to sleep, clamped to [min_interval, MAX_POLL_INTERVAL].
+    """
+    delay = retry_after if retry_after is not None else interval
+    return min(max(delay, min_interval), MAX_POLL_INTERVAL)
+
+
 class TranscriptionStatus(str, Enum):
     """Transcription job status values."""
     NOT_STARTED = "NotStarted"
@@ -55,9 +248,10 @@ class TranscriptionJob:
     self_url: str
     files_url: Optional[str] = None
     error_message: Optional[str] = None
+    retry_after: Optional[float] = None  # Seconds suggested by Azure's Retry-After header
     
     @classmethod
-    def from_api_response(cls, data: Dict[str, Any]) -> 'TranscriptionJob':
+    def from_api_response(cls, data: Dict[str, Any], retry_after: Optional[float] = None) -> 'TranscriptionJob':
         """Create TranscriptionJob from API response."""
         return cls(
             id=data['self'].split('/')[-1],
@@ -69,19 +263,23 @@ class TranscriptionJob:
             self_url=data['self'],
             files_url=data.get('links', {}).get('files'),
             error_message=data.get('properties', {}).get('error', {}).get('message'),
+            retry_after=retry_after,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionSegment:
-    """A single segment of transcribed text with timing."""
+    """A single segment of transcribed text with timing.
+    
+    Uses __slots__ since a long file yields thousands of segments.
+    """
     start: float  # seconds
     end: float    # seconds
     text: str
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """Complete transcription result."""
     job_id: str
@@ -96,22 +294,65 @@ class TranscriptionResult:
     
     def to_srt(self) -> str:
         """Convert transcription to SRT format."""
-        from app.utils.subtitle_utils import seconds_to_srt_time
-        
-        srt_lines = []
+        buf = io.StringIO()
+        write = buf.write
         
         for i, segment in enumerate(self.segments, 1):
-            start_time = seconds_to_srt_time(segment.start)
-            end_time = seconds_to_srt_time(segment.end)
-            
-            srt_lines.append(str(i))
-            srt_lines.append(f"{start_time} --> {end_time}")
-            srt_lines.append(segment.text.strip())
-            srt_lines.append("")
+            if i > 1:
+                write("\n")
+            write(
+                f"{i}\n{seconds_to_srt_time(segment.start)} --> "
+                f"{seconds_to_srt_time(segment.end)}\n{segment.text.strip()}\n"
+            )
+        
+        return buf.getvalue()
+
+
+def parse_recognized_phrases(
+    phrases: List[Dict[str, Any]],
+) -> Tuple[List[TranscriptionSegment], float, Optional[str]]:
+    """
+    Parse Azure recognizedPhrases into transcription segments in a single pass.
+    
+    Args:
+        phrases: The 'recognizedPhrases' list from an Azure transcription result.
+        
+    Returns:
+        Tuple of (segments, duration in seconds, detected locale or None).
+        The locale is taken from the first phrase that has one (set when
+        language identification is enabled).
+    """
+    # Cost here is dominated by dict access on the decoded JSON (~1us per phrase),
+    # not the tick arithmetic, so a vectorized/native kernel would not pay off.
+    # Keep the two divisions as-is: regrouping them changes SRT timestamps.
+    segments: List[TranscriptionSegment] = []
+    # Local aliases keep attribute/global lookups out of the per-phrase loop
+    append = segments.append
+    segment = TranscriptionSegment
+    ticks = TICKS_PER_SECOND
+    duration = 0.0
+    detected_locale = None
+    
+    for phrase in phrases:
+        get = phrase.get
+        start_seconds = get('offsetInTicks', 0) / ticks
+        end_seconds = start_seconds + get('durationInTicks', 0) / ticks
+        
+        if detected_locale is None:
+            detected_locale = get('locale')
+        
+        # Get best transcription
+        n_best = get('nBest')
+        if n_best:
+            best = n_best[0]
+            text = best.get('display')
+            if text:
+                append(segment(start_seconds, end_seconds, text, best.get('confidence', 0.0)))
         
-        return "\n".join(srt_lines)
+        if end_seconds > duration:
+            duration = end_seconds
     
-    # Note: _seconds_to_srt_time moved to subtitle_utils.seconds_to_srt_time
+    return segments, duration, detected_locale
 
 
 class AzureBatchTranscriber:
@@ -144,39 +385,114 @@ class AzureBatchTranscriber:
         self.speech_key = speech_key or settings.azure.speech_key
         self.speech_region = speech_region or settings.azure.speech_region
         self.api_base_url = f"https://{self.speech_region}.api.cognitive.microsoft.com/speechtotext/v3.2"
+        self._transcriptions_url = f"{self.api_base_url}/transcriptions"
+        # Per-job URLs, built once and reused on every status poll
+        self._job_urls: Dict[str, str] = {}
+        # Last (ETag, job) seen per job, for conditional status polls
+        self._job_etags: Dict[str, Tuple[str, "TranscriptionJob"]] = {}
+        self._headers = {
+            "Ocp-Apim-Subscription-Key": self.speech_key,
+            "Content-Type": "application/json"
+        }
         
         # Storage settings (for blob upload)
         self.storage_connection_string = settings.azure.storage_connection_string
         self.storage_container = settings.azure.storage_container
+        self.upload_concurrency = settings.azure.upload_concurrency
+        self.upload_block_size = settings.azure.upload_block_size_mb * 1024 * 1024
         
-        self._session: Optional[aiohttp.ClientSession] = None
+        # Completion webhook (AZURE_USE_WEBHOOK); None means status polling only
+        self.webhook_url: Optional[str] = settings.azure.webhook_url if settings.azure.webhook_enabled else None
+        self.webhook_secret = settings.azure.webhook_secret
+        
+        # Blob client is created lazily and reused for every upload/delete
+        self._blob_service_client: Optional["BlobServiceClient"] = None
+        self._container_client: Optional["ContainerClient"] = None
+        self._container_ready = False
     
     @property
     def headers(self) -> Dict[str, str]:
-        """Get headers for API requests."""
-        return {
-            "Ocp-Apim-Subscription-Key": self.speech_key,
-            "Content-Type": "application/json"
-        }
+        """Get headers for API requests (built once in __init__)."""
+        return self._headers
+    
+    def _job_url(self, job_id: str) -> str:
+        """Get the (cached) API URL of a transcription job."""
+        url = self._job_urls.get(job_id)
+        if url is None:
+            url = self._job_urls[job_id] = f"{self._transcriptions_url}/{job_id}"
+        return url
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+        """Get the shared aiohttp session."""
+        return _get_shared_session()
     
     async def close(self):
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """
+        Release the transcriber's blob client.
+        
+        The HTTP session is shared across all transcribers and closed on
+        application shutdown via close_shared_session(), so it stays open.
+        """
+        if self._blob_service_client is not None:
+            await self._blob_service_client.close()
+            self._blob_service_client = None
+            self._container_client = None
+    
+    def _get_container_client(self) -> "ContainerClient":
+        """
+        Get the cached container client, creating the BlobServiceClient on first use.
+        
+        The client runs on the shared aiohttp session; its transport does not own
+        the session, so closing the client leaves the connection pool open.
+        """
+        if self._container_client is None:
+            transport = AioHttpTransport(
+                session=_get_shared_session(),
+                session_owner=False,
+                # Timeouts belong on a custom transport; the SDK ignores them otherwise
+                # connection_timeout: time to establish connection (30s)
+                # read_timeout: time to wait for data during read/write (600s = 10 min)
+                connection_timeout=30,
+                read_timeout=600,
+            )
+            self._blob_service_client = BlobServiceClient.from_connection_string(
+                self.storage_connection_string,
+                transport=transport,
+                # Block size for chunked uploads (AZURE_UPLOAD_BLOCK_SIZE_MB)
+                max_block_size=self.upload_block_size,
+                # Files larger than 4MB are split into blocks uploaded in parallel
+                max_single_put_size=4 * 1024 * 1024,
+            )
+            self._container_client = self._blob_service_client.get_container_client(self.storage_container)
+        return self._container_client
     
-    async def upload_audio(self, file_path: str) -> tuple[str, str]:
+    async def upload_audio(self, file_path: str) -> Tuple[str, str]:
         """
         Upload audio file to Azure Blob Storage and return SAS URL.
         
         Args:
             file_path: Path to the audio file.
             
+        Returns:
+            Tuple of (SAS URL, blob_name) for the uploaded blob.
+        """
+        with open(file_path, 'rb') as f:
+            return await self.upload_audio_stream(
+                f, os.path.getsize(file_path), os.path.splitext(file_path)[1]
+            )
+    
+    async def upload_audio_stream(self, stream: BinaryIO, length: int, file_ext: str = "") -> Tuple[str, str]:
+        """
+        Upload audio from an open binary stream to Azure Blob Storage and return SAS URL.
+        
+        Lets callers that build audio in memory (e.g. an io.BytesIO) upload it
+        without writing a temp file first.
+        
+        Args:
+            stream: Seekable binary stream positioned at the start of the audio.
+            length: Number of bytes to upload.
+            file_ext: Extension for the blob name (e.g. '.wav').
+            
         Returns:
             Tuple of (SAS URL, blob_name) for the uploaded blob.
         """
@@ -186,54 +502,46 @@ class AzureBatchTranscriber:
         if not self.storage_connection_string:
             raise ValueError("AZURE_STORAGE_CONNECTION_STRING is not configured")
         
-        # Create blob client with extended timeouts for large uploads
-        # connection_timeout: time to establish connection (30s)
-        # read_timeout: time to wait for data during read/write (600s = 10 min)
-        blob_service_client = BlobServiceClient.from_connection_string(
-            self.storage_connection_string,
-            connection_timeout=30,
-            read_timeout=600,
-            # Use 4MB blocks for chunked uploads (default is 4MB, but explicit)
-            max_block_size=4 * 1024 * 1024,
-            # Files larger than 64MB will use chunked upload
-            max_single_put_size=64 * 1024 * 1024,
-        )
-        
-        # Ensure container exists
-        container_client = blob_service_client.get_container_client(self.storage_container)
-        try:
-            await asyncio.to_thread(container_client.create_container)
-            logger.info(f"Created container: {self.storage_container}")
-        except Exception:
-            pass  # Container already exists
-        
         # Generate unique blob name
-        file_ext = os.path.splitext(file_path)[1]
         blob_name = f"audio/{uuid.uuid4()}{file_ext}"
         
-        # Get file size for logging and upload optimization
-        file_size = os.path.getsize(file_path)
+        # Size for logging and upload optimization
+        file_size = length
         file_size_mb = file_size / (1024 * 1024)
         logger.info(f"Uploading {file_size_mb:.1f} MB audio file to blob: {blob_name}")
         
+        # Native async blob client on the shared aiohttp session (no thread-pool hop)
+        container_client = self._get_container_client()
+        
+        # Ensure container exists (once per client)
+        if not self._container_ready:
+            try:
+                await container_client.create_container()
+                logger.info(f"Created container: {self.storage_container}")
+            except Exception:
+                pass  # Container already exists
+            self._container_ready = True
+        
         # Upload file with retry logic
         blob_client = container_client.get_blob_client(blob_name)
         max_retries = 3
-        upload_start = datetime.now(timezone.utc)
+        upload_start = time.perf_counter()
+        
+        stream_start = stream.tell()
         
         for attempt in range(1, max_retries + 1):
             try:
-                with open(file_path, 'rb') as f:
-                    # Azure SDK will automatically use chunked upload for files > max_single_put_size
-                    await asyncio.to_thread(
-                        blob_client.upload_blob,
-                        f,
-                        overwrite=True,
-                        max_concurrency=4,  # Parallel upload threads for chunks
-                    )
+                # Rewind so a retry re-sends the audio from the beginning
+                stream.seek(stream_start)
+                # Azure SDK will automatically use chunked upload for files > max_single_put_size
+                await blob_client.upload_blob(
+                    stream,
+                    length=file_size,
+                    overwrite=True,
+                    max_concurrency=self.upload_concurrency,  # Parallel block PUTs
+                )
                 break  # Success
             except (AzureError, TimeoutError, ConnectionError, OSError) as e:
-                last_error = e
                 if attempt < max_retries:
                     wait_time = 2 ** attempt  # Exponential backoff: 2, 4, 8 seconds
                     logger.warning(
@@ -245,12 +553,16 @@ class AzureBatchTranscriber:
                     logger.error(f"Upload failed after {max_retries} attempts: {e}")
                     raise
         
-        upload_duration = (datetime.now(timezone.utc) - upload_start).total_seconds()
-        logger.info(f"Uploaded {file_size_mb:.1f} MB to blob in {upload_duration:.1f}s: {blob_name}")
+        upload_duration = time.perf_counter() - upload_start
+        throughput = file_size_mb / upload_duration if upload_duration > 0 else 0.0
+        logger.info(
+            f"Uploaded {file_size_mb:.1f} MB to blob in {upload_duration:.1f}s "
+            f"({throughput:.1f} MB/s, concurrency={self.upload_concurrency}): {blob_name}"
+        )
         
         # Get account name and key for SAS generation
-        account_name = blob_service_client.account_name
-        account_key = blob_service_client.credential.account_key if blob_service_client.credential else None
+        account_name = container_client.account_name
+        account_key = container_client.credential.account_key if container_client.credential else None
         
         if not account_name or not account_key:
             raise ValueError("Could not retrieve storage account credentials for SAS generation")
@@ -289,30 +601,111 @@ class AzureBatchTranscriber:
             return False
         
         try:
-            blob_service_client = BlobServiceClient.from_connection_string(self.storage_connection_string)
-            container_client = blob_service_client.get_container_client(self.storage_container)
-            blob_client = container_client.get_blob_client(blob_name)
-            await asyncio.to_thread(blob_client.delete_blob)
+            blob_client = self._get_container_client().get_blob_client(blob_name)
+            await blob_client.delete_blob()
             logger.info(f"Deleted blob: {blob_name}")
             return True
         except Exception as e:
             logger.warning(f"Failed to delete blob {blob_name}: {e}")
             return False
+    
+    async def delete_blobs(self, blob_names: List[str]) -> int:
+        """
+        Delete several blobs using Blob Batch requests.
+        
+        Each batch request deletes up to BLOB_BATCH_SIZE blobs, replacing one
+        DELETE round-trip per blob.
+        
+        Args:
+            blob_names: Names of the blobs to delete.
+            
+        Returns:
+            Number of blobs deleted successfully.
+        """
+        if not blob_names:
+            return 0
+        
+        if not AZURE_STORAGE_AVAILABLE:
+            logger.warning("azure-storage-blob not installed, cannot delete blobs")
+            return 0
+        
+        if not self.storage_connection_string:
+            logger.warning("Storage not configured, cannot delete blobs")
+            return 0
+        
+        container_client = self._get_container_client()
+        deleted = 0
+        
+        for i in range(0, len(blob_names), BLOB_BATCH_SIZE):
+            batch = blob_names[i:i + BLOB_BATCH_SIZE]
+            try:
+                responses = await container_client.delete_blobs(*batch, raise_on_any_failure=False)
+                async for response in responses:
+                    if response.status_code == 202:
+                        deleted += 1
+            except Exception as e:
+                logger.warning(f"Failed to batch-delete {len(batch)} blobs: {e}")
+        
+        logger.info(f"Deleted {deleted}/{len(blob_names)} blobs")
+        return deleted
 
+    async def register_webhook(self, web_url: str) -> None:
+        """
+        Register a transcription completion webhook with Azure (once per process).
+        
+        Existing registrations for the same URL are reused, so restarts do not
+        create duplicates.
+        
+        Args:
+            web_url: Public URL Azure should call (this server's /webhook/azure).
+        """
+        key = (self.speech_region, web_url)
+        if key in _registered_webhooks:
+            return
+        
+        session = await self._get_session()
+        url = f"{self.api_base_url}/webhooks"
+        
+        async with session.get(url, headers=self.headers) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise RuntimeError(f"Failed to list webhooks: {response.status} - {error_text}")
+            
+            data = orjson.loads(await response.read())
+        
+        if not any(hook.get('webUrl') == web_url for hook in data.get('values', [])):
+            payload: Dict[str, Any] = {
+                "displayName": "SubGen-Azure-Batch",
+                "webUrl": web_url,
+                "events": {"transcriptionCompletion": True},
+            }
+            if self.webhook_secret:
+                payload["properties"] = {"secret": self.webhook_secret}
+            
+            async with session.post(url, headers=self.headers, json=payload) as response:
+                if response.status != 201:
+                    error_text = await response.text()
+                    raise RuntimeError(f"Failed to register webhook: {response.status} - {error_text}")
+            logger.info(f"Registered Azure transcription webhook: {web_url}")
+        
+        _registered_webhooks.add(key)
+    
     async def create_transcription(
         self,
-        audio_url: str,
+        audio_url: Union[str, List[str]],
         locale: str = "en-US",
         display_name: Optional[str] = None,
         word_level_timestamps: bool = True,
         diarization: bool = False,
         candidate_locales: Optional[List[str]] = None,
+        webhook_url: Optional[str] = None,
     ) -> TranscriptionJob:
         """
         Create a batch transcription job.
         
         Args:
-            audio_url: URL to the audio file (must be accessible by Azure).
+            audio_url: URL to the audio file (must be accessible by Azure), or a
+                list of URLs to transcribe several files in one job.
             locale: Language locale (e.g., "en-US", "de-DE"). Used as fallback when
                 language identification is enabled.
             display_name: Optional display name for the job.
@@ -322,6 +715,8 @@ class AzureBatchTranscriber:
                 When provided, enables Azure's language identification feature with "Single"
                 mode (at-start detection). Maximum 4 candidates for Single mode.
                 Example: ["en-US", "nl-NL", "es-ES", "fr-FR"]
+            webhook_url: Completion webhook to register before creating the job.
+                Defaults to AZURE_WEBHOOK_URL when AZURE_USE_WEBHOOK is enabled.
             
         Returns:
             TranscriptionJob object.
@@ -332,7 +727,7 @@ class AzureBatchTranscriber:
             display_name = f"SubGen-Azure-Batch-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
         
         payload = {
-            "contentUrls": [audio_url],
+            "contentUrls": [audio_url] if isinstance(audio_url, str) else list(audio_url),
             "locale": locale,
             "displayName": display_name,
             "properties": {
@@ -354,9 +749,16 @@ class AzureBatchTranscriber:
             }
             logger.debug(f"Language identification enabled with candidates: {candidate_locales[:4]}")
         
-        url = f"{self.api_base_url}/transcriptions"
+        webhook_url = webhook_url or self.webhook_url
+        if webhook_url:
+            await self.register_webhook(webhook_url)
+            # Auto-delete on Azure's side in case the job is never cleaned up
+            payload["properties"]["timeToLive"] = "PT24H"
+        
+        url = self._transcriptions_url
         logger.debug(f"Creating transcription with URL: {url}")
-        logger.debug(f"Audio URL: {audio_url[:100]}..." if len(audio_url) > 100 else f"Audio URL: {audio_url}")
+        for content_url in payload["contentUrls"]:
+            logger.debug(f"Audio URL: {content_url[:100]}..." if len(content_url) > 100 else f"Audio URL: {content_url}")
         logger.debug(f"Payload: locale={locale}, displayName={display_name}")
         
         async with session.post(url, headers=self.headers, json=payload) as response:
@@ -364,7 +766,7 @@ class AzureBatchTranscriber:
                 error_text = await response.text()
                 raise RuntimeError(f"Failed to create transcription: {response.status} - {error_text}")
             
-            data = await response.json()
+            data = orjson.loads(await response.read())
             job = TranscriptionJob.from_api_response(data)
             logger.info(f"Created transcription job: {job.id}")
             return job
@@ -378,146 +780,296 @@ class AzureBatchTranscriber:
             
         Returns:
             Updated TranscriptionJob object.
+        
+        When Azure sent an ETag for the job, the poll is conditional
+        (If-None-Match): an unchanged job comes back as a bodiless 304 and
+        the previous TranscriptionJob is reused.
         """
         session = await self._get_session()
-        url = f"{self.api_base_url}/transcriptions/{job_id}"
+        url = self._job_url(job_id)
+        cached = self._job_etags.get(job_id)
+        headers = {**self.headers, "If-None-Match": cached[0]} if cached else self.headers
         
-        async with session.get(url, headers=self.headers) as response:
+        async with session.get(url, headers=headers) as response:
+            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            if response.status == 304 and cached:
+                return replace(cached[1], retry_after=retry_after)
+            
             if response.status != 200:
                 error_text = await response.text()
                 raise RuntimeError(f"Failed to get transcription status: {response.status} - {error_text}")
             
-            data = await response.json()
-            return TranscriptionJob.from_api_response(data)
+            data = orjson.loads(await response.read())
+            job = TranscriptionJob.from_api_response(data, retry_after=retry_after)
+            etag = response.headers.get('ETag')
+            if etag:
+                self._job_etags[job_id] = (etag, job)
+            return job
     
-    async def get_transcription_result(self, job_id: str) -> TranscriptionResult:
+    async def _get_result_content_urls(self, job_id: str) -> List[str]:
         """
-        Get the transcription result for a completed job.
+        Get the download URLs of all transcription result files for a job.
+        
+        A job has one 'Transcription' file per entry in its contentUrls; all
+        pages of the file list are read.
         
         Args:
             job_id: The transcription job ID.
             
         Returns:
-            TranscriptionResult with parsed segments.
+            List of content URLs, in the order Azure lists them.
         """
         session = await self._get_session()
+        files_url: Optional[str] = f"{self._job_url(job_id)}/files"
+        content_urls: List[str] = []
         
-        # First, get the files list
-        files_url = f"{self.api_base_url}/transcriptions/{job_id}/files"
-        
-        async with session.get(files_url, headers=self.headers) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise RuntimeError(f"Failed to get transcription files: {response.status} - {error_text}")
+        # Azure pages the file list; follow @nextLink so large jobs return every file
+        while files_url:
+            async with session.get(files_url, headers=self.headers) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(f"Failed to get transcription files: {response.status} - {error_text}")
+                
+                files_data = orjson.loads(await response.read())
             
-            files_data = await response.json()
-        
-        # Find the transcription result file
-        result_file = None
-        for file_info in files_data.get('values', []):
-            if file_info.get('kind') == 'Transcription':
-                result_file = file_info
-                break
+            content_urls.extend(
+                file_info['links']['contentUrl']
+                for file_info in files_data.get('values', [])
+                if file_info.get('kind') == 'Transcription'
+            )
+            files_url = files_data.get('@nextLink')
         
-        if not result_file:
+        if not content_urls:
             raise RuntimeError(f"No transcription result file found for job {job_id}")
+        return content_urls
+    
+    async def _download_result(self, content_url: str) -> Dict[str, Any]:
+        """
+        Download and decode a single transcription result file.
+        
+        Large files are stream-parsed with ijson when it is installed.
         
-        # Download the result
-        content_url = result_file['links']['contentUrl']
+        Args:
+            content_url: SAS URL of the result file (no auth headers needed).
+            
+        Returns:
+            Parsed result JSON.
+        """
+        session = await self._get_session()
         
         async with session.get(content_url) as response:
             if response.status != 200:
                 error_text = await response.text()
                 raise RuntimeError(f"Failed to download transcription result: {response.status} - {error_text}")
             
-            result_data = await response.json()
-        
-        # Parse the result into segments
-        segments = []
-        duration = 0.0
-        detected_locale = None  # Track locale from language identification
-        
-        for phrase in result_data.get('recognizedPhrases', []):
-            # Convert ticks to seconds (1 tick = 100 nanoseconds)
-            start_seconds = phrase.get('offsetInTicks', 0) / 10_000_000
-            duration_seconds = phrase.get('durationInTicks', 0) / 10_000_000
-            end_seconds = start_seconds + duration_seconds
-            
-            # Extract detected locale from first phrase (when language identification enabled)
-            if detected_locale is None and 'locale' in phrase:
-                detected_locale = phrase['locale']
-                logger.debug(f"Detected language from Azure LID: {detected_locale}")
-            
-            # Get best transcription
-            n_best = phrase.get('nBest', [])
-            if n_best:
-                text = n_best[0].get('display', '')
-                confidence = n_best[0].get('confidence', 0.0)
-            else:
-                text = ''
-                confidence = 0.0
-            
-            if text:
-                segments.append(TranscriptionSegment(
-                    start=start_seconds,
-                    end=end_seconds,
-                    text=text,
-                    confidence=confidence
-                ))
-            
-            duration = max(duration, end_seconds)
-        
-        # Get job info for fallback language
-        job = await self.get_transcription_status(job_id)
+            if IJSON_AVAILABLE and (response.content_length or 0) > STREAM_PARSE_THRESHOLD:
+                return await _stream_parse_result(response.content)
+            return orjson.loads(await response.read())
+    
+    @staticmethod
+    def _build_result(
+        job_id: str, result_data: Dict[str, Any], fallback_locale: Optional[str]
+    ) -> TranscriptionResult:
+        """Parse a downloaded result file into a TranscriptionResult."""
+        segments, duration, detected_locale = parse_recognized_phrases(
+            result_data.get('recognizedPhrases', [])
+        )
+        if detected_locale:
+            logger.debug(f"Detected language from Azure LID: {detected_locale}")
         
         # Use detected locale from language identification if available, otherwise use job locale
-        result_language = detected_locale if detected_locale else job.locale
-        
         return TranscriptionResult(
             job_id=job_id,
-            language=result_language,
+            language=detected_locale if detected_locale else fallback_locale,
             segments=segments,
             duration=duration
         )
     
-    async def wait_for_transcription(
+    async def get_transcription_result(
+        self, job_id: str, locale: Optional[str] = None
+    ) -> TranscriptionResult:
+        """
+        Get the transcription result for a completed job.
+        
+        Args:
+            job_id: The transcription job ID.
+            locale: The job's locale, used when language identification did not
+                report one. If omitted and the result has no locale, the job is
+                fetched to look it up.
+            
+        Returns:
+            TranscriptionResult with parsed segments.
+        """
+        content_urls = await self._get_result_content_urls(job_id)
+        result_data = await self._download_result(content_urls[0])
+        result = self._build_result(job_id, result_data, locale)
+        
+        if not result.language:
+            job = await self.get_transcription_status(job_id)
+            result.language = job.locale
+        
+        return result
+    
+    async def get_transcription_results(
+        self, job_id: str, locale: Optional[str] = None
+    ) -> Dict[str, TranscriptionResult]:
+        """
+        Get the results of a completed job that transcribed several files.
+        
+        All result files are downloaded concurrently.
+        
+        Args:
+            job_id: The transcription job ID.
+            locale: The job's locale, used when language identification did not
+                report one (see get_transcription_result).
+            
+        Returns:
+            Dict mapping each source audio URL (without query string) to its result.
+        """
+        content_urls = await self._get_result_content_urls(job_id)
+        results_data = await asyncio.gather(*(self._download_result(url) for url in content_urls))
+        
+        results = {
+            result_data.get('source', '').split('?', 1)[0]: self._build_result(job_id, result_data, locale)
+            for result_data in results_data
+        }
+        
+        missing = [result for result in results.values() if not result.language]
+        if missing:
+            job = await self.get_transcription_status(job_id)
+            for result in missing:
+                result.language = job.locale
+        
+        return results
+    
+    async def wait_for_completion(
         self,
         job_id: str,
-        poll_interval: int = 10,
-        timeout: int = 3600
-    ) -> TranscriptionResult:
+        timeout: int = 3600,
+        audio_duration: Optional[float] = None,
+        min_poll_interval: float = MIN_POLL_INTERVAL,
+    ) -> TranscriptionJob:
         """
-        Wait for a transcription job to complete and return the result.
+        Poll a transcription job until it succeeds.
+        
+        Polls with exponential backoff (min_poll_interval, 2s by default,
+        doubling up to 60s). When Azure sends a Retry-After header it takes
+        precedence over the backoff interval.
         
         Args:
             job_id: The transcription job ID.
-            poll_interval: Seconds between status checks.
             timeout: Maximum seconds to wait.
-            
+            audio_duration: Optional audio length in seconds, used to pick the
+                first polling interval.
+            min_poll_interval: Shortest polling interval.
+        
         Returns:
-            TranscriptionResult when job completes.
+            The succeeded TranscriptionJob.
             
         Raises:
             TimeoutError: If job doesn't complete within timeout.
             RuntimeError: If job fails.
         """
-        start_time = asyncio.get_event_loop().time()
+        deadline = time.monotonic() + timeout
+        interval = get_initial_poll_interval(audio_duration, min_poll_interval)
         
         while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
+            if time.monotonic() > deadline:
                 raise TimeoutError(f"Transcription job {job_id} timed out after {timeout} seconds")
             
             job = await self.get_transcription_status(job_id)
             logger.debug(f"Job {job_id} status: {job.status}")
             
             if job.status == TranscriptionStatus.SUCCEEDED:
-                return await self.get_transcription_result(job_id)
+                return job
             
             if job.status == TranscriptionStatus.FAILED:
                 raise RuntimeError(f"Transcription job {job_id} failed: {job.error_message}")
             
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(get_poll_delay(interval, job.retry_after, min_poll_interval))
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+    
+    async def wait_for_transcription(
+        self,
+        job_id: str,
+        timeout: int = 3600,
+        audio_duration: Optional[float] = None,
+        min_poll_interval: float = MIN_POLL_INTERVAL,
+    ) -> TranscriptionResult:
+        """
+        Wait for a transcription job to complete and return the result.
+        
+        Polls with exponential backoff (2s doubling up to 60s). When Azure sends
+        a Retry-After header it takes precedence over the backoff interval.
+        With completion webhooks enabled, waits for the callback instead.
+        
+        Args:
+            job_id: The transcription job ID.
+            timeout: Maximum seconds to wait.
+            audio_duration: Optional audio length in seconds. Azure processing time
+                is roughly linear in audio duration, so long files start with a
+                longer first interval instead of polling every 2s.
+            min_poll_interval: Shortest polling interval. Jobs on a few seconds
+                of audio (e.g. language detection) finish quickly, so they can
+                start polling sooner than the 2s default.
+            
+        Returns:
+            TranscriptionResult when job completes.
+            
+        Raises:
+            TimeoutError: If job doesn't complete within timeout.
+            RuntimeError: If job fails.
+        """
+        if self.webhook_url:
+            return await self.wait_for_transcription_via_callback(job_id, timeout)
+        
+        job = await self.wait_for_completion(job_id, timeout, audio_duration, min_poll_interval)
+        return await self.get_transcription_result(job_id, locale=job.locale)
+    
+    async def wait_for_transcription_via_callback(
+        self,
+        job_id: str,
+        timeout: int = 3600,
+    ) -> TranscriptionResult:
+        """
+        Wait for a transcription job using the completion webhook.
+        
+        The job status is checked once up front (it may already be done), then
+        after each callback, or every WEBHOOK_FALLBACK_POLL_INTERVAL seconds if
+        no callback arrives.
+        
+        Args:
+            job_id: The transcription job ID.
+            timeout: Maximum seconds to wait.
+            
+        Returns:
+            TranscriptionResult when job completes.
+            
+        Raises:
+            TimeoutError: If job doesn't complete within timeout.
+            RuntimeError: If job fails.
+        """
+        deadline = time.monotonic() + timeout
+        register_callback(job_id)
+        
+        try:
+            while True:
+                job = await self.get_transcription_status(job_id)
+                logger.debug(f"Job {job_id} status: {job.status}")
+                
+                if job.status == TranscriptionStatus.SUCCEEDED:
+                    return await self.get_transcription_result(job_id, locale=job.locale)
+                
+                if job.status == TranscriptionStatus.FAILED:
+                    raise RuntimeError(f"Transcription job {job_id} failed: {job.error_message}")
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Transcription job {job_id} timed out after {timeout} seconds")
+                
+                await wait_for_callback(job_id, min(WEBHOOK_FALLBACK_POLL_INTERVAL, remaining))
+        finally:
+            discard_callback(job_id)
     
     async def delete_transcription(self, job_id: str) -> None:
         """
@@ -533,7 +1085,8 @@ class AzureBatchTranscriber:
             be handled gracefully by the caller.
         """
         session = await self._get_session()
-        url = f"{self.api_base_url}/transcriptions/{job_id}"
+        url = self._job_urls.pop(job_id, None) or f"{self._transcriptions_url}/{job_id}"
+        self._job_etags.pop(job_id, None)
         
         async with session.delete(url, headers=self.headers) as response:
             if response.status not in (200, 204):
@@ -557,32 +1110,62 @@ class AzureBatchTranscriber:
             List of TranscriptionJob objects.
         """
         session = await self._get_session()
-        url = f"{self.api_base_url}/transcriptions?top={top}"
+        url = f"{self._transcriptions_url}?top={top}"
         
         async with session.get(url, headers=self.headers) as response:
             if response.status != 200:
                 error_text = await response.text()
                 raise RuntimeError(f"Failed to list transcriptions: {response.status} - {error_text}")
             
-            data = await response.json()
+            data = orjson.loads(await response.read())
             return [TranscriptionJob.from_api_response(item) for item in data.get('values', [])]
     
-    async def get_supported_locales(self) -> List[str]:
+    async def get_supported_locales(self, force_refresh: bool = False) -> List[str]:
         """
         Get list of supported language locales.
         
+        The list is cached per region for LOCALES_CACHE_TTL seconds.
+        
+        Args:
+            force_refresh: Bypass the cache and fetch the list from Azure.
+            
         Returns:
             List of locale strings (e.g., ["en-US", "de-DE"]).
         """
+        cached = _locales_cache.get(self.speech_region)
+        if cached and not force_refresh and time.monotonic() - cached[0] < LOCALES_CACHE_TTL:
+            return list(cached[1])
+        
         session = await self._get_session()
-        url = f"{self.api_base_url}/transcriptions/locales"
+        url = f"{self._transcriptions_url}/locales"
         
         async with session.get(url, headers=self.headers) as response:
             if response.status != 200:
                 error_text = await response.text()
                 raise RuntimeError(f"Failed to get supported locales: {response.status} - {error_text}")
             
-            return await response.json()
+            locales = orjson.loads(await response.read())
+        
+        _locales_cache[self.speech_region] = (time.monotonic(), locales)
+        return list(locales)
+
+
+@lru_cache(maxsize=1)
+def get_transcriber() -> AzureBatchTranscriber:
+    """
+    Get the shared AzureBatchTranscriber, creating it on first call.
+    
+    Request handlers reuse this instance, so its blob client is built once
+    instead of per request. Call close_transcriber() on shutdown.
+    """
+    return AzureBatchTranscriber()
+
+
+async def close_transcriber() -> None:
+    """Close the shared transcriber's blob client, if it was created."""
+    if get_transcriber.cache_info().currsize:
+        await get_transcriber().close()
+        get_transcriber.cache_clear()
 
 
 # Convenience function for simple transcription
@@ -604,6 +1187,7 @@ async def transcribe_audio(
     """
     transcriber = AzureBatchTranscriber()
     blob_name = None
+    job_id = None
     
     try:
         # Upload audio
@@ -611,6 +1195,7 @@ async def transcribe_audio(
         
         # Create and wait for transcription
         job = await transcriber.create_transcription(audio_url, language)
+        job_id = job.id
         result = await transcriber.wait_for_transcription(job.id)
         
         # Generate SRT
@@ -621,13 +1206,72 @@ async def transcribe_audio(
             with open(output_srt_path, 'w', encoding='utf-8') as f:
                 f.write(srt_content)
         
-        # Cleanup job
-        await transcriber.delete_transcription(job.id)
-        
         return srt_content
         
     finally:
-        # Cleanup blob
+        # Cleanup job and blob concurrently
+        cleanups = []
+        if job_id:
+            cleanups.append(transcriber.delete_transcription(job_id))
         if blob_name:
-            await transcriber.delete_blob(blob_name)
+            cleanups.append(transcriber.delete_blob(blob_name))
+        await asyncio.gather(*cleanups, return_exceptions=True)
+        await transcriber.close()
+
+
+async def transcribe_many(
+    audio_paths: List[str],
+    language: str = "en-US",
+    max_concurrent_uploads: int = 8,
+) -> List[str]:
+    """
+    Transcribe several audio files with a single batch job.
+    
+    Uploads run concurrently, all blobs are submitted as the contentUrls of one
+    transcription job, and results are downloaded and blobs deleted in parallel.
+    
+    Args:
+        audio_paths: Paths to audio files.
+        language: Language locale.
+        max_concurrent_uploads: Maximum number of files uploaded at once.
+        
+    Returns:
+        SRT content for each file, in the same order as audio_paths.
+    """
+    transcriber = AzureBatchTranscriber()
+    upload_semaphore = asyncio.Semaphore(max_concurrent_uploads)
+    
+    async def upload(path: str) -> Tuple[str, str]:
+        async with upload_semaphore:
+            return await transcriber.upload_audio(path)
+    
+    uploads = await asyncio.gather(*(upload(path) for path in audio_paths), return_exceptions=True)
+    blob_names = [u[1] for u in uploads if not isinstance(u, BaseException)]
+    job_id = None
+    
+    try:
+        for u in uploads:
+            if isinstance(u, BaseException):
+                raise u
+        
+        job = await transcriber.create_transcription([url for url, _ in uploads], language)
+        job_id = job.id
+        await transcriber.wait_for_completion(job.id)
+        results = await transcriber.get_transcription_results(job.id, locale=job.locale)
+        
+        srt_contents = []
+        for path, blob_name in zip(audio_paths, blob_names):
+            result = next((r for source, r in results.items() if source.endswith(blob_name)), None)
+            if result is None:
+                raise RuntimeError(f"No transcription result returned for {path}")
+            srt_contents.append(result.to_srt())
+        
+        return srt_contents
+        
+    finally:
+        # Cleanup job and blobs concurrently (blobs in batch requests)
+        cleanups = [transcriber.delete_blobs(blob_names)]
+        if job_id:
+            cleanups.append(transcriber.delete_transcription(job_id))
+        await asyncio.gather(*cleanups, return_exceptions=True)
         await transcriber.close()
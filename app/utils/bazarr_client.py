@@ -5,15 +5,114 @@ This module handles integration with Bazarr for triggering scans
 and notifying about new subtitles.
 """
 
+import asyncio
 import logging
-from typing import Optional
+import os
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
 
 import aiohttp
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 from app.config import get_settings
+from app.utils.http_session import get_shared_session as _get_shared_session
 
 logger = logging.getLogger(__name__)
 
+# Bazarr answers scan/task requests with 204 No Content (older versions: 200)
+_SUCCESS_STATUSES = frozenset({200, 204})
+
+
+# Full series/movie lists, cached per (Bazarr URL, kind) so a burst of new
+# subtitles (e.g. a season import) downloads each catalog once. Stored as a
+# path index (see _build_path_index).
+CATALOG_CACHE_TTL = 60.0
+_catalog_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, dict]]] = {}
+# Downloads in progress, so concurrent cache misses share one request
+_catalog_fetches: Dict[Tuple[str, str], "asyncio.Future[Optional[Dict[str, dict]]]"] = {}
+
+
+# Catalogs larger than this (or without a Content-Length) are stream-parsed when
+# ijson is installed, so the raw body and the full decoded list are never held
+# in memory at once
+CATALOG_STREAM_THRESHOLD = 1024 * 1024
+
+
+def invalidate_catalog_cache() -> None:
+    """Drop all cached Bazarr series/movie lists."""
+    _catalog_cache.clear()
+
+
+def _normalize_path(path: str) -> str:
+    """Normalize a path for lookups (collapses '//', '.' and '..', no trailing separator)."""
+    if not path:
+        return ''
+    return os.path.normpath(path).rstrip('/\\')
+
+
+def _add_to_path_index(index: Dict[str, dict], record: dict) -> None:
+    """Add a record to a path index (records without a path are skipped, first one wins)."""
+    path = _normalize_path(record.get('path'))
+    if path and path not in index:
+        index[path] = record
+
+
+def _build_path_index(records: Iterable[dict]) -> Dict[str, dict]:
+    """
+    Index series/movie records by their normalized folder path.
+    
+    Records without a path are skipped; for duplicate paths the first record wins.
+    """
+    index: Dict[str, dict] = {}
+    for record in records:
+        _add_to_path_index(index, record)
+    return index
+
+
+async def _stream_path_index(stream: Any) -> Dict[str, dict]:
+    """
+    Build a path index from a Bazarr list response without loading it whole.
+    
+    Records under the top-level 'data' array are decoded one at a time with
+    ijson and indexed as they arrive.
+    
+    Args:
+        stream: Async byte stream of the response body (aiohttp StreamReader).
+        
+    Returns:
+        Records indexed by folder path.
+    """
+    index: Dict[str, dict] = {}
+    async for record in ijson.items_async(stream, 'data.item'):
+        _add_to_path_index(index, record)
+    return index
+
+
+def _find_by_path(index: Dict[str, dict], path: str) -> Optional[dict]:
+    """
+    Find the record whose folder contains path (longest matching folder wins).
+    
+    Walks up the parent directories of path with one dict lookup each, so the
+    cost depends on path depth rather than library size. Only whole folder
+    names match, so '/media/showA2' never resolves to '/media/showA'.
+    """
+    candidate = _normalize_path(path)
+    while candidate:
+        record = index.get(candidate)
+        if record is not None:
+            return record
+        sep = max(candidate.rfind('/'), candidate.rfind('\\'))
+        if sep <= 0:
+            return None
+        candidate = candidate[:sep]
+    return None
+
 
 class BazarrClient:
     """
@@ -22,42 +121,56 @@ class BazarrClient:
     Bazarr API Documentation: https://wiki.bazarr.media/Additional-Configuration/api/
     """
     
-    def __init__(self, url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         """
         Initialize Bazarr client.
         
         Args:
             url: Bazarr server URL. If not provided, uses config.
             api_key: Bazarr API key. If not provided, uses config.
+            session: aiohttp session to use. If not provided, uses the shared
+                module-level session.
         """
         settings = get_settings()
         self.url = (url or settings.bazarr.url).rstrip('/')
         self.api_key = api_key or settings.bazarr.api_key
-        self._session: Optional[aiohttp.ClientSession] = None
-    
-    @property
-    def is_configured(self) -> bool:
-        """Check if Bazarr is configured."""
-        return bool(self.url and self.api_key)
-    
-    @property
-    def headers(self):
-        """Get API request headers."""
-        return {
+        # Checked at the start of every request method
+        self.is_configured = bool(self.url and self.api_key)
+        # Endpoint URLs, built once per client
+        self._url_status = f"{self.url}/api/system/status"
+        self._url_series = f"{self.url}/api/series"
+        self._url_movies = f"{self.url}/api/movies"
+        self._url_tasks = f"{self.url}/api/system/tasks"
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._headers = {
             'X-API-KEY': self.api_key,
             'Content-Type': 'application/json'
         }
     
+    @property
+    def headers(self):
+        """Get API request headers (built once in __init__)."""
+        return self._headers
+    
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+        """Get the injected session, or the shared aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return _get_shared_session()
     
     async def close(self):
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """
+        Release the client.
+        
+        Sessions are not owned by the client: the shared session is closed on
+        application shutdown via close_shared_session(), and injected sessions
+        by whoever created them.
+        """
     
     async def test_connection(self) -> bool:
         """
@@ -71,9 +184,8 @@ class BazarrClient:
         
         try:
             session = await self._get_session()
-            url = f"{self.url}/api/system/status"
             
-            async with session.get(url, headers=self.headers) as response:
+            async with session.get(self._url_status, headers=self.headers) as response:
                 return response.status == 200
                 
         except Exception as e:
@@ -102,10 +214,10 @@ class BazarrClient:
             
             if series_id:
                 # PATCH /api/series with action=scan-disk and seriesid
-                url = f"{self.url}/api/series"
+                url = self._url_series
                 params = {"seriesid": series_id, "action": "scan-disk"}
                 async with session.patch(url, headers=self.headers, params=params) as response:
-                    if response.status == 204 or response.status == 200:
+                    if response.status in _SUCCESS_STATUSES:
                         logger.debug(f"Bazarr: Disk scan triggered for series {series_id}")
                         return True
                     else:
@@ -114,11 +226,12 @@ class BazarrClient:
                         return False
             else:
                 # Trigger full series subtitle indexing task
-                url = f"{self.url}/api/system/tasks"
+                url = self._url_tasks
                 params = {"taskid": "update_series"}
                 async with session.post(url, headers=self.headers, params=params) as response:
-                    if response.status == 204 or response.status == 200:
+                    if response.status in _SUCCESS_STATUSES:
                         logger.info("Bazarr: Full series update task triggered")
+                        invalidate_catalog_cache()
                         return True
                     else:
                         logger.warning(f"Bazarr: Series update task failed (HTTP {response.status})")
@@ -150,10 +263,10 @@ class BazarrClient:
             
             if movie_id:
                 # PATCH /api/movies with action=scan-disk and radarrid
-                url = f"{self.url}/api/movies"
+                url = self._url_movies
                 params = {"radarrid": movie_id, "action": "scan-disk"}
                 async with session.patch(url, headers=self.headers, params=params) as response:
-                    if response.status == 204 or response.status == 200:
+                    if response.status in _SUCCESS_STATUSES:
                         logger.debug(f"Bazarr: Disk scan triggered for movie {movie_id}")
                         return True
                     else:
@@ -162,11 +275,12 @@ class BazarrClient:
                         return False
             else:
                 # Trigger full movie subtitle indexing task
-                url = f"{self.url}/api/system/tasks"
+                url = self._url_tasks
                 params = {"taskid": "update_movies"}
                 async with session.post(url, headers=self.headers, params=params) as response:
-                    if response.status == 204 or response.status == 200:
+                    if response.status in _SUCCESS_STATUSES:
                         logger.info("Bazarr: Full movie update task triggered")
+                        invalidate_catalog_cache()
                         return True
                     else:
                         logger.warning(f"Bazarr: Movie update task failed (HTTP {response.status})")
@@ -212,7 +326,7 @@ class BazarrClient:
         
         try:
             session = await self._get_session()
-            url = f"{self.url}/api/series/{series_id}"
+            url = f"{self._url_series}/{series_id}"
             
             async with session.get(url, headers=self.headers) as response:
                 if response.status == 200:
@@ -238,7 +352,7 @@ class BazarrClient:
         
         try:
             session = await self._get_session()
-            url = f"{self.url}/api/movies/{movie_id}"
+            url = f"{self._url_movies}/{movie_id}"
             
             async with session.get(url, headers=self.headers) as response:
                 if response.status == 200:
@@ -249,6 +363,61 @@ class BazarrClient:
             logger.error(f"Error getting movie from Bazarr: {e}")
             return None
     
+    async def _get_catalog(self, kind: str) -> Optional[Dict[str, dict]]:
+        """
+        Get the full series or movie list, cached for CATALOG_CACHE_TTL seconds.
+        
+        Concurrent callers missing the cache share a single download.
+        
+        Args:
+            kind: 'series' or 'movies'.
+            
+        Returns:
+            Records indexed by folder path, or None if the request failed.
+        """
+        key = (self.url, kind)
+        cached = _catalog_cache.get(key)
+        if cached and time.monotonic() - cached[0] < CATALOG_CACHE_TTL:
+            return cached[1]
+        
+        future = _catalog_fetches.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_catalog(kind))
+            _catalog_fetches[key] = future
+            future.add_done_callback(lambda _: _catalog_fetches.pop(key, None))
+        # Shielded so a cancelled caller does not cancel the download others share
+        return await asyncio.shield(future)
+    
+    async def _fetch_catalog(self, kind: str) -> Optional[Dict[str, dict]]:
+        """
+        Download the series or movie list and store it in the catalog cache.
+        
+        Large lists, and lists of unknown length, are stream-parsed with ijson
+        when it is installed.
+        
+        Args:
+            kind: 'series' or 'movies'.
+            
+        Returns:
+            Records indexed by folder path, or None if the request failed.
+        """
+        session = await self._get_session()
+        url = self._url_series if kind == 'series' else self._url_movies
+        
+        async with session.get(url, headers=self.headers) as response:
+            if response.status != 200:
+                return None
+            # Chunked or compressed responses have no Content-Length; stream those too
+            length = response.content_length
+            if IJSON_AVAILABLE and (length is None or length > CATALOG_STREAM_THRESHOLD):
+                catalog = await _stream_path_index(response.content)
+            else:
+                data = await response.json()
+                catalog = _build_path_index(data.get('data', []))
+        
+        _catalog_cache[(self.url, kind)] = (time.monotonic(), catalog)
+        return catalog
+    
     async def search_series_by_path(self, path: str) -> Optional[dict]:
         """
         Search for a series by file path.
@@ -263,16 +432,8 @@ class BazarrClient:
             return None
         
         try:
-            session = await self._get_session()
-            url = f"{self.url}/api/series"
-            
-            async with session.get(url, headers=self.headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    for series in data.get('data', []):
-                        if path.startswith(series.get('path', '')):
-                            return series
-                return None
+            catalog = await self._get_catalog('series')
+            return _find_by_path(catalog, path) if catalog else None
                 
         except Exception as e:
             logger.error(f"Error searching series in Bazarr: {e}")
@@ -292,28 +453,65 @@ class BazarrClient:
             return None
         
         try:
-            session = await self._get_session()
-            url = f"{self.url}/api/movies"
-            
-            async with session.get(url, headers=self.headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    for movie in data.get('data', []):
-                        if path.startswith(movie.get('path', '')):
-                            return movie
-                return None
+            catalog = await self._get_catalog('movies')
+            return _find_by_path(catalog, path) if catalog else None
                 
         except Exception as e:
             logger.error(f"Error searching movie in Bazarr: {e}")
             return None
 
 
+@lru_cache(maxsize=1)
+def get_bazarr_client() -> BazarrClient:
+    """
+    Get the shared BazarrClient for the configured server, creating it on first call.
+    
+    The client holds no connections of its own (requests go through the shared
+    aiohttp session), so one instance serves every caller and needs no close.
+    """
+    return BazarrClient()
+
+
+# In-flight targeted scans, keyed by (Bazarr URL, kind, id).
+# A season import produces many notifications for the same series at once;
+# they all share one running scan instead of each triggering their own.
+_inflight_scans: Dict[Tuple[str, str, int], "asyncio.Future[bool]"] = {}
+
+
+async def _coalesced_scan(key: Tuple[str, str, int], scan: Callable[[], Awaitable[bool]]) -> bool:
+    """
+    Run a scan, or join an identical one that is still running.
+    
+    Args:
+        key: (Bazarr URL, kind, id) identifying the scan.
+        scan: Callable starting the scan (only called if no scan is running).
+        
+    Returns:
+        Result of the (possibly shared) scan.
+    """
+    future = _inflight_scans.get(key)
+    if future is None:
+        future = asyncio.ensure_future(scan())
+        _inflight_scans[key] = future
+        
+        def _forget(done: "asyncio.Future[bool]") -> None:
+            # A finished scan may predate newer subtitles, so later calls start a new one
+            if _inflight_scans.get(key) is done:
+                _inflight_scans.pop(key, None)
+        
+        future.add_done_callback(_forget)
+    
+    # Shielded so a cancelled caller does not cancel the scan other callers share
+    return await asyncio.shield(future)
+
+
 # Convenience function
 async def notify_bazarr_of_new_subtitle(media_path: str) -> bool:
     """
     Notify Bazarr that a new subtitle was created.
     
     Tries to identify if it's a series or movie and triggers appropriate scan.
+    Concurrent notifications for the same series or movie share one scan.
     
     Args:
         media_path: Path to the media file.
@@ -321,28 +519,34 @@ async def notify_bazarr_of_new_subtitle(media_path: str) -> bool:
     Returns:
         True if notification successful.
     """
-    client = BazarrClient()
+    client = get_bazarr_client()
     
     if not client.is_configured:
         return False
     
-    try:
-        # Try to find matching series
-        series = await client.search_series_by_path(media_path)
-        if series:
-            series_id = series.get('sonarrSeriesId')
-            if series_id:
-                return await client.trigger_series_scan(series_id)
-        
-        # Try to find matching movie
-        movie = await client.search_movie_by_path(media_path)
-        if movie:
-            movie_id = movie.get('radarrId')
-            if movie_id:
-                return await client.trigger_movie_scan(movie_id)
-        
-        # Fall back to full scan
-        return await client.trigger_disk_scan()
-        
-    finally:
-        await client.close()
+    # Look up the series and movie catalogs concurrently (both are full-list fetches)
+    series, movie = await asyncio.gather(
+        client.search_series_by_path(media_path),
+        client.search_movie_by_path(media_path),
+    )
+    
+    # Prefer a matching series
+    if series:
+        series_id = series.get('sonarrSeriesId')
+        if series_id:
+            return await _coalesced_scan(
+                (client.url, 'series', series_id),
+                lambda: client.trigger_series_scan(series_id),
+            )
+    
+    # Then a matching movie
+    if movie:
+        movie_id = movie.get('radarrId')
+        if movie_id:
+            return await _coalesced_scan(
+                (client.url, 'movies', movie_id),
+                lambda: client.trigger_movie_scan(movie_id),
+            )
+    
+    # Fall back to full scan
+    return await client.trigger_disk_scan()
@@ -0,0 +1,45 @@
+"""
+Shared HTTP session for SubGen-Azure-Batch.
+
+Every outbound HTTP client in the app (Azure Speech and Blob Storage, Bazarr,
+Plex/Jellyfin/Emby, Pushover) borrows one aiohttp session, so all of them share
+a single keep-alive connection pool and DNS cache instead of each opening its
+own. Clients pass per-request headers and timeouts where they need them.
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Get or create the shared aiohttp session (lazily initialized for event loop)."""
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=32,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            ),
+            # No total timeout: blob uploads and downloads can run for minutes
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60),
+        )
+        _shared_session_loop = loop
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared aiohttp session (called on application shutdown)."""
+    global _shared_session, _shared_session_loop
+    if _shared_session and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
@@ -12,9 +12,13 @@ from typing import Optional
 import aiohttp
 
 from app.config import get_settings
+from app.utils.http_session import get_shared_session
 
 logger = logging.getLogger(__name__)
 
+# Per-request timeout; the shared session itself has no total timeout
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
 
 class PlexClient:
     """Async client for Plex Media Server API."""
@@ -30,6 +34,9 @@ class PlexClient:
         settings = get_settings()
         self.server = (server or settings.plex.server).rstrip('/')
         self.token = token or settings.plex.token
+        # Auth goes on each request, since the session is shared app-wide
+        self._headers = {"X-Plex-Token": self.token}
+        self._json_headers = {**self._headers, "Accept": "application/json"}
         self._session: Optional[aiohttp.ClientSession] = None
     
     @property
@@ -38,19 +45,18 @@ class PlexClient:
         return bool(self.server and self.token)
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={"X-Plex-Token": self.token},
-                timeout=aiohttp.ClientTimeout(total=30)
-            )
-        return self._session
+        """Get the injected session, or the app-wide shared aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return get_shared_session()
     
     async def close(self):
-        """Close the client session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """
+        Release the client.
+        
+        Sessions are not owned by the client: the shared session is closed on
+        application shutdown, and injected sessions by whoever created them.
+        """
     
     async def refresh_metadata(self, item_id: str) -> bool:
         """
@@ -72,7 +78,7 @@ class PlexClient:
         
         try:
             session = await self._get_session()
-            async with session.put(url) as response:
+            async with session.put(url, headers=self._headers, timeout=REQUEST_TIMEOUT) as response:
                 if response.status == 200:
                     logger.info(f"Plex: Metadata refresh sent for item {item_id}")
                     return True
@@ -100,7 +106,7 @@ class PlexClient:
         
         try:
             session = await self._get_session()
-            async with session.get(url, headers={"Accept": "application/json"}) as response:
+            async with session.get(url, headers=self._json_headers, timeout=REQUEST_TIMEOUT) as response:
                 if response.status != 200:
                     return None
                 
@@ -137,7 +143,7 @@ class PlexClient:
         
         try:
             session = await self._get_session()
-            async with session.get(url, headers={"Accept": "application/json"}) as response:
+            async with session.get(url, headers=self._json_headers, timeout=REQUEST_TIMEOUT) as response:
                 if response.status != 200:
                     logger.warning(f"Plex: Failed to get library sections (HTTP {response.status})")
                     return []
@@ -185,7 +191,7 @@ class PlexClient:
         
         try:
             session = await self._get_session()
-            async with session.get(url, params=params) as response:
+            async with session.get(url, params=params, headers=self._headers, timeout=REQUEST_TIMEOUT) as response:
                 if response.status == 200:
                     logger.info(f"Plex: Partial scan triggered for section {section_key}, path: {path}")
                     return True
@@ -260,6 +266,8 @@ class JellyfinClient:
             self.token = token or settings.jellyfin.token
         
         self.is_emby = is_emby
+        # Auth goes on each request, since the session is shared app-wide
+        self._headers = {"Authorization": f"MediaBrowser Token={self.token}"}
         self._session: Optional[aiohttp.ClientSession] = None
     
     @property
@@ -268,19 +276,18 @@ class JellyfinClient:
         return bool(self.server and self.token)
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={"Authorization": f"MediaBrowser Token={self.token}"},
-                timeout=aiohttp.ClientTimeout(total=30)
-            )
-        return self._session
+        """Get the injected session, or the app-wide shared aiohttp session."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return get_shared_session()
     
     async def close(self):
-        """Close the client session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """
+        Release the client.
+        
+        Sessions are not owned by the client: the shared session is closed on
+        application shutdown, and injected sessions by whoever created them.
+        """
     
     async def refresh_metadata(self, item_id: str) -> bool:
         """
@@ -301,7 +308,7 @@ class JellyfinClient:
         
         try:
             session = await self._get_session()
-            async with session.post(url) as response:
+            async with session.post(url, headers=self._headers, timeout=REQUEST_TIMEOUT) as response:
                 # Jellyfin returns 204 No Content on success
                 if response.status in (200, 204):
                     server_name = "Emby" if self.is_emby else "Jellyfin"
@@ -333,7 +340,7 @@ class JellyfinClient:
         
         try:
             session = await self._get_session()
-            async with session.get(url) as response:
+            async with session.get(url, headers=self._headers, timeout=REQUEST_TIMEOUT) as response:
                 if response.status != 200:
                     return None
                 
@@ -375,7 +382,9 @@ class JellyfinClient:
         
         try:
             session = await self._get_session()
-            async with session.get(search_url, params=params) as response:
+            async with session.get(
+                search_url, params=params, headers=self._headers, timeout=REQUEST_TIMEOUT
+            ) as response:
                 if response.status != 200:
                     logger.warning(f"{server_name} search failed: HTTP {response.status}")
                     return False
@@ -13,43 +13,33 @@ Design:
 
 import asyncio
 import logging
-from dataclasses import dataclass
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import DefaultDict, List, NamedTuple, Optional
+from urllib.parse import urlencode
 
 import aiohttp
+from yarl import URL
+
+from app.config import NotificationConfig, get_settings
+from app.utils.http_session import get_shared_session
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class NotificationConfig:
-    """Configuration for notification services.
-    
-    Loaded from environment variables:
-    - PUSHOVER_USER_KEY: Pushover user/group key
-    - PUSHOVER_API_TOKEN: Pushover application API token
-    - NOTIFY_ON_FAILURE: Enable failure notifications (default: true)
-    
-    Note: Even if NOTIFY_ON_FAILURE is true, notifications will only be sent
-    if Pushover is properly configured (both user key and API token set).
-    """
-    # Pushover settings
-    pushover_user_key: str = ""
-    pushover_api_token: str = ""
-    
-    # Notification triggers
-    notify_on_failure: bool = True
-    
-    @property
-    def pushover_configured(self) -> bool:
-        """Check if Pushover is properly configured."""
-        return bool(self.pushover_user_key and self.pushover_api_token)
-    
-    @property
-    def is_configured(self) -> bool:
-        """Check if any notification service is configured."""
-        return self.pushover_configured
+def _log_if_failed(task: "asyncio.Task") -> None:
+    """Log an exception from a background notification task instead of losing it."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background notification failed: {task.exception()}")
+
+
+class FailureEvent(NamedTuple):
+    """A failed job waiting to be included in the next failure notification."""
+    file_name: str
+    error: str
+    job_id: Optional[str] = None
+    source: Optional[str] = None
 
 
 class NotificationService:
@@ -58,7 +48,7 @@ class NotificationService:
     
     Usage:
         # Get instance
-        notifier = NotificationService.get_instance()
+        notifier = get_notifier()
         
         # Send failure notification
         await notifier.notify_job_failed(
@@ -68,74 +58,77 @@ class NotificationService:
         )
     """
     
-    _instance: Optional["NotificationService"] = None
-    
     PUSHOVER_API_URL = "https://api.pushover.net/1/messages.json"
+    # Parsed once so aiohttp does not re-parse the URL string per request
+    _PUSHOVER_URL = URL(PUSHOVER_API_URL)
+    # The body is form-encoded up front and posted as bytes, which skips
+    # aiohttp's FormData handling of dict payloads
+    _FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+    
+    # Failures queued within this window are sent as one digest notification
+    FAILURE_DIGEST_WINDOW = 2.0
+    # Failures listed in a digest before summarizing the rest as "+N more"
+    FAILURE_DIGEST_MAX_ENTRIES = 10
+    # Pushover rejects message bodies longer than this
+    PUSHOVER_MAX_MESSAGE_LENGTH = 1024
+    # Bytes of an error response body included in the log
+    MAX_ERROR_BODY_BYTES = 512
+    # Per-request timeout; the shared session itself has no total timeout
+    REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
     
     def __init__(self, config: NotificationConfig):
         """Initialize with configuration."""
         self._config: NotificationConfig = config
-        self._session: Optional[aiohttp.ClientSession] = None
+        # Fields shared by every Pushover message (credentials never change)
+        self._base_payload = {
+            "token": config.pushover_api_token,
+            "user": config.pushover_user_key,
+            "priority": 0,  # Normal priority
+        }
+        # Resolved once from the (immutable) config, so the early-return paths
+        # below are a single attribute read
+        self._failures_enabled = config.notify_on_failure and config.is_configured
+        # Failures waiting for the next digest, and the timer that sends it
+        self._pending_failures: List[FailureEvent] = []
+        self._digest_task: Optional[asyncio.Task] = None
+        # Set while the digest task is sending (it already took the queued events)
+        self._digest_sending = False
     
     @classmethod
     def get_instance(cls) -> "NotificationService":
-        """Get or create the singleton instance."""
-        if cls._instance is None:
-            config = cls._load_config()
-            cls._instance = cls(config)
-        return cls._instance
+        """Get or create the singleton instance (same as get_notifier())."""
+        return get_notifier()
     
     @classmethod
-    def _load_config(cls) -> NotificationConfig:
-        """Load notification configuration from environment."""
-        import os
-        
-        def get_bool(value: str, default: bool = False) -> bool:
-            if not value:
-                return default
-            return value.lower() in ('true', '1', 'yes', 'on')
-        
-        pushover_user = os.getenv('PUSHOVER_USER_KEY', '')
-        pushover_token = os.getenv('PUSHOVER_API_TOKEN', '')
-        
-        # Default notify_on_failure to True
-        # Even if True, won't send if Pushover isn't configured
-        notify_on_failure = get_bool(os.getenv('NOTIFY_ON_FAILURE', 'true'), default=True)
+    def reset_instance(cls) -> None:
+        """
+        Reset the singleton instance (for testing).
         
-        return NotificationConfig(
-            pushover_user_key=pushover_user,
-            pushover_api_token=pushover_token,
-            notify_on_failure=notify_on_failure,
-        )
+        Queued failures are dropped; use reset_instance_async() to send them.
+        """
+        get_notifier.cache_clear()
     
     @classmethod
-    def reset_instance(cls) -> None:
-        """Reset the singleton instance (for testing)."""
-        if cls._instance and cls._instance._session:
-            # Schedule session close if there's an event loop
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    asyncio.create_task(cls._instance._close_session())
-            except RuntimeError:
-                pass
-        cls._instance = None
+    async def reset_instance_async(cls) -> None:
+        """Close the singleton instance (sending queued failures) and reset it."""
+        await close_notifier()
+        get_notifier.cache_clear()
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
-    
-    async def _close_session(self) -> None:
-        """Close the aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """Get the app-wide shared aiohttp session."""
+        return get_shared_session()
     
     async def close(self) -> None:
-        """Close the notification service."""
-        await self._close_session()
+        """Close the notification service (sending any queued failures first)."""
+        task, self._digest_task = self._digest_task, None
+        if task and not task.done():
+            if self._digest_sending:
+                # Cancelling now would drop the digest being sent; let it finish
+                await asyncio.wait({task})
+            else:
+                task.cancel()
+        if self._pending_failures:
+            await self.flush_failures()
     
     @property
     def config(self) -> NotificationConfig:
@@ -162,16 +155,11 @@ class NotificationService:
             True if notification was sent successfully.
         """
         if not self._config.pushover_configured:
-            logger.debug("Pushover not configured, skipping notification")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pushover not configured, skipping notification")
             return False
         
-        payload = {
-            "token": self._config.pushover_api_token,
-            "user": self._config.pushover_user_key,
-            "title": title,
-            "message": message,
-            "priority": 0,  # Normal priority
-        }
+        payload = {**self._base_payload, "title": title, "message": message}
         
         if url:
             payload["url"] = url
@@ -180,13 +168,22 @@ class NotificationService:
         
         try:
             session = await self._get_session()
-            async with session.post(self.PUSHOVER_API_URL, data=payload) as response:
+            async with session.post(
+                self._PUSHOVER_URL,
+                data=urlencode(payload).encode(),
+                headers=self._FORM_HEADERS,
+                timeout=self.REQUEST_TIMEOUT,
+            ) as response:
+                # The success body is not read; leaving the block releases the
+                # connection back to the pool
                 if response.status == 200:
-                    logger.info(f"Pushover notification sent successfully: {title}")
+                    logger.info("Pushover notification sent successfully: %s", title)
                     return True
                 else:
-                    error_text = await response.text()
-                    logger.error(f"Pushover notification failed (HTTP {response.status}): {error_text}")
+                    # Bounded read: an error page could be arbitrarily large
+                    error_body = await response.content.read(self.MAX_ERROR_BODY_BYTES)
+                    error_text = error_body.decode('utf-8', 'replace')
+                    logger.error("Pushover notification failed (HTTP %d): %s", response.status, error_text)
                     return False
                     
         except Exception as e:
@@ -212,12 +209,12 @@ class NotificationService:
         Returns:
             True if notification was sent successfully.
         """
-        if not self._config.notify_on_failure:
-            logger.debug("Failure notifications disabled, skipping")
-            return False
-        
-        if not self._config.is_configured:
-            logger.debug("No notification service configured")
+        if not self._failures_enabled:
+            if logger.isEnabledFor(logging.DEBUG):
+                if not self._config.notify_on_failure:
+                    logger.debug("Failure notifications disabled, skipping")
+                else:
+                    logger.debug("No notification service configured")
             return False
         
         # Format the notification
@@ -225,14 +222,9 @@ class NotificationService:
         title = "⚠️ SubGen-Azure-Batch: Transcription Failed"
         
         # Build message
-        lines = [f"File: {file_name}"]
-        if source:
-            lines.append(f"Source: {source}")
-        if job_id:
-            lines.append(f"Job ID: {job_id[:8]}...")
-        lines.append(f"\nError: {error}")
-        
-        message = "\n".join(lines)
+        source_line = f"\nSource: {source}" if source else ""
+        job_line = f"\nJob ID: {job_id[:8]}..." if job_id else ""
+        message = f"File: {file_name}{source_line}{job_line}\n\nError: {error}"
         
         # Send via configured services
         success = False
@@ -245,6 +237,91 @@ class NotificationService:
         
         return success
     
+    async def queue_job_failed(
+        self,
+        file_path: str,
+        error: str,
+        job_id: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> bool:
+        """
+        Queue a failure notification, to be sent within FAILURE_DIGEST_WINDOW.
+        
+        Failures queued in the same window (e.g. during an Azure outage) are
+        combined into one digest notification instead of one per job; a lone
+        failure is sent exactly as notify_job_failed would send it.
+        
+        Args:
+            file_path: Path to the media file that failed.
+            error: Error message describing the failure.
+            job_id: Optional job ID for reference.
+            source: Optional source of the job (e.g., "Plex", "Bazarr", "UI").
+            
+        Returns:
+            True if the failure was queued (notifications enabled and configured).
+        """
+        if not self._failures_enabled:
+            return False
+        
+        self._pending_failures.append(FailureEvent(Path(file_path).name, error, job_id, source))
+        if self._digest_task is None or self._digest_task.done():
+            self._digest_task = asyncio.create_task(self._send_digest_later())
+            self._digest_task.add_done_callback(_log_if_failed)
+        return True
+    
+    async def _send_digest_later(self) -> None:
+        """Wait for the digest window to close, then send the queued failures."""
+        await asyncio.sleep(self.FAILURE_DIGEST_WINDOW)
+        self._digest_sending = True
+        try:
+            await self.flush_failures()
+        finally:
+            self._digest_sending = False
+    
+    async def flush_failures(self) -> bool:
+        """
+        Send all queued failures now.
+        
+        Returns:
+            True if a notification was sent successfully.
+        """
+        events, self._pending_failures = self._pending_failures, []
+        if not events:
+            return False
+        
+        if len(events) == 1:
+            file_name, error, job_id, source = events[0]
+            return await self.notify_job_failed(
+                file_path=file_name,
+                error=error,
+                job_id=job_id,
+                source=source,
+            )
+        
+        return await self.send_pushover(
+            title=f"⚠️ SubGen-Azure-Batch: {len(events)} Transcriptions Failed",
+            message=self._format_failure_digest(events),
+        )
+    
+    def _format_failure_digest(self, events: List[FailureEvent]) -> str:
+        """Format several failures as one message, grouped by source."""
+        by_source: DefaultDict[str, List[FailureEvent]] = defaultdict(list)
+        for event in events[:self.FAILURE_DIGEST_MAX_ENTRIES]:
+            by_source[event.source or "Unknown source"].append(event)
+        
+        sections = [
+            f"{source}:\n" + "\n".join(f"• {file_name}: {error}" for file_name, error, _, _ in group)
+            for source, group in by_source.items()
+        ]
+        remaining = len(events) - self.FAILURE_DIGEST_MAX_ENTRIES
+        if remaining > 0:
+            sections.append(f"+{remaining} more")
+        
+        message = "\n\n".join(sections)
+        if len(message) > self.PUSHOVER_MAX_MESSAGE_LENGTH:
+            message = message[:self.PUSHOVER_MAX_MESSAGE_LENGTH - 1] + "…"
+        return message
+    
     async def test_notification(self) -> dict:
         """
         Send a test notification to verify configuration.
@@ -270,6 +347,23 @@ class NotificationService:
         return results
 
 
+@lru_cache(maxsize=1)
+def get_notifier() -> NotificationService:
+    """
+    Get the shared NotificationService, creating it on first call.
+    
+    lru_cache makes this a lazy singleton without a module-level check-then-set;
+    later calls are a single cache lookup.
+    """
+    return NotificationService(get_settings().notification)
+
+
+async def close_notifier() -> None:
+    """Send queued failures and close the shared notifier, if it was created."""
+    if get_notifier.cache_info().currsize:
+        await get_notifier().close()
+
+
 # Convenience function for use throughout the app
 async def notify_failure(
     file_path: str,
@@ -280,11 +374,13 @@ async def notify_failure(
     """
     Convenience function to send a failure notification.
     
-    This is a fire-and-forget function that won't raise exceptions.
+    This is a fire-and-forget function that won't raise exceptions. The
+    failure is queued and sent (batched with any other failures arriving
+    within a couple of seconds) in the background.
     """
     try:
-        notifier = NotificationService.get_instance()
-        return await notifier.notify_job_failed(
+        notifier = get_notifier()
+        return await notifier.queue_job_failed(
             file_path=file_path,
             error=error,
             job_id=job_id,
@@ -0,0 +1,90 @@
+"""
+Request body decompression for SubGen-Azure-Batch.
+
+Bazarr uploads uncompressed WAV/PCM audio, which compresses well. Clients may
+send the request body with ``Content-Encoding: gzip`` (or ``deflate``); this
+ASGI middleware inflates it chunk by chunk as it arrives, so the multipart
+parser and the handlers only ever see the plain body. Inflated output is
+handed on in bounded pieces and capped in total, rejecting decompression
+bombs with 413.
+"""
+
+import zlib
+from typing import Iterable, Tuple
+
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Request encodings that are decompressed; also advertised via Accept-Encoding
+SUPPORTED_ENCODINGS = ("gzip", "deflate")
+_SUPPORTED = frozenset(e.encode() for e in SUPPORTED_ENCODINGS) | {b"x-gzip"}
+
+# Header detection: accepts both gzip and zlib (HTTP "deflate") streams
+_WBITS = zlib.MAX_WBITS | 32
+
+# Upper bound on an inflated body (16 kHz mono PCM is ~115 MB per hour of audio)
+MAX_DECOMPRESSED_SIZE = 2 * 1024 * 1024 * 1024
+
+# Inflate at most this much per ASGI message, so one small compressed chunk
+# cannot expand into a huge allocation
+_INFLATE_CHUNK_SIZE = 1024 * 1024
+
+
+def _content_encoding(headers: Iterable[Tuple[bytes, bytes]]) -> bytes:
+    """Get the lowercased Content-Encoding request header (b"" if absent)."""
+    for name, value in headers:
+        if name == b"content-encoding":
+            return value.strip().lower()
+    return b""
+
+
+class RequestDecompressionMiddleware:
+    """Inflate gzip/deflate-encoded request bodies before they reach the app."""
+    
+    def __init__(self, app: ASGIApp, max_size: int = MAX_DECOMPRESSED_SIZE) -> None:
+        self.app = app
+        self.max_size = max_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or _content_encoding(scope["headers"]) not in _SUPPORTED:
+            await self.app(scope, receive, send)
+            return
+        
+        # The body length changes, so drop the headers describing the encoded body
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        decompressor = zlib.decompressobj(_WBITS)
+        pending = b""  # Compressed input not yet inflated (unconsumed_tail)
+        last_chunk = False
+        total_size = 0
+        
+        async def receive_inflated() -> Message:
+            nonlocal pending, last_chunk, total_size
+            if pending:
+                data = pending
+            else:
+                message = await receive()
+                if message["type"] != "http.request":
+                    return message
+                data = message.get("body", b"")
+                last_chunk = not message.get("more_body", False)
+            try:
+                body = decompressor.decompress(data, _INFLATE_CHUNK_SIZE)
+                pending = decompressor.unconsumed_tail
+                if last_chunk and not pending:
+                    body += decompressor.flush()
+            except zlib.error as e:
+                raise HTTPException(status_code=400, detail=f"Invalid compressed request body: {e}")
+            total_size += len(body)
+            if total_size > self.max_size:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Decompressed request body exceeds {self.max_size} bytes",
+                )
+            # Leftover input is returned on the next receive() before reading more
+            return {"type": "http.request", "body": body, "more_body": bool(pending) or not last_chunk}
+        
+        await self.app(scope, receive_inflated, send)
@@ -390,10 +390,11 @@ def seconds_to_srt_time(seconds: float) -> str:
     Returns:
         Time in format HH:MM:SS,mmm
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
+    # Integer divmod on whole seconds (one float op for the millis)
+    whole = int(seconds)
+    millis = int((seconds - whole) * 1000)
+    minutes, secs = divmod(whole, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
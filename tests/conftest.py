@@ -103,6 +103,12 @@ def mock_settings():
     mock_azure.speech_region = "swedencentral"
     mock_azure.storage_connection_string = "test-connection-string"
     mock_azure.storage_container = "test-container"
+    mock_azure.upload_concurrency = 8
+    mock_azure.upload_block_size_mb = 8
+    mock_azure.use_webhook = False
+    mock_azure.webhook_url = ""
+    mock_azure.webhook_secret = ""
+    mock_azure.webhook_enabled = False
     mock_azure.is_configured = True
     mock_azure.requires_storage = True
     mock_azure.api_base_url = "https://swedencentral.api.cognitive.microsoft.com/speechtotext/v3.2"
@@ -109,6 +109,25 @@ class TestMediaExtensions:
                                          VIDEO_EXTENSIONS)
         
         assert MEDIA_EXTENSIONS == VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
+    
+    def test_find_media_files_walks_tree_once(self, tmp_path):
+        """Test find_media_files returns media files from all subfolders."""
+        from app.utils.audio_extractor import find_media_files
+        
+        (tmp_path / "Show" / "Season 1").mkdir(parents=True)
+        (tmp_path / "Show" / "Season 1" / "e01.MKV").touch()
+        (tmp_path / "Show" / "e00.mp4").touch()
+        (tmp_path / "Show" / "e00.srt").touch()
+        (tmp_path / "song.flac").touch()
+        # A link back up the tree must not be followed
+        (tmp_path / "Show" / "loop").symlink_to(tmp_path, target_is_directory=True)
+        
+        assert find_media_files(str(tmp_path)) == sorted([
+            str(tmp_path / "Show" / "Season 1" / "e01.MKV"),
+            str(tmp_path / "Show" / "e00.mp4"),
+            str(tmp_path / "song.flac"),
+        ])
+        assert find_media_files(str(tmp_path / "missing")) == []
 
 
 class TestTranscodeDir:
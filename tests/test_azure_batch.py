@@ -73,6 +73,410 @@ class TestTranscriptionResultClass:
         assert result.text == 'Hello World'
 
 
+class TestSharedSession:
+    """Test the shared aiohttp session used by all transcribers."""
+    
+    @pytest.mark.asyncio
+    async def test_transcribers_share_session(self, mock_settings):
+        """Test that separate transcribers reuse the same HTTP session."""
+        from unittest.mock import patch
+
+        from app.utils.http_session import close_shared_session
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            first = AzureBatchTranscriber()
+            second = AzureBatchTranscriber()
+            
+            session = await first._get_session()
+            await first.close()
+            
+            assert await second._get_session() is session
+            assert not session.closed
+        
+        await close_shared_session()
+        assert session.closed
+    
+    @pytest.mark.asyncio
+    async def test_blob_client_is_cached(self, mock_settings):
+        """Test that the blob container client is created once and released on close."""
+        from unittest.mock import patch
+
+        from app.utils.http_session import close_shared_session
+        
+        mock_settings.azure.storage_connection_string = (
+            "DefaultEndpointsProtocol=https;AccountName=acct;"
+            "AccountKey=eA==;EndpointSuffix=core.windows.net"
+        )
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+            container_client = transcriber._get_container_client()
+            
+            assert transcriber._get_container_client() is container_client
+            assert container_client.container_name == "test-container"
+            
+            await transcriber.close()
+            assert transcriber._blob_service_client is None
+            assert not (await transcriber._get_session()).closed
+        
+        await close_shared_session()
+    
+    @pytest.mark.asyncio
+    async def test_get_transcriber_is_shared(self, mock_settings):
+        """Test get_transcriber() returns one instance until close_transcriber()."""
+        from unittest.mock import patch
+
+        from app.utils.azure_batch_transcriber import (close_transcriber,
+                                                       get_transcriber)
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = get_transcriber()
+            assert get_transcriber() is transcriber
+            
+            await close_transcriber()
+            assert get_transcriber() is not transcriber
+        
+        await close_transcriber()
+
+
+class TestBlobCleanup:
+    """Test batched blob deletion."""
+    
+    @pytest.mark.asyncio
+    async def test_delete_blobs_in_batches(self, mock_settings):
+        """Test blobs are deleted in batch requests of at most 256."""
+        from unittest.mock import MagicMock, patch
+        
+        async def delete_blobs(*names, **kwargs):
+            async def responses():
+                for _ in names:
+                    yield MagicMock(status_code=202)
+            return responses()
+        
+        container_client = MagicMock()
+        container_client.delete_blobs = MagicMock(side_effect=delete_blobs)
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+        transcriber._get_container_client = MagicMock(return_value=container_client)
+        
+        names = [f"audio/{i}.ogg" for i in range(300)]
+        deleted = await transcriber.delete_blobs(names)
+        
+        assert deleted == 300
+        assert [len(c.args) for c in container_client.delete_blobs.call_args_list] == [256, 44]
+
+
+class TestBlobUpload:
+    """Test uploading audio from an in-memory stream."""
+
+    @pytest.mark.asyncio
+    async def test_upload_stream_retry_rewinds(self, mock_settings):
+        """Test a failed upload attempt re-sends the stream from its start."""
+        import io
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        sent = []
+
+        async def upload_blob(stream, **kwargs):
+            sent.append(stream.read())
+            if len(sent) == 1:
+                raise ConnectionError("reset")
+
+        blob_client = MagicMock(url="https://acct.blob.core.windows.net/c/audio/x.wav")
+        blob_client.upload_blob = AsyncMock(side_effect=upload_blob)
+        container_client = MagicMock(account_name="acct")
+        container_client.credential.account_key = "eA=="
+        container_client.get_blob_client = MagicMock(return_value=blob_client)
+
+        mock_settings.azure.storage_connection_string = "UseDevelopmentStorage=true"
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+        transcriber._get_container_client = MagicMock(return_value=container_client)
+        transcriber._container_ready = True
+
+        with patch('app.utils.azure_batch_transcriber.asyncio.sleep', AsyncMock()):
+            url, blob_name = await transcriber.upload_audio_stream(io.BytesIO(b"RIFFdata"), 8, ".wav")
+
+        assert sent == [b"RIFFdata", b"RIFFdata"]
+        assert blob_name.startswith("audio/") and blob_name.endswith(".wav")
+        assert url.startswith(blob_client.url + "?")
+
+
+class TestPollingBackoff:
+    """Test polling interval helpers and wait_for_transcription backoff."""
+    
+    def test_parse_retry_after_seconds(self):
+        """Test Retry-After given as delay-seconds."""
+        from app.utils.azure_batch_transcriber import _parse_retry_after
+        
+        assert _parse_retry_after("15") == 15.0
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("not-a-date") is None
+    
+    def test_poll_delay_prefers_retry_after(self):
+        """Test Retry-After overrides the backoff interval within bounds."""
+        from app.utils.azure_batch_transcriber import get_poll_delay
+        
+        assert get_poll_delay(8.0) == 8.0
+        assert get_poll_delay(8.0, retry_after=30.0) == 30.0
+        assert get_poll_delay(8.0, retry_after=0.0) == 2.0
+        assert get_poll_delay(8.0, retry_after=600.0) == 60.0
+        assert get_poll_delay(0.5, min_interval=0.5) == 0.5
+    
+    def test_initial_interval_scales_with_duration(self):
+        """Test the first interval grows with audio duration."""
+        from app.utils.azure_batch_transcriber import get_initial_poll_interval
+        
+        assert get_initial_poll_interval() == 2.0
+        assert get_initial_poll_interval(500.0) == 10.0
+        assert get_initial_poll_interval(7200.0) == 60.0
+        assert get_initial_poll_interval(min_interval=0.5) == 0.5
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_transcription_backs_off(self, mock_settings):
+        """Test the poll loop doubles its delay until the job succeeds."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        
+        running = MagicMock(status=TranscriptionStatus.RUNNING, retry_after=None)
+        succeeded = MagicMock(status=TranscriptionStatus.SUCCEEDED, retry_after=None)
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+        transcriber.get_transcription_status = AsyncMock(side_effect=[running, running, running, succeeded])
+        transcriber.get_transcription_result = AsyncMock(return_value="result")
+        
+        with patch('app.utils.azure_batch_transcriber.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = await transcriber.wait_for_transcription("job-1")
+        
+        assert result == "result"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 4.0, 8.0]
+        
+        transcriber.get_transcription_status = AsyncMock(side_effect=[running, running, succeeded])
+        with patch('app.utils.azure_batch_transcriber.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            await transcriber.wait_for_transcription("job-1", min_poll_interval=0.5)
+        
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+    
+    @pytest.mark.asyncio
+    async def test_get_transcription_results_maps_sources(self, mock_settings):
+        """Test multi-file jobs return one result per source blob."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        
+        def result_file(source: str, text: str) -> dict:
+            return {
+                "source": f"{source}?sv=token",
+                "recognizedPhrases": [
+                    {"offsetInTicks": 0, "durationInTicks": 10000000, "nBest": [{"display": text}]}
+                ],
+            }
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+        transcriber._get_result_content_urls = AsyncMock(return_value=["url-a", "url-b"])
+        transcriber._download_result = AsyncMock(side_effect=[
+            result_file("https://acct/audio/a.wav", "First"),
+            result_file("https://acct/audio/b.wav", "Second"),
+        ])
+        transcriber.get_transcription_status = AsyncMock(return_value=MagicMock(locale="en-US"))
+        
+        results = await transcriber.get_transcription_results("job-1")
+        
+        assert set(results) == {"https://acct/audio/a.wav", "https://acct/audio/b.wav"}
+        assert results["https://acct/audio/b.wav"].text == "Second"
+        assert results["https://acct/audio/a.wav"].language == "en-US"
+    
+    @pytest.mark.asyncio
+    async def test_get_transcription_result_uses_given_locale(self, mock_settings):
+        """Test a known locale avoids the extra job status request."""
+        from unittest.mock import AsyncMock, patch
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+        transcriber._get_result_content_urls = AsyncMock(return_value=["url-a"])
+        transcriber._download_result = AsyncMock(return_value={"recognizedPhrases": []})
+        transcriber.get_transcription_status = AsyncMock()
+        
+        result = await transcriber.get_transcription_result("job-1", locale="nl-NL")
+        
+        assert result.language == "nl-NL"
+        transcriber.get_transcription_status.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_result_content_urls_follow_next_link(self, mock_settings):
+        """Test result files on later pages of the file list are included."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        
+        first = MagicMock(status=200)
+        first.read = AsyncMock(return_value=(
+            b'{"values": [{"kind": "Transcription", "links": {"contentUrl": "url-a"}}],'
+            b' "@nextLink": "https://eastus/transcriptions/job-1/files?skip=1"}'
+        ))
+        second = MagicMock(status=200)
+        second.read = AsyncMock(return_value=(
+            b'{"values": [{"kind": "TranscriptionReport", "links": {"contentUrl": "report"}},'
+            b' {"kind": "Transcription", "links": {"contentUrl": "url-b"}}]}'
+        ))
+        for response in (first, second):
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock()
+        session.get = MagicMock(side_effect=[first, second])
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+        transcriber._get_session = AsyncMock(return_value=session)
+        
+        assert await transcriber._get_result_content_urls("job-1") == ["url-a", "url-b"]
+        assert session.get.call_args_list[1].args[0] == "https://eastus/transcriptions/job-1/files?skip=1"
+    
+    @pytest.mark.asyncio
+    async def test_status_poll_is_conditional(self, mock_settings):
+        """Test a poll after an ETag sends If-None-Match and reuses the job on 304."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        
+        body = (
+            b'{"self": "https://eastus/transcriptions/job-1", "status": "Running",'
+            b' "createdDateTime": "2024-01-01T00:00:00Z"}'
+        )
+        first = MagicMock(status=200, headers={"ETag": '"v1"'})
+        first.read = AsyncMock(return_value=body)
+        unchanged = MagicMock(status=304, headers={"Retry-After": "5"})
+        for response in (first, unchanged):
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock()
+        session.get = MagicMock(side_effect=[first, unchanged])
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+        transcriber._get_session = AsyncMock(return_value=session)
+        
+        job = await transcriber.get_transcription_status("job-1")
+        again = await transcriber.get_transcription_status("job-1")
+        
+        assert "If-None-Match" not in session.get.call_args_list[0].kwargs["headers"]
+        assert session.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert again.status == job.status == TranscriptionStatus.RUNNING
+        assert again.retry_after == 5.0
+
+
+class TestWebhookCallbacks:
+    """Test waiting for transcriptions via Azure completion webhooks."""
+    
+    @pytest.mark.asyncio
+    async def test_callback_wakes_waiter(self):
+        """Test resolving a callback ends the wait early."""
+        import asyncio
+
+        from app.utils.azure_batch_transcriber import (
+            _callback_futures, resolve_transcription_callback, wait_for_callback)
+        
+        waiter = asyncio.create_task(wait_for_callback("job-1", timeout=30))
+        await asyncio.sleep(0)
+        
+        assert resolve_transcription_callback("job-1")
+        assert await waiter is True
+        assert "job-1" not in _callback_futures
+    
+    @pytest.mark.asyncio
+    async def test_wait_times_out_without_callback(self):
+        """Test the wait returns False on timeout and keeps the future registered."""
+        from app.utils.azure_batch_transcriber import (_callback_futures,
+                                                 discard_callback,
+                                                 wait_for_callback)
+        
+        assert await wait_for_callback("job-2", timeout=0.01) is False
+        assert "job-2" in _callback_futures
+        
+        discard_callback("job-2")
+        assert "job-2" not in _callback_futures
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_transcription_uses_callback(self, mock_settings):
+        """Test webhook mode checks status after the callback, not on a backoff timer."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        
+        mock_settings.azure.webhook_enabled = True
+        mock_settings.azure.webhook_url = "https://subgen.example.com/webhook/azure"
+        running = MagicMock(status=TranscriptionStatus.RUNNING)
+        succeeded = MagicMock(status=TranscriptionStatus.SUCCEEDED, locale="en-US")
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+        transcriber.get_transcription_status = AsyncMock(side_effect=[running, succeeded])
+        transcriber.get_transcription_result = AsyncMock(return_value="result")
+        
+        with patch('app.utils.azure_batch_transcriber.wait_for_callback',
+                   new=AsyncMock(return_value=True)) as mock_wait:
+            result = await transcriber.wait_for_transcription("job-3")
+        
+        assert result == "result"
+        mock_wait.assert_awaited_once()
+        transcriber.get_transcription_result.assert_awaited_once_with("job-3", locale="en-US")
+
+    
+    @pytest.mark.asyncio
+    async def test_callback_during_first_status_check_is_kept(self, mock_settings):
+        """Test a callback arriving before the first wait still ends it early."""
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from app.utils.azure_batch_transcriber import (
+            _callback_futures, resolve_transcription_callback)
+        
+        mock_settings.azure.webhook_enabled = True
+        mock_settings.azure.webhook_url = "https://subgen.example.com/webhook/azure"
+        running = MagicMock(status=TranscriptionStatus.RUNNING)
+        succeeded = MagicMock(status=TranscriptionStatus.SUCCEEDED, locale="en-US")
+        
+        async def status_with_early_callback(job_id):
+            # Azure calls back while the first status request is in flight
+            if not resolve_transcription_callback(job_id):
+                return succeeded
+            return running
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings):
+            transcriber = AzureBatchTranscriber()
+        transcriber.get_transcription_status = AsyncMock(side_effect=status_with_early_callback)
+        transcriber.get_transcription_result = AsyncMock(return_value="result")
+        
+        with patch('app.utils.azure_batch_transcriber.WEBHOOK_FALLBACK_POLL_INTERVAL', 30):
+            result = await asyncio.wait_for(transcriber.wait_for_transcription("job-4"), timeout=5)
+        
+        assert result == "result"
+        assert transcriber.get_transcription_status.await_count == 2
+        assert "job-4" not in _callback_futures
+
+class TestSupportedLocalesCache:
+    """Test caching of the supported locales list."""
+    
+    @pytest.mark.asyncio
+    async def test_locales_are_cached(self, mock_settings):
+        """Test repeated calls reuse the cached list until a forced refresh."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from app.utils import azure_batch_transcriber
+        
+        response = MagicMock(status=200)
+        response.read = AsyncMock(return_value=b'["en-US", "nl-NL"]')
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock()
+        session.get = MagicMock(return_value=response)
+        
+        with patch('app.utils.azure_batch_transcriber.get_settings', return_value=mock_settings), \
+                patch.dict(azure_batch_transcriber._locales_cache, clear=True):
+            transcriber = AzureBatchTranscriber()
+            transcriber._get_session = AsyncMock(return_value=session)
+            
+            assert await transcriber.get_supported_locales() == ["en-US", "nl-NL"]
+            assert await transcriber.get_supported_locales() == ["en-US", "nl-NL"]
+            assert session.get.call_count == 1
+            
+            await transcriber.get_supported_locales(force_refresh=True)
+            assert session.get.call_count == 2
+
+
 class TestAzureBatchTranscriptionAPI:
     """Test Azure Batch Transcription API directly."""
     
@@ -235,6 +639,69 @@ class TestTranscriptionResultParsing:
         print("✓ Successfully parsed Azure result to SRT format")
         print(f"Generated SRT:\n{srt_content}")
     
+    def test_parse_recognized_phrases(self):
+        """Test parsing Azure recognizedPhrases into segments."""
+        from app.utils.azure_batch_transcriber import parse_recognized_phrases
+        
+        phrases = [
+            {
+                "offsetInTicks": 10000000,
+                "durationInTicks": 20000000,
+                "locale": "nl-NL",
+                "nBest": [{"display": "Hallo wereld.", "confidence": 0.9}],
+            },
+            {
+                "offsetInTicks": 40000000,
+                "durationInTicks": 10000000,
+                "nBest": [],  # No text - skipped but still extends duration
+            },
+        ]
+        
+        segments, duration, locale = parse_recognized_phrases(phrases)
+        
+        assert len(segments) == 1
+        assert segments[0].start == 1.0
+        assert segments[0].end == 3.0
+        assert segments[0].text == "Hallo wereld."
+        assert segments[0].confidence == 0.9
+        assert duration == 5.0
+        assert locale == "nl-NL"
+    
+    @pytest.mark.asyncio
+    async def test_stream_parse_result(self):
+        """Test streaming parse keeps only the used top-level keys."""
+        pytest.importorskip("ijson")
+        import orjson
+
+        from app.utils.azure_batch_transcriber import (_stream_parse_result,
+                                                 parse_recognized_phrases)
+        
+        class ChunkedStream:
+            def __init__(self, data: bytes):
+                self._buffer = data
+            
+            async def read(self, n: int = -1) -> bytes:
+                size = 7 if n < 0 else min(n, 7)
+                chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+                return chunk
+        
+        body = orjson.dumps({
+            "source": "https://acct/audio/a.wav",
+            "combinedRecognizedPhrases": [{"display": "Hello there."}],
+            "recognizedPhrases": [
+                {"offsetInTicks": 5000000, "durationInTicks": 15000000,
+                 "nBest": [{"display": "Hello there.", "confidence": 0.87}]},
+            ],
+        })
+        
+        result = await _stream_parse_result(ChunkedStream(body))
+        
+        assert set(result) == {"source", "recognizedPhrases"}
+        segments, duration, _ = parse_recognized_phrases(result["recognizedPhrases"])
+        assert segments[0].start == 0.5
+        assert segments[0].confidence == 0.87
+        assert duration == 2.0
+    
     def _convert_to_srt(self, azure_result: dict) -> str:
         """Convert Azure transcription result to SRT format."""
         srt_lines = []
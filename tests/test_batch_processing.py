@@ -0,0 +1,51 @@
+"""
+Tests for batch session processing.
+
+Tests cover:
+- Worker pool processing each job of a session exactly once
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+
+class TestProcessBatchSession:
+    """Test process_batch_session."""
+    
+    @pytest.mark.asyncio
+    async def test_workers_process_each_job_once(self):
+        """Test a pool smaller than the session still runs every job once."""
+        from app.routers import batch
+        from app.transcription_service import (JobSource,
+                                               TranscriptionService)
+        
+        session = await TranscriptionService.create_session(source=JobSource.UI)
+        jobs = [
+            await TranscriptionService.add_job(
+                session_id=session.id, file_path=f"/test{i}.mkv", language="en", source=JobSource.UI
+            )
+            for i in range(5)
+        ]
+        
+        processed = []
+        
+        async def fake_process(session_id, job_id):
+            await asyncio.sleep(0)
+            processed.append(job_id)
+        
+        mock_settings = MagicMock()
+        mock_settings.concurrent_transcriptions = 2
+        
+        with patch.object(batch, "get_settings", return_value=mock_settings), \
+             patch.object(batch, "process_batch_job", side_effect=fake_process), \
+             patch.object(batch, "_refresh_media_servers_for_completed_jobs", new=AsyncMock()) as refresh:
+            await batch.process_batch_session(session.id)
+        
+        assert sorted(processed) == sorted(job.id for job in jobs)
+        refresh.assert_awaited_once()
+        
+        await TranscriptionService.delete_session(session.id)
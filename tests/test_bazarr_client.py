@@ -8,6 +8,7 @@ Tests cover:
 - Path-based lookups
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -256,20 +257,192 @@ class TestBazarrClientDiskScan:
             assert result is False
 
 
+class TestBazarrClientPathSearch:
+    """Test BazarrClient path-based series/movie lookup."""
+    
+    @pytest.mark.asyncio
+    async def test_catalog_is_cached(self, mock_settings, mock_aiohttp_session):
+        """Test repeated searches download the series catalog once."""
+        from app.utils import bazarr_client
+        from app.utils.bazarr_client import BazarrClient
+        
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={'data': [
+            {'path': '/tv/Show A', 'sonarrSeriesId': 1},
+            {'path': '/tv/Show B', 'sonarrSeriesId': 2},
+        ]})
+        mock_response.content_length = 128
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_aiohttp_session.get = MagicMock(return_value=mock_response)
+        
+        with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings), \
+                patch.dict(bazarr_client._catalog_cache, clear=True):
+            client = BazarrClient(session=mock_aiohttp_session)
+            
+            first = await client.search_series_by_path('/tv/Show B/S01E01.mkv')
+            second = await client.search_series_by_path('/tv/Show A/S01E02.mkv')
+            
+            assert first['sonarrSeriesId'] == 2
+            assert second['sonarrSeriesId'] == 1
+            assert mock_aiohttp_session.get.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_download(self, mock_settings, mock_aiohttp_session):
+        """Test concurrent searches on a cold cache download the catalog once."""
+        from app.utils import bazarr_client
+        from app.utils.bazarr_client import BazarrClient
+        
+        async def slow_json():
+            await asyncio.sleep(0.01)
+            return {'data': [{'path': '/tv/Show A', 'sonarrSeriesId': 1}]}
+        
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(side_effect=slow_json)
+        mock_response.content_length = 128
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_aiohttp_session.get = MagicMock(return_value=mock_response)
+        
+        with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings), \
+                patch.dict(bazarr_client._catalog_cache, clear=True):
+            client = BazarrClient(session=mock_aiohttp_session)
+            
+            results = await asyncio.gather(*(
+                client.search_series_by_path(f'/tv/Show A/S01E0{i}.mkv') for i in range(1, 6)
+            ))
+            
+            assert [r['sonarrSeriesId'] for r in results] == [1] * 5
+            assert mock_aiohttp_session.get.call_count == 1
+            assert not bazarr_client._catalog_fetches
+    
+    @pytest.mark.asyncio
+    async def test_stream_path_index(self):
+        """Test large catalogs are indexed record by record from the byte stream."""
+        pytest.importorskip("ijson")
+        import orjson
+
+        from app.utils.bazarr_client import _find_by_path, _stream_path_index
+        
+        class ChunkedStream:
+            def __init__(self, data: bytes):
+                self._buffer = data
+            
+            async def read(self, n: int = -1) -> bytes:
+                size = 7 if n < 0 else min(n, 7)
+                chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+                return chunk
+        
+        body = orjson.dumps({'data': [
+            {'path': '/movies/Film A (2020)', 'radarrId': 1},
+            {'path': None, 'radarrId': 2},
+            {'path': '/movies/Film B (2021)', 'radarrId': 3},
+        ], 'total': 3})
+        
+        index = await _stream_path_index(ChunkedStream(body))
+        
+        assert len(index) == 2
+        assert _find_by_path(index, '/movies/Film B (2021)/film.mkv')['radarrId'] == 3
+    
+    @pytest.mark.asyncio
+    async def test_catalog_without_length_is_streamed(self, mock_settings, mock_aiohttp_session):
+        """Test a response with no Content-Length (chunked) is stream-parsed."""
+        pytest.importorskip("ijson")
+        import orjson
+
+        from app.utils import bazarr_client
+        from app.utils.bazarr_client import BazarrClient
+        
+        body = orjson.dumps({'data': [{'path': '/movies/Film A (2020)', 'radarrId': 4}]})
+        
+        class Stream:
+            def __init__(self, data: bytes):
+                self._buffer = data
+            
+            async def read(self, n: int = -1) -> bytes:
+                size = len(self._buffer) if n < 0 else n
+                chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+                return chunk
+        
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.content_length = None
+        mock_response.content = Stream(body)
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_aiohttp_session.get = MagicMock(return_value=mock_response)
+        
+        with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings), \
+                patch.dict(bazarr_client._catalog_cache, clear=True):
+            client = BazarrClient(session=mock_aiohttp_session)
+            movie = await client.search_movie_by_path('/movies/Film A (2020)/film.mkv')
+        
+        assert movie['radarrId'] == 4
+        mock_response.json.assert_not_awaited()
+    
+    def test_find_by_path_matches_folder_boundaries(self):
+        """Test path lookup matches whole folders and prefers the deepest one."""
+        from app.utils.bazarr_client import _build_path_index, _find_by_path
+        
+        index = _build_path_index([
+            {'path': '', 'id': 0},
+            {'path': '/tv/Show', 'id': 1},
+            {'path': '/tv/Show 2/', 'id': 2},
+            {'path': '/tv/Show/Specials', 'id': 3},
+        ])
+        
+        assert _find_by_path(index, '/tv/Show/S01/E01.mkv')['id'] == 1
+        assert _find_by_path(index, '/tv/Show 2/E01.mkv')['id'] == 2
+        assert _find_by_path(index, '/tv/Show/Specials/E00.mkv')['id'] == 3
+        assert _find_by_path(index, '/tv/Other/E01.mkv') is None
+    
+    def test_find_by_path_normalizes_paths(self):
+        """Test redundant separators and dot segments do not break lookups."""
+        from app.utils.bazarr_client import _build_path_index, _find_by_path
+        
+        index = _build_path_index([
+            {'path': '/media//showA/', 'id': 1},
+        ])
+        
+        assert _find_by_path(index, '/media/showA/./S01/E01.mkv')['id'] == 1
+        assert _find_by_path(index, '/media/other/../showA/E01.mkv')['id'] == 1
+        assert _find_by_path(index, '/media/showA2/E01.mkv') is None
+
+
 class TestBazarrClientSessionManagement:
     """Test BazarrClient session management."""
     
     @pytest.mark.asyncio
-    async def test_close_session(self, mock_settings, mock_aiohttp_session):
-        """Test closing the client session."""
+    async def test_close_leaves_injected_session_open(self, mock_settings, mock_aiohttp_session):
+        """Test closing the client does not close an injected session."""
         from app.utils.bazarr_client import BazarrClient
         
         with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings):
-            client = BazarrClient()
-            client._session = mock_aiohttp_session
+            client = BazarrClient(session=mock_aiohttp_session)
             
+            assert await client._get_session() is mock_aiohttp_session
             await client.close()
-            mock_aiohttp_session.close.assert_called_once()
+            mock_aiohttp_session.close.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_clients_share_session(self, mock_settings):
+        """Test separate clients reuse the same shared session."""
+        from app.utils.bazarr_client import BazarrClient
+        from app.utils.http_session import close_shared_session
+        
+        with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings):
+            first = BazarrClient()
+            second = BazarrClient()
+            
+            session = await first._get_session()
+            await first.close()
+            assert await second._get_session() is session
+            assert not session.closed
+        
+        await close_shared_session()
+        assert session.closed
     
     @pytest.mark.asyncio
     async def test_close_no_session(self, mock_settings):
@@ -280,6 +453,19 @@ class TestBazarrClientSessionManagement:
             client = BazarrClient()
             # Should not raise even with no session
             await client.close()
+    
+    def test_get_bazarr_client_is_shared(self, mock_settings):
+        """Test get_bazarr_client() returns one cached instance."""
+        from app.utils.bazarr_client import get_bazarr_client
+        
+        get_bazarr_client.cache_clear()
+        try:
+            with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings):
+                client = get_bazarr_client()
+                assert get_bazarr_client() is client
+                assert client.url == mock_settings.bazarr.url.rstrip('/')
+        finally:
+            get_bazarr_client.cache_clear()
 
 
 class TestNotifyBazarrOfNewSubtitle:
@@ -291,16 +477,81 @@ class TestNotifyBazarrOfNewSubtitle:
         from app.utils.bazarr_client import notify_bazarr_of_new_subtitle
         
         with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings):
-            with patch('app.utils.bazarr_client.BazarrClient') as MockClient:
+            with patch('app.utils.bazarr_client.get_bazarr_client') as mock_get_client:
                 mock_instance = AsyncMock()
                 mock_instance.search_series_by_path = AsyncMock(return_value={'sonarrSeriesId': 123})
                 mock_instance.trigger_series_scan = AsyncMock(return_value=True)
                 mock_instance.close = AsyncMock()
-                MockClient.return_value = mock_instance
+                mock_get_client.return_value = mock_instance
                 
                 result = await notify_bazarr_of_new_subtitle("/tv/show/episode.mkv")
                 assert result is True
     
+    @pytest.mark.asyncio
+    async def test_notify_movie_when_no_series(self, mock_settings):
+        """Test movie scan is triggered when only the movie catalog matches."""
+        from app.utils.bazarr_client import notify_bazarr_of_new_subtitle
+        
+        with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings):
+            with patch('app.utils.bazarr_client.get_bazarr_client') as mock_get_client:
+                mock_instance = AsyncMock()
+                mock_instance.search_series_by_path = AsyncMock(return_value=None)
+                mock_instance.search_movie_by_path = AsyncMock(return_value={'radarrId': 7})
+                mock_instance.trigger_movie_scan = AsyncMock(return_value=True)
+                mock_get_client.return_value = mock_instance
+                
+                result = await notify_bazarr_of_new_subtitle("/movies/film/film.mkv")
+                assert result is True
+                mock_instance.trigger_movie_scan.assert_awaited_once_with(7)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_notifications_share_scan(self, mock_settings):
+        """Test concurrent notifications for one series trigger a single scan."""
+        from app.utils import bazarr_client
+        from app.utils.bazarr_client import notify_bazarr_of_new_subtitle
+        
+        async def slow_scan(series_id):
+            await asyncio.sleep(0.01)
+            return True
+        
+        with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings), \
+                patch.dict(bazarr_client._inflight_scans, clear=True):
+            with patch('app.utils.bazarr_client.get_bazarr_client') as mock_get_client:
+                mock_instance = AsyncMock()
+                mock_instance.url = "http://localhost:6767"
+                mock_instance.search_series_by_path = AsyncMock(return_value={'sonarrSeriesId': 5})
+                mock_instance.trigger_series_scan = AsyncMock(side_effect=slow_scan)
+                mock_get_client.return_value = mock_instance
+                
+                results = await asyncio.gather(*(
+                    notify_bazarr_of_new_subtitle(f"/tv/show/S01E0{i}.mkv") for i in range(1, 6)
+                ))
+                
+                assert results == [True] * 5
+                mock_instance.trigger_series_scan.assert_awaited_once_with(5)
+    
+    @pytest.mark.asyncio
+    async def test_notification_after_scan_finished_starts_new_scan(self, mock_settings):
+        """Test a notification after a scan completed triggers a fresh scan."""
+        from app.utils import bazarr_client
+        from app.utils.bazarr_client import notify_bazarr_of_new_subtitle
+        
+        with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings), \
+                patch.dict(bazarr_client._inflight_scans, clear=True):
+            with patch('app.utils.bazarr_client.get_bazarr_client') as mock_get_client:
+                mock_instance = AsyncMock()
+                mock_instance.url = "http://localhost:6767"
+                mock_instance.search_series_by_path = AsyncMock(return_value={'sonarrSeriesId': 5})
+                mock_instance.trigger_series_scan = AsyncMock(return_value=True)
+                mock_get_client.return_value = mock_instance
+                
+                assert await notify_bazarr_of_new_subtitle("/tv/show/S01E01.mkv") is True
+                await asyncio.sleep(0)
+                assert bazarr_client._inflight_scans == {}
+                assert await notify_bazarr_of_new_subtitle("/tv/show/S01E02.mkv") is True
+                
+                assert mock_instance.trigger_series_scan.await_count == 2
+    
     @pytest.mark.asyncio
     async def test_notify_not_configured(self, mock_settings):
         """Test notification when Bazarr is not configured."""
@@ -310,9 +561,15 @@ class TestNotifyBazarrOfNewSubtitle:
         mock_settings.bazarr.api_key = ""
         mock_settings.bazarr.is_configured = False
         
-        with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings):
-            result = await notify_bazarr_of_new_subtitle("/tv/show/episode.mkv")
-            assert result is False
+        from app.utils.bazarr_client import get_bazarr_client
+        
+        get_bazarr_client.cache_clear()
+        try:
+            with patch('app.utils.bazarr_client.get_settings', return_value=mock_settings):
+                result = await notify_bazarr_of_new_subtitle("/tv/show/episode.mkv")
+                assert result is False
+        finally:
+            get_bazarr_client.cache_clear()
 
 
 if __name__ == "__main__":
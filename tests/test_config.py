@@ -125,6 +125,27 @@ class TestAzureConfig:
         )
         expected = "https://swedencentral.api.cognitive.microsoft.com/speechtotext/v3.2"
         assert config.api_base_url == expected
+    
+    def test_upload_tuning_from_env(self):
+        """Test blob upload tuning is loaded from environment."""
+        from app.config import Settings
+        
+        env = {'AZURE_UPLOAD_CONCURRENCY': '16', 'AZURE_UPLOAD_BLOCK_SIZE_MB': '4'}
+        with patch.dict(os.environ, env):
+            settings = Settings.from_env()
+        
+        assert settings.azure.upload_concurrency == 16
+        assert settings.azure.upload_block_size_mb == 4
+    
+    def test_webhook_enabled_requires_url(self):
+        """Test webhooks are only enabled when a callback URL is set."""
+        from app.config import AzureConfig
+        
+        assert not AzureConfig(use_webhook=True).webhook_enabled
+        assert not AzureConfig(webhook_url="https://subgen.example.com/webhook/azure").webhook_enabled
+        assert AzureConfig(
+            use_webhook=True, webhook_url="https://subgen.example.com/webhook/azure"
+        ).webhook_enabled
 
 
 class TestBazarrConfig:
@@ -215,6 +236,19 @@ class TestPathMappingConfig:
         
         result = config.apply("/tv/Show/episode.mkv")
         assert result == "/tv/Show/episode.mkv"
+    
+    def test_apply_only_replaces_prefix(self):
+        """Test from_path occurring later in the path is left untouched."""
+        from app.config import PathMappingConfig
+        
+        config = PathMappingConfig(
+            enabled=True,
+            from_path="/tv",
+            to_path="/Volumes/TV"
+        )
+        
+        assert config.apply("/tv/Show/tv/episode.mkv") == "/Volumes/TV/Show/tv/episode.mkv"
+        assert config.apply("/movies/tv/film.mkv") == "/movies/tv/film.mkv"
 
 
 class TestTranscriptionConfig:
@@ -235,10 +269,21 @@ class TestTranscriptionConfig:
         from app.config import TranscriptionConfig
         
         config = TranscriptionConfig(preferred_audio_languages="eng|deu|fra")
-        assert config.preferred_audio_languages_list == ["eng", "deu", "fra"]
+        assert config.preferred_audio_languages_list == ("eng", "deu", "fra")
         
         config_empty = TranscriptionConfig(preferred_audio_languages="")
-        assert config_empty.preferred_audio_languages_list == []
+        assert config_empty.preferred_audio_languages_list == ()
+    
+    def test_config_is_read_only(self):
+        """Test config objects cannot be modified after loading."""
+        from dataclasses import FrozenInstanceError
+
+        from app.config import TranscriptionConfig
+        
+        config = TranscriptionConfig(preferred_audio_languages="eng")
+        with pytest.raises(FrozenInstanceError):
+            config.preferred_audio_languages = "deu"
+        assert not hasattr(config, '__dict__')
 
 
 class TestSubtitleNamingConfig:
@@ -322,6 +367,26 @@ class TestSettingsSingleton:
         assert hasattr(settings, 'skip')
         assert hasattr(settings, 'subtitle_naming')
         assert hasattr(settings, 'path_mapping')
+    
+    def test_cors_origins_from_env(self):
+        """Test CORS origins default to any and can be disabled with an empty value."""
+        from app.config import Settings
+        
+        with patch.dict(os.environ, {}, clear=True):
+            assert Settings.from_env().cors_origins == ["*"]
+        with patch.dict(os.environ, {'CORS_ORIGINS': 'http://a.lan:9000, http://b.lan'}):
+            assert Settings.from_env().cors_origins == ["http://a.lan:9000", "http://b.lan"]
+        with patch.dict(os.environ, {'CORS_ORIGINS': ''}):
+            assert Settings.from_env().cors_origins == []
+    
+    def test_max_concurrent_asr_from_env(self):
+        """Test the Bazarr audio preparation limit defaults to 4."""
+        from app.config import Settings
+        
+        with patch.dict(os.environ, {}, clear=True):
+            assert Settings.from_env().max_concurrent_asr == 4
+        with patch.dict(os.environ, {'MAX_CONCURRENT_ASR': '8'}):
+            assert Settings.from_env().max_concurrent_asr == 8
 
 
 class TestRequireAzureConfigured:
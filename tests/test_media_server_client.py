@@ -89,10 +89,13 @@ class TestPlexClient:
             
             result = await client.refresh_metadata("12345")
             assert result is True
+            # Auth travels per request, since the session is shared app-wide
+            headers = mock_aiohttp_session.put.call_args.kwargs['headers']
+            assert headers == {"X-Plex-Token": mock_settings.plex.token}
     
     @pytest.mark.asyncio
-    async def test_close_session(self, mock_settings, mock_aiohttp_session):
-        """Test closing the client session."""
+    async def test_close_leaves_session_open(self, mock_settings, mock_aiohttp_session):
+        """Test closing the client does not close a session it does not own."""
         from app.utils.media_server_client import PlexClient
         
         with patch('app.utils.media_server_client.get_settings', return_value=mock_settings):
@@ -100,7 +103,19 @@ class TestPlexClient:
             client._session = mock_aiohttp_session
             
             await client.close()
-            mock_aiohttp_session.close.assert_called_once()
+            mock_aiohttp_session.close.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_clients_share_session(self, mock_settings):
+        """Test Plex and Jellyfin clients use the app-wide shared session."""
+        from app.utils.http_session import close_shared_session
+        from app.utils.media_server_client import JellyfinClient, PlexClient
+        
+        with patch('app.utils.media_server_client.get_settings', return_value=mock_settings):
+            session = await PlexClient()._get_session()
+            assert await JellyfinClient()._get_session() is session
+        
+        await close_shared_session()
 
 
 class TestJellyfinClient:
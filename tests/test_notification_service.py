@@ -85,6 +85,36 @@ class TestNotificationServiceSingleton:
         # Cleanup
         NotificationService.reset_instance()
     
+    def test_get_notifier_matches_get_instance(self):
+        """Test get_notifier and get_instance share one instance."""
+        from app.utils.notification_service import (NotificationService,
+                                              get_notifier)
+        
+        NotificationService.reset_instance()
+        
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_notifier() is NotificationService.get_instance()
+        
+        NotificationService.reset_instance()
+    
+    @pytest.mark.asyncio
+    async def test_reset_instance_async_keeps_shared_session(self):
+        """Test reset_instance_async clears the singleton but leaves the shared session open."""
+        from app.utils.http_session import close_shared_session
+        from app.utils.notification_service import NotificationService
+        
+        with patch.dict(os.environ, {}, clear=True):
+            instance = NotificationService.get_instance()
+            session = await instance._get_session()
+            
+            await NotificationService.reset_instance_async()
+            
+            assert not session.closed
+            assert NotificationService.get_instance() is not instance
+        
+        await NotificationService.reset_instance_async()
+        await close_shared_session()
+    
     def test_reset_instance_clears_singleton(self):
         """Test that reset_instance clears the singleton."""
         from app.utils.notification_service import NotificationService
@@ -106,6 +136,7 @@ class TestNotificationServiceConfig:
     
     def test_loads_pushover_config_from_env(self):
         """Test that Pushover config is loaded from environment."""
+        from app.config import Settings
         from app.utils.notification_service import NotificationService
         
         NotificationService.reset_instance()
@@ -116,7 +147,8 @@ class TestNotificationServiceConfig:
             'NOTIFY_ON_FAILURE': 'true'
         }
         
-        with patch.dict(os.environ, env, clear=True):
+        with patch.dict(os.environ, env, clear=True), \
+                patch('app.utils.notification_service.get_settings', return_value=Settings.from_env()):
             instance = NotificationService.get_instance()
             
             assert instance.config.pushover_user_key == 'test-user-key'
@@ -127,11 +159,13 @@ class TestNotificationServiceConfig:
     
     def test_notify_on_failure_defaults_to_true(self):
         """Test that notify_on_failure defaults to True."""
+        from app.config import Settings
         from app.utils.notification_service import NotificationService
         
         NotificationService.reset_instance()
         
-        with patch.dict(os.environ, {}, clear=True):
+        with patch.dict(os.environ, {}, clear=True), \
+                patch('app.utils.notification_service.get_settings', return_value=Settings.from_env()):
             instance = NotificationService.get_instance()
             assert instance.config.notify_on_failure is True
         
@@ -173,13 +207,20 @@ class TestSendPushover:
             
             assert result is True
             mock_session.post.assert_called_once()
+            assert mock_session.post.call_args.kwargs['data'] == (
+                b"token=test-token&user=test-user&priority=0&title=Test+Title&message=Test+Message"
+            )
+            assert mock_session.post.call_args.kwargs['headers'] == {
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
     
     @pytest.mark.asyncio
     async def test_send_pushover_failure(self, configured_service):
         """Test Pushover notification failure handling."""
         mock_response = AsyncMock()
         mock_response.status = 400
-        mock_response.text = AsyncMock(return_value="Bad request")
+        mock_response.content = MagicMock()
+        mock_response.content.read = AsyncMock(return_value=b"Bad request")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
         
@@ -193,6 +234,7 @@ class TestSendPushover:
             )
             
             assert result is False
+            mock_response.content.read.assert_awaited_once_with(512)
     
     @pytest.mark.asyncio
     async def test_send_pushover_not_configured(self):
@@ -249,6 +291,9 @@ class TestNotifyJobFailed:
             assert "Failed" in call_args.kwargs['title']
             assert "episode.mkv" in call_args.kwargs['message']
             assert "Transcription timeout" in call_args.kwargs['message']
+            assert call_args.kwargs['message'] == (
+                "File: episode.mkv\nSource: Plex\nJob ID: abc123...\n\nError: Transcription timeout"
+            )
     
     @pytest.mark.asyncio
     async def test_notify_job_failed_disabled(self):
@@ -287,6 +332,96 @@ class TestNotifyJobFailed:
         assert result is False
 
 
+class TestFailureDigest:
+    """Test batching of failure notifications."""
+    
+    @pytest.fixture
+    def configured_service(self):
+        """Create a NotificationService with Pushover configured and a short window."""
+        from app.utils.notification_service import (NotificationConfig,
+                                              NotificationService)
+        
+        config = NotificationConfig(
+            pushover_user_key="test-user",
+            pushover_api_token="test-token",
+            notify_on_failure=True
+        )
+        service = NotificationService(config)
+        service.FAILURE_DIGEST_WINDOW = 0.01
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_single_failure_sent_as_usual(self, configured_service):
+        """Test a lone queued failure is sent as a regular failure notification."""
+        with patch.object(configured_service, 'notify_job_failed', new_callable=AsyncMock) as mock_notify:
+            assert await configured_service.queue_job_failed("/tv/a.mkv", "boom", source="Plex")
+            await configured_service._digest_task
+            
+            mock_notify.assert_awaited_once_with(
+                file_path="a.mkv", error="boom", job_id=None, source="Plex"
+            )
+    
+    @pytest.mark.asyncio
+    async def test_failures_in_window_sent_as_one_digest(self, configured_service):
+        """Test failures queued together produce one grouped, capped message."""
+        configured_service.FAILURE_DIGEST_MAX_ENTRIES = 3
+        
+        with patch.object(configured_service, 'send_pushover', new_callable=AsyncMock) as mock_send:
+            mock_send.return_value = True
+            await configured_service.queue_job_failed("/tv/a.mkv", "timeout", source="Plex")
+            await configured_service.queue_job_failed("/tv/b.mkv", "timeout", source="Plex")
+            await configured_service.queue_job_failed("/movies/c.mkv", "quota", source="UI")
+            await configured_service.queue_job_failed("/movies/d.mkv", "quota", source="UI")
+            await configured_service._digest_task
+            
+            mock_send.assert_awaited_once()
+            assert "4 Transcriptions Failed" in mock_send.call_args.kwargs['title']
+            assert mock_send.call_args.kwargs['message'] == (
+                "Plex:\n• a.mkv: timeout\n• b.mkv: timeout\n\nUI:\n• c.mkv: quota\n\n+1 more"
+            )
+    
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_failures(self, configured_service):
+        """Test closing the service sends failures that are still queued."""
+        configured_service.FAILURE_DIGEST_WINDOW = 60
+        
+        with patch.object(configured_service, 'notify_job_failed', new_callable=AsyncMock) as mock_notify:
+            await configured_service.queue_job_failed("/tv/a.mkv", "boom")
+            await configured_service.close()
+            
+            mock_notify.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_close_waits_for_digest_being_sent(self, configured_service):
+        """Test closing during a digest send lets that send finish."""
+        sending = asyncio.Event()
+        sent = []
+        
+        async def slow_notify(**kwargs):
+            sending.set()
+            await asyncio.sleep(0.01)
+            sent.append(kwargs['file_path'])
+            return True
+        
+        with patch.object(configured_service, 'notify_job_failed', side_effect=slow_notify):
+            await configured_service.queue_job_failed("/tv/a.mkv", "boom")
+            await sending.wait()
+            await configured_service.close()
+        
+        assert sent == ["a.mkv"]
+    
+    @pytest.mark.asyncio
+    async def test_not_queued_when_not_configured(self):
+        """Test nothing is queued when notifications are not configured."""
+        from app.utils.notification_service import (NotificationConfig,
+                                              NotificationService)
+        
+        service = NotificationService(NotificationConfig())
+        
+        assert await service.queue_job_failed("/tv/a.mkv", "boom") is False
+        assert service._digest_task is None
+
+
 class TestTestNotification:
     """Test the test_notification method."""
     
@@ -338,9 +473,9 @@ class TestNotifyFailureConvenience:
         
         # Mock the singleton
         mock_instance = MagicMock()
-        mock_instance.notify_job_failed = AsyncMock(return_value=True)
+        mock_instance.queue_job_failed = AsyncMock(return_value=True)
         
-        with patch.object(NotificationService, 'get_instance', return_value=mock_instance):
+        with patch('app.utils.notification_service.get_notifier', return_value=mock_instance):
             result = await notify_failure(
                 file_path="/test/file.mkv",
                 error="Test error",
@@ -349,7 +484,7 @@ class TestNotifyFailureConvenience:
             )
             
             assert result is True
-            mock_instance.notify_job_failed.assert_called_once()
+            mock_instance.queue_job_failed.assert_called_once()
         
         NotificationService.reset_instance()
     
@@ -361,7 +496,7 @@ class TestNotifyFailureConvenience:
         
         NotificationService.reset_instance()
         
-        with patch.object(NotificationService, 'get_instance', side_effect=Exception("Test error")):
+        with patch('app.utils.notification_service.get_notifier', side_effect=Exception("Test error")):
             # Should not raise, just return False
             result = await notify_failure(
                 file_path="/test/file.mkv",
@@ -0,0 +1,131 @@
+"""
+Tests for the request body decompression middleware.
+
+Tests cover:
+- gzip-encoded bodies inflated across several receive chunks
+- Uncompressed requests passed through unchanged
+- Invalid compressed bodies rejected with 400
+- Oversized decompressed bodies rejected with 413
+"""
+
+import gzip
+import zlib
+
+import pytest
+from starlette.exceptions import HTTPException
+
+from app.utils.request_decompression import (_INFLATE_CHUNK_SIZE,
+                                             RequestDecompressionMiddleware)
+
+
+def _scope(*headers):
+    return {"type": "http", "headers": list(headers)}
+
+
+def _receiver(*chunks):
+    """Build an ASGI receive callable that yields the body in the given chunks."""
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    
+    async def receive():
+        return messages.pop(0)
+    
+    return receive
+
+
+class _RecordingApp:
+    """ASGI app that reads the whole request body and records what it saw."""
+    
+    async def __call__(self, scope, receive, send):
+        self.headers = dict(scope["headers"])
+        self.body = b""
+        while True:
+            message = await receive()
+            self.body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+
+class TestRequestDecompressionMiddleware:
+    """Test RequestDecompressionMiddleware."""
+    
+    @pytest.mark.asyncio
+    async def test_gzip_body_is_inflated(self):
+        """Test a gzip body split over chunks reaches the app decompressed."""
+        audio = b"RIFF" + b"\x00" * 50000
+        compressed = gzip.compress(audio)
+        app = _RecordingApp()
+        scope = _scope(
+            (b"content-encoding", b"gzip"),
+            (b"content-length", str(len(compressed)).encode()),
+            (b"content-type", b"multipart/form-data"),
+        )
+        
+        await RequestDecompressionMiddleware(app)(
+            scope, _receiver(compressed[:10], compressed[10:]), None
+        )
+        
+        assert app.body == audio
+        assert b"content-encoding" not in app.headers
+        assert b"content-length" not in app.headers
+        assert app.headers[b"content-type"] == b"multipart/form-data"
+    
+    @pytest.mark.asyncio
+    async def test_plain_body_passes_through(self):
+        """Test requests without Content-Encoding are not touched."""
+        app = _RecordingApp()
+        scope = _scope((b"content-length", b"5"))
+        
+        await RequestDecompressionMiddleware(app)(scope, _receiver(b"hello"), None)
+        
+        assert app.body == b"hello"
+        assert app.headers[b"content-length"] == b"5"
+    
+    @pytest.mark.asyncio
+    async def test_invalid_body_is_rejected(self):
+        """Test a body that is not valid gzip raises a 400."""
+        app = _RecordingApp()
+        scope = _scope((b"content-encoding", b"gzip"))
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await RequestDecompressionMiddleware(app)(scope, _receiver(b"not gzip"), None)
+        
+        assert exc_info.value.status_code == 400
+    
+    @pytest.mark.asyncio
+    async def test_output_is_inflated_in_bounded_chunks(self):
+        """Test a highly compressible body reaches the app in bounded pieces."""
+        audio = b"\x00" * (5 * _INFLATE_CHUNK_SIZE)
+        app = _RecordingApp()
+        chunk_sizes = []
+        
+        async def recording_app(scope, receive, send):
+            async def receive_recorded():
+                message = await receive()
+                chunk_sizes.append(len(message["body"]))
+                return message
+            await app(scope, receive_recorded, send)
+        
+        scope = _scope((b"content-encoding", b"deflate"))
+        await RequestDecompressionMiddleware(recording_app)(
+            scope, _receiver(zlib.compress(audio)), None
+        )
+        
+        assert app.body == audio
+        assert max(chunk_sizes) <= _INFLATE_CHUNK_SIZE
+    
+    @pytest.mark.asyncio
+    async def test_decompression_bomb_is_rejected(self):
+        """Test a body inflating past the limit raises a 413."""
+        bomb = gzip.compress(b"\x00" * (10 * 1024 * 1024))
+        app = _RecordingApp()
+        scope = _scope((b"content-encoding", b"gzip"))
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await RequestDecompressionMiddleware(app, max_size=1024 * 1024)(
+                scope, _receiver(bomb), None
+            )
+        
+        assert exc_info.value.status_code == 413
@@ -235,6 +235,50 @@ class TestWebhookRouter:
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "no_file"
+    
+    def test_azure_webhook_challenge(self, client):
+        """Test Azure webhook registration challenge is echoed back."""
+        response = client.post("/webhook/azure?validationToken=abc123")
+        assert response.status_code == 200
+        assert response.text == "abc123"
+    
+    def test_azure_webhook_completion(self, client, mock_settings):
+        """Test Azure completion event wakes the job's waiter."""
+        payload = {"self": "https://swedencentral.api.cognitive.microsoft.com/speechtotext/v3.2/transcriptions/job-42"}
+        
+        with patch('app.routers.webhooks.get_settings', return_value=mock_settings), \
+                patch('app.routers.webhooks.resolve_transcription_callback') as mock_resolve:
+            response = client.post(
+                "/webhook/azure",
+                json=payload,
+                headers={"X-MicrosoftSpeechServices-Event": "TranscriptionCompletion"},
+            )
+        
+        assert response.status_code == 200
+        mock_resolve.assert_called_once_with("job-42")
+    
+    @pytest.mark.parametrize("payload", [[], {"self": None}])
+    def test_azure_webhook_rejects_malformed_payload(self, client, mock_settings, payload):
+        """Test a JSON body that is not an event with a 'self' link returns 400."""
+        with patch('app.routers.webhooks.get_settings', return_value=mock_settings), \
+                patch('app.routers.webhooks.resolve_transcription_callback') as mock_resolve:
+            response = client.post("/webhook/azure", json=payload)
+        
+        assert response.status_code == 400
+        mock_resolve.assert_not_called()
+    
+    def test_azure_webhook_rejects_bad_signature(self, client, mock_settings):
+        """Test Azure webhook signature is verified when a secret is configured."""
+        mock_settings.azure.webhook_secret = "s3cret"
+        
+        with patch('app.routers.webhooks.get_settings', return_value=mock_settings):
+            response = client.post(
+                "/webhook/azure",
+                json={"self": "https://example/transcriptions/job-42"},
+                headers={"X-MicrosoftSpeechServices-Signature": "bogus"},
+            )
+        
+        assert response.status_code == 401
 
 
 class TestAppStartup:
@@ -297,6 +341,140 @@ class TestASRRouterExtended:
         data = response.json()
         assert isinstance(data, list)
         assert "GET" in data[0]
+    
+    @patch('app.routers.asr.require_azure_configured')
+    @patch('app.routers.asr.TranscriptionService.transcribe_audio_data', new_callable=AsyncMock)
+    def test_asr_raw_pcm_conversion_is_bounded(self, mock_transcribe, mock_require, client):
+        """Test raw PCM requests pass the prep semaphore to the conversion step."""
+        from app.routers import asr
+        
+        mock_transcribe.return_value = (MagicMock(to_srt=MagicMock(return_value="1\n")), MagicMock())
+        response = client.post(
+            "/asr?encode=false",
+            files={"audio_file": ("audio.pcm", b"\x00" * 32, "application/octet-stream")},
+        )
+        assert response.status_code == 200
+        assert mock_transcribe.call_args.kwargs["prep_semaphore"] is asr._get_prep_semaphore()
+    
+    @patch('app.routers.asr.get_transcriber')
+    def test_detect_language_uses_language_hint(self, mock_get_transcriber, client):
+        """Test a language query parameter is returned without calling Azure."""
+        response = client.post(
+            "/detect-language?language=nl",
+            files={"audio_file": ("audio.pcm", b"\x00" * 32, "application/octet-stream")},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"detected_language": "Dutch", "language_code": "nl"}
+        mock_get_transcriber.assert_not_called()
+    
+    @patch('app.routers.asr.get_transcriber')
+    def test_detect_language_uses_accept_language(self, mock_get_transcriber, client):
+        """Test the Accept-Language header is used when no language is given."""
+        response = client.post(
+            "/detect-language",
+            files={"audio_file": ("audio.pcm", b"\x00" * 32, "application/octet-stream")},
+            headers={"Accept-Language": "fr-BE,fr;q=0.9,en;q=0.8"},
+        )
+        assert response.status_code == 200
+        assert response.json()["language_code"] == "fr"
+        mock_get_transcriber.assert_not_called()
+
+
+class TestDetectLanguageBatching:
+    """Test /detect-language Azure job batching and cleanup."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_detections_share_one_job(self, mock_settings):
+        """Test segments queued within the window are sent as one job's contentUrls."""
+        import asyncio
+
+        from app.routers import asr
+        
+        transcriber = MagicMock()
+        transcriber.create_transcription = AsyncMock(return_value=MagicMock(id="job-1", locale="en-US"))
+        transcriber.wait_for_completion = AsyncMock()
+        transcriber.get_transcription_results = AsyncMock(return_value={
+            "https://acct/c/audio/a.wav": MagicMock(language="nl-NL"),
+            "https://acct/c/audio/b.wav": MagicMock(language="fr-FR"),
+        })
+        transcriber.delete_transcription = AsyncMock()
+        
+        with patch('app.routers.asr.get_settings', return_value=mock_settings), \
+             patch('app.routers.asr.get_transcriber', return_value=transcriber), \
+             patch.object(asr, 'DETECT_BATCH_WINDOW', 0.01):
+            first, second = await asyncio.gather(
+                asr._detect_in_batch("https://acct/c/audio/a.wav?sas", "audio/a.wav"),
+                asr._detect_in_batch("https://acct/c/audio/b.wav?sas", "audio/b.wav"),
+            )
+        
+        assert (first.language, second.language) == ("nl-NL", "fr-FR")
+        transcriber.create_transcription.assert_awaited_once()
+        assert transcriber.create_transcription.call_args.kwargs['audio_url'] == [
+            "https://acct/c/audio/a.wav?sas", "https://acct/c/audio/b.wav?sas"
+        ]
+        transcriber.delete_transcription.assert_awaited_once_with("job-1")
+    
+    @pytest.mark.asyncio
+    async def test_blob_cleanup_runs_after_response(self, mock_settings):
+        """Test the segment blob is deleted by a background task, not before returning."""
+        import io
+
+        from fastapi import BackgroundTasks
+        from starlette.datastructures import UploadFile
+
+        from app.routers import asr
+        
+        transcriber = MagicMock()
+        transcriber.upload_audio_stream = AsyncMock(return_value=("https://acct/c/audio/a.wav?sas", "audio/a.wav"))
+        transcriber.delete_blob = AsyncMock()
+        background_tasks = BackgroundTasks()
+        upload = UploadFile(io.BytesIO(b"\x00" * 64000), size=64000, filename="audio.pcm")
+        
+        with patch('app.routers.asr.get_settings', return_value=mock_settings), \
+             patch('app.routers.asr.require_azure_configured'), \
+             patch('app.routers.asr.get_transcriber', return_value=transcriber), \
+             patch('app.routers.asr._detect_in_batch', AsyncMock(return_value=MagicMock(language="nl-NL"))):
+            result = await asr.detect_language(
+                background_tasks, upload, encode=False, video_file=None,
+                detect_lang_length=1, detect_lang_offset=0, language=None, accept_language=None,
+            )
+        
+        assert result["language_code"] == "nl"
+        transcriber.delete_blob.assert_not_awaited()
+        await background_tasks()
+        transcriber.delete_blob.assert_awaited_once_with("audio/a.wav")
+
+
+class TestWavSegment:
+    """Test slicing detect-language segments out of 16 kHz mono WAV uploads."""
+    
+    def _write_wav(self, path, sample_rate, seconds):
+        import wave
+        with wave.open(str(path), 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(b"\x01\x00" * sample_rate * seconds)
+    
+    def test_matching_wav_is_sliced(self, tmp_path):
+        """Test a 16 kHz mono WAV is read directly without ffmpeg."""
+        from app.routers.asr import _read_wav_segment
+        
+        path = tmp_path / "audio.wav"
+        self._write_wav(path, 16000, 3)
+        assert len(_read_wav_segment(str(path), offset=1, duration=1)) == 16000 * 2
+    
+    def test_other_format_falls_back(self, tmp_path):
+        """Test other sample rates and non-WAV input return None."""
+        from app.routers.asr import _read_wav_segment
+        
+        path = tmp_path / "audio.wav"
+        self._write_wav(path, 44100, 1)
+        assert _read_wav_segment(str(path), offset=0, duration=1) is None
+        
+        mp3 = tmp_path / "audio.mp3"
+        mp3.write_bytes(b"ID3" + b"\x00" * 100)
+        assert _read_wav_segment(str(mp3), offset=0, duration=1) is None
 
 
 class TestBatchRouterExtended:
@@ -345,6 +523,32 @@ class TestBatchRouterExtended:
         assert response.status_code in [404, 405]
 
 
+class TestSessionStatusCache:
+    """Test /api/batch/session/{id} reuses its serialized response."""
+    
+    @pytest.mark.asyncio
+    async def test_status_is_cached_until_version_changes(self):
+        """Test polls share one snapshot until a job changes state."""
+        from app.routers import batch
+        from app.transcription_service import (JobSource, JobStatus,
+                                               TranscriptionService)
+        
+        session = await TranscriptionService.create_session(source=JobSource.UI)
+        job = await TranscriptionService.add_job(
+            session_id=session.id, file_path="/test.mkv", language="en", source=JobSource.UI
+        )
+        
+        first = await batch.get_session_status(session.id)
+        assert (await batch.get_session_status(session.id)).body is first.body
+        
+        await TranscriptionService.update_job_status(session.id, job.id, JobStatus.UPLOADING)
+        updated = await batch.get_session_status(session.id)
+        assert b'"in_progress":1' in updated.body
+        
+        await batch.delete_session(session.id)
+        assert session.id not in batch._status_cache
+
+
 class TestWebhookRouterExtended:
     """Extended tests for webhook router."""
     
@@ -321,6 +321,50 @@ class TestTranscriptionServiceJobs:
         assert job.status == JobStatus.TRANSCRIBING
         assert job.started_at is not None
     
+    @pytest.mark.asyncio
+    async def test_session_version_tracks_job_changes(self):
+        """Test adding a job or changing its status bumps the session version."""
+        from app.transcription_service import (JobSource, JobStatus,
+                                               TranscriptionService)
+        
+        session = await TranscriptionService.create_session(source=JobSource.UI)
+        assert session.version == 0
+        
+        job = await TranscriptionService.add_job(
+            session_id=session.id,
+            file_path="/test.mkv",
+            language="en",
+            source=JobSource.UI
+        )
+        assert session.version == 1
+        
+        await TranscriptionService.update_job_status(session.id, job.id, JobStatus.UPLOADING)
+        assert session.version == 2
+    
+    @pytest.mark.asyncio
+    async def test_add_job_records_media_kind(self):
+        """Test jobs keep the video/audio classification given on submit."""
+        from app.transcription_service import (JobSource,
+                                               TranscriptionService)
+        
+        session = await TranscriptionService.create_session(source=JobSource.UI)
+        video = await TranscriptionService.add_job(
+            session_id=session.id,
+            file_path="/test.mkv",
+            language="en",
+            source=JobSource.UI
+        )
+        audio = await TranscriptionService.add_job(
+            session_id=session.id,
+            file_path="/test.mp3",
+            language="en",
+            source=JobSource.UI,
+            is_video=False
+        )
+        
+        assert video.is_video is True
+        assert audio.is_video is False
+    
     @pytest.mark.asyncio
     async def test_update_job_status_completed(self):
         """Test updating job to completed status."""
@@ -425,6 +469,42 @@ class TestTranscriptionServiceHelpers:
         locale = TranscriptionService._get_azure_locale("fr")
         assert locale == "fr-FR"
 
+    @pytest.mark.asyncio
+    async def test_convert_to_ogg_reads_raw_pcm_directly(self):
+        """Test raw PCM input is described to ffmpeg instead of wrapped in WAV."""
+        from app.transcription_service import TranscriptionService
+
+        process = MagicMock(returncode=0)
+        process.communicate = AsyncMock(return_value=(b"", b""))
+
+        with patch('asyncio.create_subprocess_exec', AsyncMock(return_value=process)) as mock_exec:
+            await TranscriptionService._convert_to_ogg("in.pcm", "out.ogg", is_raw_pcm=True)
+
+        args = mock_exec.call_args.args
+        assert args[:9] == ('ffmpeg', '-y', '-f', 's16le', '-ar', '16000', '-ac', '1', '-i')
+        assert args[9] == "in.pcm"
+
+    @pytest.mark.asyncio
+    async def test_convert_stream_to_ogg_feeds_stdin(self, tmp_path):
+        """Test streamed chunks are piped to the encoder's stdin as they arrive."""
+        import sys
+
+        from app.transcription_service import TranscriptionService
+
+        output = tmp_path / "out.ogg"
+        # Stand-in encoder that copies stdin to the output file
+        copy_stdin = [sys.executable, '-c', f"import shutil,sys; shutil.copyfileobj(sys.stdin.buffer, open({str(output)!r}, 'wb'))"]
+
+        async def chunks():
+            for chunk in (b"ab", b"cd", b"e"):
+                yield chunk
+
+        with patch.object(TranscriptionService, '_ogg_command', return_value=copy_stdin):
+            size = await TranscriptionService._convert_stream_to_ogg(chunks(), str(output), is_raw_pcm=True)
+
+        assert size == 5
+        assert output.read_bytes() == b"abcde"
+
 
 class TestTranscriptionServiceConcurrency:
     """Test global transcription concurrency control with priority queue."""